@@ -0,0 +1,245 @@
+import itertools
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from api.metrics import AuditMetrics
+
+
+class AdmissionRejected(Exception):
+    """
+    Requête refusée par le contrôle d'admission (réponse 429)
+    """
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = max(1, int(math.ceil(retry_after)))
+
+
+class AdmissionCancelled(Exception):
+    """
+    Attente d'admission abandonnée par l'appelant (voir AdmissionController.cancel)
+    """
+
+
+class _Ticket:
+    def __init__(self, user_id, cpu_cost, memory_cost, predicted_duration, sequence, cancel=None):
+        self.user_id = user_id
+        self.cpu_cost = cpu_cost
+        self.memory_cost = memory_cost
+        self.predicted_duration = predicted_duration
+        self.sequence = sequence
+        self.cancel = cancel
+        self.admitted = False
+        self.started_at = None
+
+
+class AdmissionController:
+    """
+    Contrôle d'admission des exécutions de tests selon leur coût prévu.
+
+    Chaque requête réserve son coût CPU (secondes-CPU prévues par le modèle de coût) et
+    sa mémoire estimée pendant son exécution. Lorsqu'un budget global ou un budget de
+    l'utilisateur serait dépassé, la requête attend dans une file; les requêtes en attente
+    sont servies par ordre d'équité (l'utilisateur ayant le moins consommé récemment d'abord).
+    Au-delà du délai d'attente, ou si la file est pleine, la requête est refusée (429).
+
+    L'état est propre au processus serveur : avec plusieurs processus, les budgets
+    s'appliquent à chacun d'eux.
+    """
+
+    # Mémoire occupée par bit de séquence dans chaque processus (liste Python + copie sérialisée)
+    MEMORY_PER_BIT = 10
+    # Mémoire occupée par bit d'un fichier compact décodé dans un processus (voir PackedSequence.view)
+    DECODED_MEMORY_PER_BIT = 1
+    # Demi-vie de la consommation récente utilisée pour l'ordre d'équité (secondes)
+    USAGE_HALF_LIFE = 300.0
+
+    _condition = threading.Condition()
+    _waiting = []
+    _running = []
+    _usage = {}
+    _sequence = itertools.count()
+
+    @staticmethod
+    def memory_cost(sequence_length, workers, packed=False):
+        """
+        Mémoire estimée d'une exécution (octets) : séquence dans la requête et dans chaque processus
+
+        Args:
+            packed (bool): Séquence lue depuis un fichier compact ('bit_path', 'blob_id') : la requête ne
+                garde que la projection du fichier, chaque tâche en cours le décode (1 octet par bit)
+        """
+        if packed:
+            return sequence_length * AdmissionController.DECODED_MEMORY_PER_BIT * max(1, workers)
+        return sequence_length * AdmissionController.MEMORY_PER_BIT * (1 + max(1, workers))
+
+    @classmethod
+    @contextmanager
+    def admit(cls, user_id, cpu_cost, memory_cost, predicted_duration=0.0, timeout=None):
+        """
+        Réserve les ressources d'une exécution pour la durée du bloc `with`
+
+        Args:
+            user_id: Identifiant de l'utilisateur (ou du jeton)
+            cpu_cost (float): Coût CPU prévu en secondes
+            memory_cost (int): Mémoire estimée en octets
+            predicted_duration (float): Durée prévue, utilisée pour calculer Retry-After
+            timeout (float, optional): Attente maximale dans la file (défaut: AUDIT_ADMISSION_QUEUE_TIMEOUT)
+
+        Raises:
+            AdmissionRejected: Si la requête ne peut pas être admise à temps
+        """
+        ticket = cls.acquire(user_id, cpu_cost, memory_cost, predicted_duration, timeout)
+        try:
+            yield ticket
+        finally:
+            cls.release(ticket)
+
+    @classmethod
+    def acquire(cls, user_id, cpu_cost, memory_cost, predicted_duration=0.0, timeout=None, cancel=None):
+        """
+        Attend l'admission d'une exécution (voir admit)
+
+        Args:
+            cancel (threading.Event, optional): Signal d'abandon de l'attente, déclenché par cancel()
+                depuis un autre thread (appelant asynchrone annulé pendant l'attente)
+
+        Returns:
+            _Ticket: Réservation à rendre avec release()
+
+        Raises:
+            AdmissionRejected: Si la requête ne peut pas être admise à temps
+            AdmissionCancelled: Si l'attente est abandonnée
+        """
+        if timeout is None:
+            timeout = settings.AUDIT_ADMISSION_QUEUE_TIMEOUT
+
+        with cls._condition:
+            if cancel is not None and cancel.is_set():
+                raise AdmissionCancelled()
+            if len(cls._waiting) >= settings.AUDIT_ADMISSION_MAX_QUEUE:
+                AuditMetrics.inc("audit_runs_total", outcome="rejected")
+                raise AdmissionRejected("Le serveur d'audit est saturé, réessayez plus tard.",
+                                        cls._retry_after())
+
+            ticket = _Ticket(user_id, cpu_cost, memory_cost, predicted_duration, next(cls._sequence), cancel)
+            cls._waiting.append(ticket)
+            cls._dispatch()
+
+            deadline = time.monotonic() + timeout
+            while not ticket.admitted:
+                if cancel is not None and cancel.is_set():
+                    # Le ticket a déjà été retiré de la file par cancel()
+                    raise AdmissionCancelled()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    cls._waiting.remove(ticket)
+                    # Le départ de cette requête peut débloquer celles qui attendaient derrière elle
+                    cls._dispatch()
+                    AuditMetrics.inc("audit_runs_total", outcome="rejected")
+                    raise AdmissionRejected(
+                        "Budget d'exécution dépassé : trop de tests en cours pour ce compte ou sur le serveur.",
+                        cls._retry_after())
+                cls._condition.wait(remaining)
+
+            return ticket
+
+    @classmethod
+    def release(cls, ticket):
+        """Rend les ressources réservées par une exécution terminée"""
+        with cls._condition:
+            if ticket in cls._running:
+                cls._running.remove(ticket)
+                cls._dispatch()
+
+    @classmethod
+    def cancel(cls, cancel):
+        """
+        Abandonne l'attente d'admission associée au signal `cancel` (voir acquire)
+
+        Le ticket est retiré de la file, ou rendu s'il a été admis entre-temps : le thread qui
+        attendait peut ne jamais voir son résultat lu (coroutine annulée), la réservation ne
+        dépend donc pas de lui.
+        """
+        with cls._condition:
+            cancel.set()
+            for tickets in (cls._waiting, cls._running):
+                for ticket in [t for t in tickets if t.cancel is cancel]:
+                    tickets.remove(ticket)
+            cls._dispatch()
+            cls._condition.notify_all()
+
+    @classmethod
+    def snapshot(cls):
+        """État courant du contrôle d'admission"""
+        with cls._condition:
+            return {
+                "running": len(cls._running),
+                "waiting": len(cls._waiting),
+                "cpu_in_use": sum(t.cpu_cost for t in cls._running),
+                "memory_in_use": sum(t.memory_cost for t in cls._running),
+            }
+
+    @classmethod
+    def _dispatch(cls):
+        """
+        Admet les requêtes en attente qui tiennent dans les budgets, par ordre d'équité.
+
+        Une requête bloquée par un budget global arrête l'admission des suivantes, afin que les
+        grosses requêtes ne soient pas indéfiniment doublées par de petites. Une requête bloquée
+        seulement par les limites de son utilisateur ne bloque pas les autres utilisateurs.
+        Appelée avec le verrou détenu.
+        """
+        admitted = False
+        for ticket in sorted(cls._waiting, key=lambda t: (cls._recent_usage(t.user_id), t.sequence)):
+            if not cls._fits_user(ticket):
+                continue
+            if not cls._fits_global(ticket):
+                break
+
+            cls._waiting.remove(ticket)
+            cls._running.append(ticket)
+            ticket.admitted = True
+            ticket.started_at = time.monotonic()
+            cls._add_usage(ticket.user_id, ticket.cpu_cost)
+            admitted = True
+
+        if admitted:
+            cls._condition.notify_all()
+
+    @classmethod
+    def _fits_global(cls, ticket):
+        # Une requête plus grosse que le budget passe seule, lorsque le serveur est inactif
+        cpu = sum(t.cpu_cost for t in cls._running)
+        memory = sum(t.memory_cost for t in cls._running)
+        return not cls._running or (cpu + ticket.cpu_cost <= settings.AUDIT_ADMISSION_CPU_BUDGET
+                                    and memory + ticket.memory_cost <= settings.AUDIT_ADMISSION_MEMORY_BUDGET)
+
+    @classmethod
+    def _fits_user(cls, ticket):
+        own = [t for t in cls._running if t.user_id == ticket.user_id]
+        if len(own) >= settings.AUDIT_USER_MAX_ACTIVE:
+            return False
+        return not own or sum(t.cpu_cost for t in own) + ticket.cpu_cost <= settings.AUDIT_USER_CPU_BUDGET
+
+    @classmethod
+    def _recent_usage(cls, user_id):
+        """Consommation CPU récente de l'utilisateur, avec décroissance exponentielle"""
+        value, updated_at = cls._usage.get(user_id, (0.0, 0.0))
+        elapsed = time.monotonic() - updated_at
+        return value * 0.5 ** (elapsed / cls.USAGE_HALF_LIFE)
+
+    @classmethod
+    def _add_usage(cls, user_id, cpu_cost):
+        cls._usage[user_id] = (cls._recent_usage(user_id) + cpu_cost, time.monotonic())
+
+    @classmethod
+    def _retry_after(cls):
+        """Délai avant la fin prévue de la prochaine exécution en cours (secondes)"""
+        now = time.monotonic()
+        remaining = [t.started_at + t.predicted_duration - now for t in cls._running]
+        return min(remaining, default=1.0)
@@ -0,0 +1,23 @@
+from django.conf import settings
+from rest_framework.authentication import TokenAuthentication
+
+from api.cache import VersionedCache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Authentification par jeton dont les jetons valides sont conservés en mémoire.
+
+    TokenAuthentication lit le jeton et son utilisateur (jointure) à chaque requête; ici, un
+    jeton déjà vu est servi par VersionedCache pendant au plus AUDIT_TOKEN_CACHE_TTL secondes.
+    Les jetons refusés ne sont pas conservés. Toute suppression ou création de jeton (rotation)
+    et toute écriture d'un utilisateur (désactivation, changement de mot de passe) invalident
+    les entrées (voir api/signals.py).
+    """
+
+    NAMESPACE = 'tokens'
+
+    def authenticate_credentials(self, key):
+        resolve = super().authenticate_credentials
+        return VersionedCache.get_or_set(CachedTokenAuthentication.NAMESPACE, key, lambda: resolve(key),
+                                         ttl=settings.AUDIT_TOKEN_CACHE_TTL)
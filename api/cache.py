@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class VersionedCache:
+    """
+    Cache en mémoire du processus serveur, invalidé par numéro de version.
+
+    Chaque espace de noms ('suite_plans', ...) porte un numéro de version incrémenté par les
+    signaux d'écriture des modèles dont il dépend (voir api/signals.py) : les entrées d'une
+    version antérieure ne sont plus lues. Les signaux ne sont reçus que par le processus qui
+    écrit; avec plusieurs processus serveur, la durée de vie des entrées (AUDIT_CACHE_TTL)
+    borne le délai pendant lequel les autres processus servent une valeur périmée.
+    """
+
+    _lock = threading.Lock()
+    _versions = {}
+    _entries = OrderedDict()
+    _stats = {}
+    _invalidated_at = {}
+
+    @classmethod
+    def version(cls, namespace):
+        with cls._lock:
+            return cls._versions.get(namespace, 0)
+
+    @classmethod
+    def invalidated_at(cls, namespace):
+        """Date (timestamp) de la dernière invalidation reçue par ce processus, None si aucune"""
+        with cls._lock:
+            return cls._invalidated_at.get(namespace)
+
+    @classmethod
+    def get_or_set(cls, namespace, key, compute, ttl=None):
+        """
+        Valeur en cache pour (namespace, key), calculée par compute() en cas d'absence
+
+        Le calcul est fait hors du verrou; une écriture concurrente pendant le calcul
+        incrémente la version et la valeur calculée n'est alors pas conservée. Une exception
+        levée par compute() est propagée et rien n'est conservé.
+
+        Args:
+            ttl (float, optional): Durée de vie de l'entrée en secondes (défaut: AUDIT_CACHE_TTL)
+        """
+        now = time.monotonic()
+        with cls._lock:
+            version = cls._versions.get(namespace, 0)
+            stats = cls._stats.setdefault(namespace, {"hits": 0, "misses": 0})
+            entry = cls._entries.get((namespace, key))
+            if entry is not None and entry[0] == version and entry[1] > now:
+                cls._entries.move_to_end((namespace, key))
+                stats["hits"] += 1
+                return entry[2]
+            stats["misses"] += 1
+
+        value = compute()
+        with cls._lock:
+            if cls._versions.get(namespace, 0) == version:
+                expires = now + (settings.AUDIT_CACHE_TTL if ttl is None else ttl)
+                cls._entries[(namespace, key)] = (version, expires, value)
+                cls._entries.move_to_end((namespace, key))
+                while len(cls._entries) > settings.AUDIT_CACHE_MAX_ENTRIES:
+                    cls._entries.popitem(last=False)
+        return value
+
+    @classmethod
+    def invalidate(cls, *namespaces):
+        """Rend obsolètes toutes les entrées des espaces de noms donnés"""
+        with cls._lock:
+            for namespace in namespaces:
+                cls._versions[namespace] = cls._versions.get(namespace, 0) + 1
+                cls._invalidated_at[namespace] = time.time()
+            for entry_key in [entry_key for entry_key in cls._entries if entry_key[0] in namespaces]:
+                del cls._entries[entry_key]
+
+    @classmethod
+    def snapshot(cls):
+        """Taille et taux de succès par espace de noms"""
+        with cls._lock:
+            sizes = {}
+            for namespace, _ in cls._entries:
+                sizes[namespace] = sizes.get(namespace, 0) + 1
+            return {
+                namespace: {
+                    **stats,
+                    "size": sizes.get(namespace, 0),
+                    "version": cls._versions.get(namespace, 0),
+                    "hit_ratio": stats["hits"] / (stats["hits"] + stats["misses"]) if stats["hits"] + stats["misses"] else None,
+                }
+                for namespace, stats in cls._stats.items()
+            }
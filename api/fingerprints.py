@@ -0,0 +1,161 @@
+import math
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+
+from api.models import SequenceFingerprint, SequenceUpload
+from api.uploads import ChunkedUploadWriter
+from testsuite.attack.repetition import RepetitionAttack
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+class FingerprintIndex:
+    """
+    Index persistant des ancres des séquences téléversées, pour détecter la réutilisation d'une graine.
+
+    Chaque séquence finalisée est résumée par un nombre fixe d'ancres par Mo : la fenêtre de
+    64 bits de plus petite empreinte de chaque bloc (même sélection que le test `repetition`).
+    Deux séquences qui partagent un long segment retiennent en grande partie les mêmes ancres :
+    une nouvelle séquence est comparée à l'index par des recherches sur la valeur des ancres
+    (index de la base, coût indépendant du nombre de séquences stockées), puis chaque segment
+    commun candidat est mesuré exactement en comparant les deux fichiers.
+    """
+
+    # Valeurs recherchées par requête (limite de variables de SQLite)
+    QUERY_BATCH = 500
+    INSERT_BATCH = 2000
+    # Nombre maximum de segments candidats mesurés, puis signalés
+    MAX_CHECKED_SEGMENTS = 32
+    MAX_REPORTED_SEGMENTS = 20
+    # Octets comparés à la fois lors de la mesure d'un segment commun
+    CHUNK_BYTES = 1 << 20
+
+    @staticmethod
+    def spacing():
+        """Espacement des ancres (bits, puissance de 2) correspondant à AUDIT_FINGERPRINT_ANCHORS_PER_MB"""
+        bits_per_anchor = 8 * 1024 * 1024 / settings.AUDIT_FINGERPRINT_ANCHORS_PER_MB
+        return max(RepetitionAttack.MIN_SPACING, 1 << round(math.log2(bits_per_anchor)))
+
+    @staticmethod
+    def sequence(upload):
+        return PackedSequence(ChunkedUploadWriter.storage_path(upload.id), upload.bit_length)
+
+    @staticmethod
+    def anchors(upload):
+        """
+        Ancres d'une séquence finalisée
+
+        Les fenêtres présentes plusieurs fois dans la séquence (plages constantes, motifs
+        répétés) ne distinguent pas les séquences entre elles et ne sont pas conservées.
+
+        Returns:
+            tuple: (positions (bits), valeurs des fenêtres en entiers signés de 64 bits)
+        """
+        if upload.bit_length < RepetitionAttack.WINDOW_BITS:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        sequence = FingerprintIndex.sequence(upload)
+        positions, values = RepetitionAttack.anchors(sequence.packed(), len(sequence), FingerprintIndex.spacing())
+        _, first, counts = np.unique(values, return_index=True, return_counts=True)
+        unique = np.sort(first[counts == 1])
+        return positions[unique], values[unique].view(np.int64)
+
+    @staticmethod
+    def candidates(upload, positions, values):
+        """
+        Ancres des séquences précédentes du même propriétaire ayant la même valeur
+
+        Returns:
+            list[tuple]: (id de la séquence précédente, décalage entre les deux séquences,
+                nombre d'ancres concordantes, position d'une ancre commune), par nombre d'ancres décroissant
+        """
+        position_of = dict(zip(values.tolist(), positions.tolist()))
+        groups = Counter()
+        anchor_of = {}
+        for first in range(0, len(values), FingerprintIndex.QUERY_BATCH):
+            batch = values[first:first + FingerprintIndex.QUERY_BATCH].tolist()
+            matches = SequenceFingerprint.objects.filter(
+                value__in=batch, upload__owner=upload.owner, upload__status='complete'
+            ).exclude(upload=upload).values_list('upload_id', 'value', 'position')
+            for prior_id, value, prior_position in matches:
+                # Un segment commun conserve le même décalage entre les positions des deux séquences
+                key = (prior_id, position_of[value] - prior_position)
+                groups[key] += 1
+                anchor_of.setdefault(key, position_of[value])
+        return [(prior_id, delta, count, anchor_of[(prior_id, delta)])
+                for (prior_id, delta), count in groups.most_common(FingerprintIndex.MAX_CHECKED_SEGMENTS)]
+
+    @staticmethod
+    def common_length(first, first_start, second, second_start, length, backward=False):
+        """
+        Nombre de bits identiques des deux séquences à partir des positions données
+        (ou juste avant elles si `backward`), au plus `length`
+        """
+        covered = 0
+        while covered < length:
+            bits = min(8 * FingerprintIndex.CHUNK_BYTES, length - covered)
+            count = (bits + 7) // 8
+            offset = -covered - bits if backward else covered
+            diff = RepetitionAttack.shifted_bytes(first, 0, count, first_start + offset) ^ \
+                RepetitionAttack.shifted_bytes(second, 0, count, second_start + offset)
+            if bits % 8:
+                diff[-1] &= np.uint8((0xFF << (8 - bits % 8)) & 0xFF)
+            nonzero = np.flatnonzero(diff)
+            if len(nonzero):
+                if backward:
+                    last = 8 * nonzero[-1] + 7 - RepetitionAttack.TRAILING_ZEROS[diff[nonzero[-1]]]
+                    return covered + bits - 1 - int(last)
+                return covered + 8 * int(nonzero[0]) + int(RepetitionAttack.LEADING_ZEROS[diff[nonzero[0]]])
+            covered += bits
+        return length
+
+    @staticmethod
+    def shared_segment(upload, prior, position, delta):
+        """
+        Segment commun maximal contenant l'ancre commune `position` (séquence courante)
+
+        Returns:
+            tuple: (début dans la séquence courante, début dans la séquence précédente, longueur en bits)
+        """
+        current, previous = FingerprintIndex.sequence(upload), FingerprintIndex.sequence(prior)
+        current_packed, previous_packed = current.packed(), previous.packed()
+        prior_position = position - delta
+        before = FingerprintIndex.common_length(current_packed, position, previous_packed, prior_position,
+                                                min(position, prior_position), backward=True)
+        after = FingerprintIndex.common_length(current_packed, position, previous_packed, prior_position,
+                                               min(len(current) - position, len(previous) - prior_position))
+        return position - before, prior_position - before, before + after
+
+    @staticmethod
+    def index(upload):
+        """
+        Recherche les séquences précédentes partageant de longs segments avec une séquence
+        finalisée, puis ajoute ses ancres à l'index.
+
+        Args:
+            upload (SequenceUpload): Téléversement finalisé
+
+        Returns:
+            list[dict]: Segments communs d'au moins AUDIT_SEED_REUSE_MIN_BITS bits, du plus long au plus court
+        """
+        positions, values = FingerprintIndex.anchors(upload)
+        candidates = FingerprintIndex.candidates(upload, positions, values)
+        priors = SequenceUpload.objects.in_bulk({prior_id for prior_id, *_ in candidates})
+
+        segments = []
+        for prior_id, delta, count, position in candidates:
+            start, prior_start, length = FingerprintIndex.shared_segment(upload, priors[prior_id], position, delta)
+            if length >= settings.AUDIT_SEED_REUSE_MIN_BITS:
+                segments.append({"upload": str(prior_id), "offset": start, "prior_offset": prior_start,
+                                 "length": length, "anchors": count})
+
+        with transaction.atomic():
+            SequenceFingerprint.objects.filter(upload=upload).delete()
+            SequenceFingerprint.objects.bulk_create(
+                (SequenceFingerprint(upload=upload, value=value, position=position)
+                 for position, value in zip(positions.tolist(), values.tolist())),
+                batch_size=FingerprintIndex.INSERT_BATCH)
+
+        segments.sort(key=lambda segment: -segment["length"])
+        return segments[:FingerprintIndex.MAX_REPORTED_SEGMENTS]
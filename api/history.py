@@ -0,0 +1,151 @@
+import hashlib
+import logging
+import math
+import numbers
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from api.models import AuditRun, AuditTestResult
+from testsuite.config import expand_test_list
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+class AuditHistory:
+    """
+    Historique des exécutions complètes de /run-tests et /run-tests/batch.
+
+    Chaque exécution est enregistrée avec ses résultats par test en une transaction
+    (deux bulk_create, quel que soit le nombre de séquences et de tests). Les agrégats
+    par test et par période sont calculés par une seule requête SQL sur les index.
+    """
+
+    INSERT_BATCH = 2000
+    # Statuts pris en compte dans le taux de réussite (les erreurs et tests annulés sont exclus)
+    EVALUATED_STATUSES = ('success', 'failed', 'attack_success')
+    FAILED_STATUSES = ('failed', 'attack_success')
+    PERIODS = {'day': TruncDay, 'week': TruncWeek, 'month': TruncMonth}
+
+    @staticmethod
+    def sequence_hash(bit_sequence):
+        """
+        Empreinte SHA-256 de la forme compacte de la séquence (identique à celle d'un téléversement)
+
+        Args:
+            bit_sequence (list, PackedSequence or bytes): Séquence, ou octets déjà compacts
+        """
+        if isinstance(bit_sequence, (bytes, bytearray)):
+            packed = bit_sequence
+        elif isinstance(bit_sequence, PackedSequence):
+            packed = bit_sequence.packed()
+        else:
+            packed = np.packbits(np.asarray(bit_sequence, dtype=np.uint8))
+        return hashlib.sha256(packed).hexdigest()
+
+    @staticmethod
+    def test_keys(test_list):
+        """Nom de registre de chaque exécution, dans l'ordre des résultats"""
+        return [test_name for test_name, param_sets in expand_test_list(test_list) for _ in param_sets]
+
+    @staticmethod
+    def _p_values(result):
+        """(plus petite p-value, toutes les p-values si le test en produit plusieurs)"""
+        p_value = result.get("p_value")
+        if p_value is None or isinstance(p_value, numbers.Real):
+            return (None if p_value is None or math.isnan(p_value) else float(p_value)), None
+        values = [float(value) for value in p_value if value is not None and not math.isnan(value)]
+        return (min(values) if values else None), values
+
+    @staticmethod
+    def _test_result(run, test_key, result):
+        """Ligne de résultat d'un test d'une exécution enregistrée"""
+        p_value, p_values = AuditHistory._p_values(result)
+        return AuditTestResult(run=run, owner_id=run.owner_id, created_at=run.created_at, test_key=test_key,
+                               parameters=result.get("parameters") or {},
+                               status=result.get("test_status") or 'error',
+                               p_value=p_value, p_values=p_values,
+                               compute_time=result.get("compute_time"))
+
+    @staticmethod
+    def record(user, test_list, executions):
+        """
+        Enregistre des exécutions complètes
+
+        Args:
+            user: Propriétaire des exécutions
+            test_list: Liste des tests exécutés (voir expand_test_list)
+            executions (list[tuple]): (empreinte SHA-256, longueur en bits, résultats des tests, test d'arrêt)
+
+        Returns:
+            list[int]: Identifiants des exécutions enregistrées, dans l'ordre de `executions`
+                (None pour toutes si l'enregistrement a échoué : l'audit n'est pas interrompu)
+        """
+        keys = AuditHistory.test_keys(test_list)
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                runs = AuditRun.objects.bulk_create([
+                    AuditRun(owner=user, created_at=now, sequence_sha256=sha256, sequence_length=length,
+                             test_count=len(results),
+                             failed_count=sum(r.get("test_status") in AuditHistory.FAILED_STATUSES for r in results),
+                             compute_time=sum(r.get("compute_time") or 0.0 for r in results),
+                             stopped_by=stopped_by or '')
+                    for sha256, length, results, stopped_by in executions
+                ], batch_size=AuditHistory.INSERT_BATCH)
+                AuditTestResult.objects.bulk_create(
+                    (AuditHistory._test_result(run, key, result)
+                     for run, (_, _, results, _) in zip(runs, executions)
+                     for key, result in zip(keys, results)),
+                    batch_size=AuditHistory.INSERT_BATCH)
+        except Exception as e:
+            logging.error(f"Audit history write failed: {e}")
+            return [None] * len(executions)
+        return [run.pk for run in runs]
+
+    @staticmethod
+    def pass_rates(user, period='day', test_keys=None, since=None, until=None):
+        """
+        Taux de réussite et p-value moyenne par test et par période, en une requête SQL
+
+        Args:
+            period (str): 'day', 'week' ou 'month'
+            test_keys (list[str] or None): Tests retenus (None = tous)
+            since, until (datetime or None): Bornes de la date d'exécution
+
+        Returns:
+            list[dict]: Une ligne par (test, période), par test puis période croissante
+        """
+        if period not in AuditHistory.PERIODS:
+            raise ValueError(f"La période doit être l'une de: {', '.join(AuditHistory.PERIODS)}.")
+
+        results = AuditTestResult.objects.filter(owner=user)
+        if test_keys:
+            results = results.filter(test_key__in=test_keys)
+        if since is not None:
+            results = results.filter(created_at__gte=since)
+        if until is not None:
+            results = results.filter(created_at__lt=until)
+
+        rows = (results
+                .annotate(period=AuditHistory.PERIODS[period]('created_at'))
+                .values('test_key', 'period')
+                .annotate(runs=Count('id'),
+                          evaluated=Count('id', filter=Q(status__in=AuditHistory.EVALUATED_STATUSES)),
+                          passed=Count('id', filter=Q(status='success')),
+                          mean_p_value=Avg('p_value'),
+                          mean_compute_time=Avg('compute_time'))
+                .order_by('test_key', 'period'))
+
+        return [{
+            "test": row["test_key"],
+            "period": row["period"].isoformat(),
+            "runs": row["runs"],
+            "evaluated": row["evaluated"],
+            "passed": row["passed"],
+            "pass_rate": row["passed"] / row["evaluated"] if row["evaluated"] else None,
+            "mean_p_value": row["mean_p_value"],
+            "mean_compute_time": row["mean_compute_time"],
+        } for row in rows]
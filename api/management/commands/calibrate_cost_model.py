@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from testsuite.config import run_test, get_available_tests
+from testsuite.test_utils.cost_model import TestCostModel
+
+
+class Command(BaseCommand):
+    help = "Calibre le modèle de coût des tests sur cette machine et l'enregistre dans TEST_COST_MODEL_PATH"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[20000, 100000, 400000],
+                            help="Longueurs des séquences de mesure")
+        parser.add_argument('--tests', nargs='+', default=None, help="Tests à calibrer (défaut : tous)")
+        parser.add_argument('--time-budget', type=float, default=30.0,
+                            help="Durée au-delà de laquelle les tailles suivantes d'un test sont ignorées")
+
+    def handle(self, *args, **options):
+        test_names = options['tests'] or get_available_tests()
+        model = TestCostModel.load(settings.TEST_COST_MODEL_PATH)
+
+        model.calibrate(run_test, test_names, sizes=sorted(options['sizes']), time_budget=options['time_budget'])
+        model.save(settings.TEST_COST_MODEL_PATH)
+
+        for test_name in test_names:
+            if test_name in model.coefficients:
+                a, b = model.coefficients[test_name]
+                self.stdout.write(f"{test_name}: a={a:.3e} b={b:.3e}")
+        self.stdout.write(self.style.SUCCESS(f"Modèle enregistré dans {settings.TEST_COST_MODEL_PATH}"))
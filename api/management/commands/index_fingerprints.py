@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from api.fingerprints import FingerprintIndex
+from api.models import SequenceUpload
+
+
+class Command(BaseCommand):
+    help = "Ajoute à l'index des ancres les séquences finalisées qui n'y figurent pas encore"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Réindexe aussi les séquences déjà indexées")
+
+    def handle(self, *args, **options):
+        uploads = SequenceUpload.objects.filter(status='complete').order_by('created_at')
+        if not options['all']:
+            uploads = uploads.filter(fingerprints__isnull=True)
+
+        for upload in uploads.distinct():
+            segments = FingerprintIndex.index(upload)
+            self.stdout.write(f"{upload.id}: {upload.bit_length} bits, {len(segments)} segment(s) commun(s)")
+        self.stdout.write(self.style.SUCCESS("Index des ancres à jour"))
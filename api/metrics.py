@@ -0,0 +1,155 @@
+import bisect
+import math
+import threading
+
+from api.history import AuditHistory
+
+
+class AuditMetrics:
+    """
+    Compteurs et histogrammes du moteur d'audit, exposés au format Prometheus (/metrics).
+
+    Chaque thread du serveur écrit dans son propre fragment (threading.local) : les écritures
+    ne prennent aucun verrou, et les fragments sont additionnés à la lecture. Les fragments des
+    threads terminés sont fusionnés dans un total conservé, ce qui borne leur nombre.
+
+    Les durées des tests sont mesurées dans les processus du pool ('compute_time') et remontent
+    avec les résultats : le processus serveur les compte pour l'ensemble de ses processus de
+    calcul. Avec plusieurs processus serveur, chacun expose ses propres séries.
+    """
+
+    # Bornes des histogrammes de durée (secondes)
+    DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+    SERIES = {
+        "audit_test_duration_seconds": (
+            "histogram", "Durée de calcul de chaque test, par test et par ordre de grandeur de la longueur (bits)"),
+        "audit_test_queue_seconds_total": (
+            "counter", "Attente cumulée des tests avant calcul (file du pool ou tests précédents)"),
+        "audit_test_results_total": ("counter", "Résultats de tests, par test et par statut"),
+        "audit_bits_processed_total": ("counter", "Bits des séquences auditées"),
+        "audit_worker_busy_seconds_total": ("counter", "Durée de calcul cumulée des processus de calcul"),
+        "audit_runs_total": ("counter", "Exécutions par issue (completed, rejected, error)"),
+    }
+
+    _local = threading.local()
+    _shards = []
+    _retired = {}
+    _read_lock = threading.Lock()
+
+    @classmethod
+    def _shard(cls):
+        shard = getattr(cls._local, "values", None)
+        if shard is None:
+            shard = cls._local.values = {}
+            cls._shards.append((threading.current_thread(), shard))
+        return shard
+
+    @classmethod
+    def inc(cls, name, value=1.0, **labels):
+        """Incrémente un compteur"""
+        shard = cls._shard()
+        key = (name, tuple(sorted(labels.items())), None)
+        shard[key] = shard.get(key, 0.0) + value
+
+    @classmethod
+    def observe(cls, name, value, **labels):
+        """Ajoute une observation à un histogramme de durée"""
+        shard = cls._shard()
+        labels = tuple(sorted(labels.items()))
+        for part, amount in ((bisect.bisect_left(cls.DURATION_BUCKETS, value), 1), ("sum", value), ("count", 1)):
+            key = (name, labels, part)
+            shard[key] = shard.get(key, 0.0) + amount
+
+    @staticmethod
+    def length_bucket(sequence_length):
+        """Ordre de grandeur de la longueur d'une séquence : '1e6' pour 100 000 < n ≤ 1 000 000"""
+        return f"1e{max(2, math.ceil(math.log10(max(1, sequence_length))))}"
+
+    @classmethod
+    def observe_runs(cls, test_list, executions):
+        """
+        Compte des exécutions complètes
+
+        Args:
+            test_list: Liste des tests exécutés (voir expand_test_list)
+            executions (list[tuple]): (empreinte SHA-256, longueur en bits, résultats des tests, test d'arrêt),
+                comme pour AuditHistory.record
+        """
+        keys = AuditHistory.test_keys(test_list)
+        for _, length, results, _ in executions:
+            cls.inc("audit_runs_total", outcome="completed")
+            cls.inc("audit_bits_processed_total", length)
+            bucket = cls.length_bucket(length)
+            for key, result in zip(keys, results):
+                cls.inc("audit_test_results_total", test=key, status=result.get("test_status") or "error")
+                if result.get("compute_time") is not None:
+                    cls.observe("audit_test_duration_seconds", result["compute_time"], test=key, length=bucket)
+                    cls.inc("audit_worker_busy_seconds_total", result["compute_time"])
+                if result.get("queue_time") is not None:
+                    cls.inc("audit_test_queue_seconds_total", result["queue_time"], test=key)
+
+    @classmethod
+    def values(cls):
+        """Somme des fragments de tous les threads"""
+        with cls._read_lock:
+            totals = dict(cls._retired)
+            for item in list(cls._shards):
+                thread, shard = item
+                values = shard.copy()
+                for key, value in values.items():
+                    totals[key] = totals.get(key, 0.0) + value
+                if not thread.is_alive():
+                    # Un thread terminé n'écrit plus : son fragment rejoint le total conservé
+                    for key, value in values.items():
+                        cls._retired[key] = cls._retired.get(key, 0.0) + value
+                    cls._shards.remove(item)
+            return totals
+
+    @staticmethod
+    def _escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _labels(labels):
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{AuditMetrics._escape(value)}"' for key, value in labels) + "}"
+
+    @staticmethod
+    def _number(value):
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+    @classmethod
+    def render(cls, collected=()):
+        """
+        Texte au format d'exposition Prometheus
+
+        Args:
+            collected (iterable): (nom, type, aide, {étiquettes: valeur}) des séries lues au moment
+                de la collecte (état du pool, de l'admission, des caches)
+        """
+        values = cls.values()
+        lines = []
+        for name, (kind, help_text) in cls.SERIES.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            series = sorted((key, value) for key, value in values.items() if key[0] == name and
+                            (kind != "histogram" or key[2] == "count"))
+            for (_, labels, _), value in series:
+                if kind != "histogram":
+                    lines.append(f"{name}{cls._labels(labels)} {cls._number(value)}")
+                    continue
+                cumulative = 0.0
+                for index, bound in enumerate(cls.DURATION_BUCKETS + (math.inf,)):
+                    cumulative += values.get((name, labels, index), 0.0)
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    lines.append(f"{name}_bucket{cls._labels(labels + (('le', le),))} {cls._number(cumulative)}")
+                lines.append(f"{name}_sum{cls._labels(labels)} {cls._number(values.get((name, labels, 'sum'), 0.0))}")
+                lines.append(f"{name}_count{cls._labels(labels)} {cls._number(value)}")
+
+        for name, kind, help_text, samples in collected:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for labels, value in samples.items():
+                if value is not None:
+                    lines.append(f"{name}{cls._labels(labels)} {cls._number(value)}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-19 11:12
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_alter_testcase_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SequenceUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('encoding', models.CharField(choices=[('bits', 'Texte de 0 et 1'), ('bytes', 'Binaire compact (8 bits par octet)')], default='bits', max_length=10)),
+                ('status', models.CharField(choices=[('uploading', 'En cours'), ('complete', 'Finalisé')], default='uploading', max_length=10)),
+                ('received_bytes', models.BigIntegerField(default=0)),
+                ('bit_length', models.BigIntegerField(default=0)),
+                ('pending_bits', models.CharField(blank=True, default='', max_length=7)),
+                ('sha256', models.CharField(blank=True, default='', max_length=64)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['owner', 'sha256', 'bit_length'], name='api_sequenc_owner_i_96ada2_idx')],
+            },
+        ),
+    ]
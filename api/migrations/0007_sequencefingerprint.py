@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-19 12:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_sequenceupload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SequenceFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField()),
+                ('position', models.BigIntegerField()),
+                ('upload', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fingerprints', to='api.sequenceupload')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['value', 'upload'], name='api_sequenc_value_fbd36f_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2 on 2026-10-19 12:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_sequencefingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sequence_sha256', models.CharField(max_length=64)),
+                ('sequence_length', models.BigIntegerField()),
+                ('test_count', models.IntegerField(default=0)),
+                ('failed_count', models.IntegerField(default=0)),
+                ('compute_time', models.FloatField(default=0.0)),
+                ('stopped_by', models.CharField(blank=True, default='', max_length=100)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audit_runs', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AuditTestResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('test_key', models.CharField(max_length=100)),
+                ('parameters', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(max_length=20)),
+                ('p_value', models.FloatField(null=True)),
+                ('p_values', models.JSONField(null=True)),
+                ('compute_time', models.FloatField(null=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='api.auditrun')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='auditrun',
+            index=models.Index(fields=['owner', 'created_at'], name='api_auditru_owner_i_e630a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditrun',
+            index=models.Index(fields=['owner', 'sequence_sha256'], name='api_auditru_owner_i_4a31fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audittestresult',
+            index=models.Index(fields=['owner', 'test_key', 'created_at'], name='api_auditte_owner_i_2627b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audittestresult',
+            index=models.Index(fields=['owner', 'status', 'created_at'], name='api_auditte_owner_i_f0272f_idx'),
+        ),
+    ]
@@ -1,3 +1,6 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
@@ -21,3 +24,100 @@ class TestCase(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class SequenceUpload(models.Model):
+    """
+    Séquence téléversée par morceaux et stockée sous forme compacte sur le disque.
+    Une fois finalisée, elle peut être référencée par son id dans /run-tests.
+    """
+    ENCODING_CHOICES = [
+        ('bits', 'Texte de 0 et 1'),
+        ('bytes', 'Binaire compact (8 bits par octet)'),
+    ]
+    STATUS_CHOICES = [
+        ('uploading', 'En cours'),
+        ('complete', 'Finalisé'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    encoding = models.CharField(max_length=10, choices=ENCODING_CHOICES, default='bits')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='uploading')
+    received_bytes = models.BigIntegerField(default=0)  # Position de reprise dans le flux du client
+    bit_length = models.BigIntegerField(default=0)  # Nombre de bits stockés
+    pending_bits = models.CharField(max_length=7, blank=True, default='')  # Bits en attente d'un octet complet
+    sha256 = models.CharField(max_length=64, blank=True, default='')
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['owner', 'sha256', 'bit_length']),
+        ]
+
+    def __str__(self):
+        return str(self.id)
+
+
+class SequenceFingerprint(models.Model):
+    """
+    Ancre d'une séquence téléversée : fenêtre de 64 bits retenue dans chaque bloc de la séquence.
+    Les ancres de toutes les séquences sont indexées par valeur pour retrouver, à chaque nouveau
+    téléversement, les séquences précédentes qui partagent de longs segments (graine réutilisée).
+    """
+    upload = models.ForeignKey(SequenceUpload, on_delete=models.CASCADE, related_name='fingerprints')
+    value = models.BigIntegerField()  # Contenu de la fenêtre (64 bits, stockés signés)
+    position = models.BigIntegerField()  # Position de la fenêtre dans la séquence (bits)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['value', 'upload']),
+        ]
+
+
+class AuditRun(models.Model):
+    """
+    Exécution complète d'une batterie sur une séquence, conservée pour l'historique des audits.
+    La séquence elle-même n'est pas conservée : seuls son empreinte SHA-256 (forme compacte)
+    et sa longueur l'identifient.
+    """
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='audit_runs')
+    created_at = models.DateTimeField(default=timezone.now)
+    sequence_sha256 = models.CharField(max_length=64)
+    sequence_length = models.BigIntegerField()
+    test_count = models.IntegerField(default=0)
+    failed_count = models.IntegerField(default=0)  # Tests en échec ou attaques réussies
+    compute_time = models.FloatField(default=0.0)  # Somme des durées de calcul des tests (secondes)
+    stopped_by = models.CharField(max_length=100, blank=True, default='')  # Mode on_failure=stop
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['owner', 'created_at']),
+            models.Index(fields=['owner', 'sequence_sha256']),
+        ]
+
+    def __str__(self):
+        return f"{self.owner_id} {self.created_at:%Y-%m-%d %H:%M:%S}"
+
+
+class AuditTestResult(models.Model):
+    """
+    Résultat d'un test d'une exécution conservée. Le propriétaire et la date de l'exécution
+    sont recopiés afin que les agrégats par test et par période ne lisent que cette table.
+    """
+    run = models.ForeignKey(AuditRun, on_delete=models.CASCADE, related_name='results')
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    created_at = models.DateTimeField(default=timezone.now)
+    test_key = models.CharField(max_length=100)
+    parameters = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20)
+    p_value = models.FloatField(null=True)  # Plus petite p-value du test
+    p_values = models.JSONField(null=True)  # Toutes les p-values, pour les tests qui en produisent plusieurs
+    compute_time = models.FloatField(null=True)  # Secondes
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['owner', 'test_key', 'created_at']),
+            models.Index(fields=['owner', 'status', 'created_at']),
+        ]
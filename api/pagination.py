@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class AuditRunPagination(CursorPagination):
+    """
+    Pagination par curseur de l'historique des audits : chaque page est lue sur l'index
+    (propriétaire, date) à partir de la position du curseur, sans OFFSET ni COUNT.
+    """
+    ordering = '-created_at'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class CatalogPagination(CursorPagination):
+    """
+    Pagination par curseur des batteries et de leurs tests, dans l'ordre de création
+    """
+    ordering = 'id'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
@@ -0,0 +1,65 @@
+from django.conf import settings
+from rest_framework.parsers import BaseParser
+
+
+class SequenceBatchParser(BaseParser):
+    """
+    Conteneur binaire de séquences pour /run-tests/batch (application/octet-stream).
+
+    Le corps est une suite d'enregistrements : la longueur n de la séquence en bits (entier
+    non signé de 4 octets, gros-boutiste), suivie de ceil(n / 8) octets compacts (bit de
+    poids fort en premier). Les enregistrements sont lus au fil du flux, sans décodage
+    des bits ni copie intermédiaire du corps.
+    """
+    media_type = 'application/octet-stream'
+
+    HEADER_BYTES = 4
+    # Octets lus à la fois dans le flux
+    READ_BYTES = 1 << 20
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns:
+            dict: {"sequences": [(octets compacts, longueur en bits), ...]}
+
+        Raises:
+            ValueError: Si le conteneur est tronqué, contient une séquence vide ou dépasse les limites
+        """
+        sequences = []
+        total_bits = 0
+        while True:
+            header = self._read(stream, self.HEADER_BYTES)
+            if not header:
+                break
+            if len(header) < self.HEADER_BYTES:
+                raise ValueError("Conteneur de séquences tronqué (en-tête incomplet).")
+
+            length = int.from_bytes(header, 'big')
+            if length == 0:
+                raise ValueError(f"La séquence {len(sequences)} du conteneur est vide.")
+            total_bits += length
+            if len(sequences) >= settings.AUDIT_BATCH_MAX_SEQUENCES or total_bits > settings.AUDIT_BATCH_MAX_BITS:
+                raise ValueError(f"Le lot dépasse les limites du serveur ({settings.AUDIT_BATCH_MAX_SEQUENCES} "
+                                 f"séquences, {settings.AUDIT_BATCH_MAX_BITS} bits au total).")
+
+            packed = self._read(stream, (length + 7) // 8)
+            if len(packed) < (length + 7) // 8:
+                raise ValueError(f"Conteneur de séquences tronqué (séquence {len(sequences)} incomplète).")
+            sequences.append((packed, length))
+
+        return {"sequences": sequences}
+
+    @classmethod
+    def _read(cls, stream, size):
+        """Lit exactement `size` octets, ou moins si le flux se termine"""
+        if stream is None:
+            return b''
+        parts = []
+        remaining = size
+        while remaining:
+            part = stream.read(min(remaining, cls.READ_BYTES))
+            if not part:
+                break
+            parts.append(part)
+            remaining -= len(part)
+        return b''.join(parts)
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from api.models import TestSuite, TestCase
+from api.models import TestSuite, TestCase, SequenceUpload, AuditRun, AuditTestResult
 from django.contrib.auth.models import User
 
 
@@ -15,6 +15,33 @@ class TestCaseSerializer(serializers.ModelSerializer):
         fields = ['id', 'key', 'name', 'description', 'test_suite']
 
 
+class SequenceUploadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SequenceUpload
+        fields = ['id', 'encoding', 'status', 'received_bytes', 'bit_length', 'sha256', 'created_at']
+        read_only_fields = ['id', 'status', 'received_bytes', 'bit_length', 'sha256', 'created_at']
+
+
+class AuditTestResultSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AuditTestResult
+        fields = ['test_key', 'parameters', 'status', 'p_value', 'p_values', 'compute_time']
+
+
+class AuditRunSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AuditRun
+        fields = ['id', 'created_at', 'sequence_sha256', 'sequence_length', 'test_count', 'failed_count',
+                  'compute_time', 'stopped_by']
+
+
+class AuditRunDetailSerializer(AuditRunSerializer):
+    results = AuditTestResultSerializer(many=True, read_only=True)
+
+    class Meta(AuditRunSerializer.Meta):
+        fields = AuditRunSerializer.Meta.fields + ['results']
+
+
 class UserCreateSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
 
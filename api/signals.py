@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from api.authentication import CachedTokenAuthentication
+from api.cache import VersionedCache
+from api.models import TestCase, TestSuite
+from api.suites import SuitePlan
+from api.views import CatalogCacheMixin
+
+
+@receiver([post_save, post_delete], sender=TestCase)
+@receiver([post_save, post_delete], sender=TestSuite)
+def invalidate_catalog(sender, **kwargs):
+    """
+    Les plans des batteries et les réponses du catalogue en cache sont recalculés après
+    toute écriture d'une batterie ou d'un test
+    """
+    VersionedCache.invalidate(SuitePlan.NAMESPACE, CatalogCacheMixin.CACHE_NAMESPACE)
+
+
+@receiver([post_save, post_delete], sender=Token)
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_tokens(sender, **kwargs):
+    """Un jeton supprimé ou remplacé, ou un utilisateur modifié, n'est plus servi depuis le cache"""
+    VersionedCache.invalidate(CachedTokenAuthentication.NAMESPACE)
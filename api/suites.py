@@ -0,0 +1,70 @@
+from api.cache import VersionedCache
+from api.models import TestSuite
+from testsuite.config import TEST_FUNCTIONS, plan_request
+
+
+class SuitePlan:
+    """
+    Plan d'exécution d'une batterie enregistrée (TestSuite) : clés de ses tests, paramètres
+    par défaut et estimation du coût.
+
+    Les clés sont résolues en une requête puis validées contre le registre des tests; le plan
+    et ses estimations par longueur de séquence sont conservés dans VersionedCache et
+    invalidés à chaque écriture d'un TestCase ou d'un TestSuite.
+    """
+
+    NAMESPACE = 'suite_plans'
+
+    @staticmethod
+    def get(suite_id):
+        """
+        Plan de la batterie, depuis le cache si possible
+
+        Returns:
+            dict: {"suite", "name", "test_list", "tests": [{"test", "params"}]}
+
+        Raises:
+            TestSuite.DoesNotExist: Si la batterie n'existe pas
+            ValueError: Si la batterie est vide ou référence des tests inconnus
+        """
+        plan = VersionedCache.get_or_set(SuitePlan.NAMESPACE, suite_id, lambda: SuitePlan.resolve(suite_id))
+        if plan is None:
+            raise TestSuite.DoesNotExist(f"Batterie introuvable: {suite_id}")
+        if plan["unknown"]:
+            raise ValueError(f"La batterie référence des tests inconnus: {', '.join(plan['unknown'])}.")
+        if not plan["test_list"]:
+            raise ValueError("La batterie ne contient aucun test.")
+        return plan
+
+    @staticmethod
+    def resolve(suite_id):
+        """
+        Résout les clés des tests de la batterie en une requête (jointure TestSuite / TestCase)
+
+        Returns:
+            dict or None: Plan de la batterie (voir get), None si elle n'existe pas
+        """
+        rows = list(TestSuite.objects.filter(pk=suite_id).order_by('testcase__id')
+                    .values_list('name', 'testcase__key'))
+        if not rows:
+            return None
+
+        # Une clé présente dans plusieurs tests de la batterie n'est exécutée qu'une fois
+        keys = list(dict.fromkeys(key for _, key in rows if key is not None))
+        return {
+            "suite": suite_id,
+            "name": rows[0][0],
+            "test_list": [key for key in keys if key in TEST_FUNCTIONS],
+            "tests": [{"test": key, "params": TEST_FUNCTIONS[key].defaults()} for key in keys if key in TEST_FUNCTIONS],
+            "unknown": [key for key in keys if key not in TEST_FUNCTIONS],
+        }
+
+    @staticmethod
+    def estimate(plan, sequence_length, max_workers, cost_model):
+        """
+        Estimation du coût de la batterie pour une longueur de séquence (voir plan_request), en cache
+        """
+        key = (plan["suite"], sequence_length, max_workers, id(cost_model))
+        return VersionedCache.get_or_set(
+            SuitePlan.NAMESPACE, key,
+            lambda: plan_request(plan["test_list"], sequence_length, max_workers, cost_model))
@@ -0,0 +1,60 @@
+import time
+from contextlib import contextmanager
+
+
+class RequestTimer:
+    """
+    Durées des étapes d'une requête d'exécution, mesurées sur l'horloge monotone.
+
+    Étapes : 'ingest' (lecture du corps), 'validate' (options et liste de tests), 'decode'
+    (séquence), 'plan' (planification et coûts prévus), 'admission' (attente dans la file),
+    'execute' (tests), 'history' (enregistrement) et 'render' (sérialisation de la réponse).
+    Chaque test est détaillé par son attente avant calcul ('queue', file du pool ou tests
+    précédents du même processus) et sa durée de calcul ('compute').
+
+    Les durées sont renvoyées en secondes dans l'objet 'timings' de la réponse et en
+    millisecondes dans l'en-tête Server-Timing. La sérialisation ayant lieu après la
+    construction du corps, 'render' ne figure que dans l'en-tête.
+    """
+
+    def __init__(self):
+        self.spans = {}
+        self.tests = []
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + time.perf_counter() - start
+
+    def add_tests(self, test_keys, results):
+        """Détail de chaque test, dans l'ordre des résultats"""
+        self.tests = [{
+            "test": key,
+            "parameters": result.get("parameters") or {},
+            "queue": result.get("queue_time"),
+            "compute": result.get("compute_time"),
+        } for key, result in zip(test_keys, results)]
+
+    def as_dict(self):
+        return {"spans": dict(self.spans), "tests": self.tests}
+
+    def server_timing(self):
+        """
+        Valeur de l'en-tête Server-Timing : une métrique par étape, puis une par test
+        ('test.<clé>', suffixée de son rang si la clé se répète), attente en description
+        """
+        metrics = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.spans.items()]
+        seen = {}
+        for test in self.tests:
+            seen[test["test"]] = seen.get(test["test"], 0) + 1
+            name = f"test.{test['test']}" + (f".{seen[test['test']]}" if seen[test["test"]] > 1 else "")
+            if test["compute"] is None:
+                continue
+            metric = f"{name};dur={test['compute'] * 1000:.3f}"
+            if test["queue"] is not None:
+                metric += f';desc="queue {test["queue"] * 1000:.3f}ms"'
+            metrics.append(metric)
+        return ", ".join(metrics)
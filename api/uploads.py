@@ -0,0 +1,151 @@
+import hashlib
+import threading
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+
+class ChunkedUploadWriter:
+    """
+    Écrit les morceaux d'un téléversement directement dans un fichier binaire compact
+    (8 bits par octet, bit de poids fort en premier) et calcule l'empreinte SHA-256
+    au fil de l'eau, sans jamais charger la séquence complète en mémoire.
+    """
+    READ_SIZE = 1024 * 1024
+
+    # Empreintes en cours par téléversement : (objet sha256, nombre d'octets déjà hachés)
+    _hashers = {}
+    _locks = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, upload):
+        self.upload = upload
+
+    @staticmethod
+    def storage_path(upload_id):
+        root = Path(settings.AUDIT_UPLOAD_ROOT)
+        root.mkdir(parents=True, exist_ok=True)
+        return root / f"{upload_id}.bin"
+
+    @classmethod
+    def lock_for(cls, upload_id):
+        """Verrou par téléversement pour sérialiser les morceaux concurrents"""
+        with cls._registry_lock:
+            return cls._locks.setdefault(str(upload_id), threading.Lock())
+
+    def _hasher(self, stored_bytes, path):
+        """
+        Retourne l'empreinte en cours. Si elle a été perdue (redémarrage, autre processus),
+        elle est reconstruite à partir des octets déjà présents sur le disque.
+        """
+        key = str(self.upload.id)
+        hasher, hashed = self._hashers.get(key, (None, -1))
+        if hasher is None or hashed != stored_bytes:
+            hasher = hashlib.sha256()
+            with open(path, 'rb') as f:
+                remaining = stored_bytes
+                while remaining > 0:
+                    data = f.read(min(self.READ_SIZE, remaining))
+                    if not data:
+                        break
+                    hasher.update(data)
+                    remaining -= len(data)
+        return hasher
+
+    def _decode(self, data):
+        """
+        Convertit un morceau brut en bits à ajouter à la séquence.
+
+        Returns:
+            np.ndarray: bits (0/1) pour l'encodage 'bits', ou None si les octets sont déjà compacts
+        """
+        if self.upload.encoding == 'bytes':
+            return None
+        raw = np.frombuffer(data, dtype=np.uint8)
+        # Comme pour 'bit_sequence', tout caractère autre que '0' ou '1' est ignoré
+        return raw[(raw == ord('0')) | (raw == ord('1'))] - ord('0')
+
+    def append(self, stream):
+        """
+        Ajoute le contenu du flux à la fin du fichier compact.
+
+        Les données sont lues par blocs; en cas d'interruption, la progression déjà écrite
+        est conservée afin que le client puisse reprendre à la position retournée.
+
+        Args:
+            stream: Objet possédant une méthode read(size)
+        """
+        upload = self.upload
+        path = self.storage_path(upload.id)
+        path.touch(exist_ok=True)
+
+        stored_bytes = upload.bit_length // 8
+        hasher = self._hasher(stored_bytes, path)
+        pending = np.array([int(b) for b in upload.pending_bits], dtype=np.uint8)
+
+        try:
+            with open(path, 'r+b') as f:
+                # Ignore d'éventuels octets écrits par une requête interrompue avant sa sauvegarde
+                f.truncate(stored_bytes)
+                f.seek(stored_bytes)
+
+                while True:
+                    data = stream.read(self.READ_SIZE)
+                    if not data:
+                        break
+
+                    bits = self._decode(data)
+                    if bits is None:
+                        packed = data
+                        upload.bit_length += len(data) * 8
+                    else:
+                        bits = np.concatenate([pending, bits])
+                        complete = len(bits) - len(bits) % 8
+                        packed = np.packbits(bits[:complete]).tobytes()
+                        pending = bits[complete:]
+                        upload.bit_length += complete
+                        upload.pending_bits = ''.join(str(b) for b in pending)
+
+                    f.write(packed)
+                    hasher.update(packed)
+                    upload.received_bytes += len(data)
+        finally:
+            self._hashers[str(upload.id)] = (hasher, upload.bit_length // 8)
+            upload.save(update_fields=['received_bytes', 'bit_length', 'pending_bits', 'updated_at'])
+
+    def finalize(self):
+        """
+        Complète le dernier octet, fige l'empreinte et marque le téléversement comme terminé.
+
+        Returns:
+            str: Empreinte SHA-256 du fichier compact
+        """
+        upload = self.upload
+        path = self.storage_path(upload.id)
+        path.touch(exist_ok=True)
+        stored_bytes = upload.bit_length // 8
+        hasher = self._hasher(stored_bytes, path)
+
+        with open(path, 'r+b') as f:
+            f.truncate(stored_bytes)
+            f.seek(stored_bytes)
+            if upload.pending_bits:
+                # Les bits restants sont complétés par des zéros; bit_length en garde la longueur exacte
+                last = np.packbits(np.array([int(b) for b in upload.pending_bits], dtype=np.uint8)).tobytes()
+                f.write(last)
+                hasher.update(last)
+                upload.bit_length += len(upload.pending_bits)
+                upload.pending_bits = ''
+
+        self._hashers.pop(str(upload.id), None)
+        upload.sha256 = hasher.hexdigest()
+        upload.status = 'complete'
+        upload.save(update_fields=['bit_length', 'pending_bits', 'sha256', 'status', 'updated_at'])
+        return upload.sha256
+
+    @classmethod
+    def discard(cls, upload):
+        """Supprime le fichier et l'état en mémoire d'un téléversement"""
+        cls._hashers.pop(str(upload.id), None)
+        cls.storage_path(upload.id).unlink(missing_ok=True)
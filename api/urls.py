@@ -1,4 +1,5 @@
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
 from api import views
 from rest_framework.authtoken.views import obtain_auth_token
 
@@ -6,8 +7,21 @@ urlpatterns = [
     path('test-suites', views.TestSuiteList.as_view()),
     path('test-suites/<int:pk>', views.TestSuiteDetail.as_view()),
     path('test-suites/<int:pk>/test-cases', views.TestCaseList.as_view()),
+    path('test-suites/<int:pk>/run', views.TestSuiteRun.as_view()),
     path('test-cases/<int:pk>', views.TestCaseDetail.as_view()),
+    path('tests', views.TestCatalog.as_view()),
     path('run-tests', views.TestResult.as_view()),
+    path('run-tests/async', csrf_exempt(views.TestResultAsync.as_view())),
+    path('run-tests/estimate', views.TestRunEstimate.as_view()),
+    path('run-tests/windowed', views.WindowedTestResult.as_view()),
+    path('run-tests/batch', views.TestBatchResult.as_view()),
+    path('audits', views.AuditRunList.as_view()),
+    path('audits/stats', views.AuditPassRates.as_view()),
+    path('audits/<int:pk>', views.AuditRunDetail.as_view()),
+    path('uploads', views.SequenceUploadCreate.as_view()),
+    path('uploads/<uuid:pk>', views.SequenceUploadDetail.as_view()),
+    path('uploads/<uuid:pk>/finalize', views.SequenceUploadFinalize.as_view()),
+    path('caches', views.CacheStats.as_view()),
     path('api-token-auth/', obtain_auth_token, name='api_token_auth'),
     path('register/', views.UserCreateView.as_view()),
 ]
@@ -1,15 +1,46 @@
 from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from api.models import TestSuite, TestCase
-from api.serializers import TestSuiteSerializer, TestCaseSerializer, UserCreateSerializer
-from testsuite.config import run_test, run_tests_parallel
+from api.models import TestSuite, TestCase, SequenceUpload, AuditRun
+from api.serializers import TestSuiteSerializer, TestCaseSerializer, UserCreateSerializer, SequenceUploadSerializer, \
+    AuditRunSerializer, AuditRunDetailSerializer
+from api.uploads import ChunkedUploadWriter
+from api.fingerprints import FingerprintIndex
+from api.history import AuditHistory
+from api.pagination import AuditRunPagination, CatalogPagination
+from api.suites import SuitePlan
+from api.admission import AdmissionController, AdmissionRejected
+from api.authentication import CachedTokenAuthentication
+from api.cache import VersionedCache
+from api.parsers import SequenceBatchParser
+from api.timing import RequestTimer
+from api.metrics import AuditMetrics
+from testsuite.config import run_tests_parallel, run_tests_async, get_process_pool, describe_tests, expand_test_list, plan_request, \
+    windowed_audit, run_windowed_audit, run_preview, run_tests_batch, pool_status
+from testsuite.test_utils.packed_sequence import PackedSequence
+from testsuite.test_utils.cost_model import TestCostModel
 from rest_framework.parsers import MultiPartParser, JSONParser
+import asyncio
+import datetime
+import hashlib
 import json
+import threading
 from django.conf import settings
+import numpy as np
 import time
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from django.contrib.auth.models import User
+from django.shortcuts import get_object_or_404
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from django.utils.dateparse import parse_date, parse_datetime
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.utils.encoders import JSONEncoder
 
 
 
@@ -17,27 +48,74 @@ from django.contrib.auth.models import User
 
 # Create your views here.
 
-class TestSuiteList(generics.ListCreateAPIView):
+class CatalogCacheMixin:
+    """
+    Lectures (GET) des batteries et de leurs tests servies depuis le cache.
+
+    La réponse sérialisée de chaque URL est conservée dans VersionedCache (espace 'catalog',
+    invalidé par les écritures de TestSuite et TestCase) avec son ETag (empreinte du contenu,
+    identique d'un processus à l'autre) et sa date de dernière modification. Une requête
+    If-None-Match ou If-Modified-Since qui correspond à l'entrée en cache reçoit 304 sans
+    accès à la base.
+    """
+    CACHE_NAMESPACE = 'catalog'
+
+    def get(self, request, *args, **kwargs):
+        entry = VersionedCache.get_or_set(self.CACHE_NAMESPACE, request.build_absolute_uri(),
+                                          lambda: self._cache_entry(request, *args, **kwargs))
+        response = Response(entry["data"], headers={
+            "ETag": entry["etag"],
+            "Last-Modified": http_date(entry["last_modified"]),
+            # Le client revalide à chaque lecture (réponse 304 si rien n'a changé)
+            "Cache-Control": "private, no-cache",
+        })
+        return get_conditional_response(request._request, etag=entry["etag"],
+                                        last_modified=entry["last_modified"], response=response)
+
+    def _cache_entry(self, request, *args, **kwargs):
+        data = super().get(request, *args, **kwargs).data
+        content = json.dumps(data, cls=JSONEncoder, sort_keys=True).encode()
+        # Les suppressions ne laissent pas de date en base : la dernière invalidation reçue la remplace
+        updated_at = self.modified_queryset(**kwargs).aggregate(last=Max('updated_at'))["last"]
+        last_modified = max(updated_at.timestamp() if updated_at else 0,
+                            VersionedCache.invalidated_at(self.CACHE_NAMESPACE) or 0)
+        return {
+            "data": data,
+            "etag": quote_etag(hashlib.sha256(content).hexdigest()[:32]),
+            "last_modified": int(last_modified),
+        }
+
+    def modified_queryset(self, **kwargs):
+        """Objets dont la date de modification détermine Last-Modified"""
+        return self.get_queryset()
+
+
+class TestSuiteList(CatalogCacheMixin, generics.ListCreateAPIView):
     """
     Liste toutes les batteries de test
     """
     queryset = TestSuite.objects.all()
     serializer_class = TestSuiteSerializer
+    pagination_class = CatalogPagination
 
 
-class TestSuiteDetail(generics.RetrieveUpdateDestroyAPIView):
+class TestSuiteDetail(CatalogCacheMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a test suite.
     """
     queryset = TestSuite.objects.all()
     serializer_class = TestSuiteSerializer
 
+    def modified_queryset(self, **kwargs):
+        return self.get_queryset().filter(pk=kwargs["pk"])
 
-class TestCaseList(generics.ListCreateAPIView):
+
+class TestCaseList(CatalogCacheMixin, generics.ListCreateAPIView):
     """
     Liste des tests d'une batterie de test
     """
     serializer_class = TestCaseSerializer
+    pagination_class = CatalogPagination
 
     def get_queryset(self):
         """
@@ -54,71 +132,269 @@ class TestCaseDetail(generics.RetrieveUpdateDestroyAPIView):
 
 class TestResult(APIView):
     parser_classes = [MultiPartParser, JSONParser]
-    # permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.timer = RequestTimer()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Sérialise la réponse en mesurant sa durée, puis ajoute l'en-tête Server-Timing"""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        timer = getattr(self, "timer", None)
+        if timer is not None and isinstance(response, Response):
+            with timer.span("render"):
+                response.render()
+            response["Server-Timing"] = timer.server_timing()
+        return response
 
     def post(self, request):
         try:
             start_time = time.time()
 
-            # --- Lecture et parsing de test_list ---
-            raw_test_list = request.data.get("test_list")
-            if isinstance(raw_test_list, str):
-                test_list = json.loads(raw_test_list)
-            elif isinstance(raw_test_list, list):
-                test_list = raw_test_list
-            else:
-                raise ValueError("Le champ 'test_list' est requis et doit être une liste.")
-
-            if not test_list:
-                raise ValueError("La liste de tests ne peut pas être vide.")
-
-            # --- Lecture de la séquence ---
-            bit_sequence = []
-
-            if "bit_file" in request.FILES:
-                bit_file = request.FILES["bit_file"]
-                file_content = bit_file.read().decode("utf-8")
-                bit_sequence = [int(b) for b in file_content.strip() if b in "01"]
-            elif "bit_sequence" in request.data:
-                bit_sequence = request.data["bit_sequence"]
-                if isinstance(bit_sequence, str):
-                    bit_sequence = [int(b) for b in bit_sequence.strip() if b in "01"]
-            else:
-                raise ValueError("Veuillez fournir un fichier ou une séquence de bits ('bit_file' ou 'bit_sequence').")
-
-            # --- Exécution des tests ---
-            test_results = []
-            for test_name in test_list:
-                test_result = run_test(test_name, bit_sequence)
-                test_results.append(test_result)
-
-            duration = time.time() - start_time
-
-            # --- Récupération des informations utilisateur ---
-            user = request.user
-            user_info = {
-                "id": user.id,
-                "username": user.username if user.username else None,
-                "first_name": user.first_name if user.first_name else None,
-                "last_name": user.last_name if user.last_name else None,
-                "last_login": user.last_login.isoformat() if user.last_login else None,
-            }
+            with self.timer.span("ingest"):
+                data, files = request.data, request.FILES
+            with self.timer.span("validate"):
+                test_list = self._read_test_list(data)
+                on_failure, failure_threshold = self._read_failure_mode(data)
+                preview = self._read_preview(data)
+            with self.timer.span("decode"):
+                bit_sequence = self._read_sequence(data, files, request.user)
+            with self.timer.span("plan"):
+                cost_model = TestCostModel.load_cached(settings.TEST_COST_MODEL_PATH)
 
-            return Response({
-                "results": test_results,
-                "count": len(test_results),
-                "sequence_length": len(bit_sequence),
-                "duration": self._format_time(duration),
-                "user_info": user_info
-            })
+            if preview is None:
+                return Response(self._execute(request.user, test_list, bit_sequence, cost_model,
+                                              on_failure, failure_threshold, start_time))
+            if preview["continue"]:
+                # Statuts provisoires puis résultats complets, une ligne JSON chacun
+                return StreamingHttpResponse(
+                    self._stream(preview["seed"], request.user, test_list, bit_sequence, cost_model,
+                                 on_failure, failure_threshold, start_time),
+                    content_type="application/x-ndjson")
+            return Response(self._preview(preview["seed"], request.user, test_list, bit_sequence, cost_model,
+                                          start_time))
 
+        except AdmissionRejected as e:
+            return Response({"error": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS,
+                            headers={"Retry-After": str(e.retry_after)})
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
+            AuditMetrics.inc("audit_runs_total", outcome="error")
             return Response({
                 "error": f"Erreur lors de l'exécution des tests: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _execute(self, user, test_list, bit_sequence, cost_model, on_failure, failure_threshold, start_time,
+                 estimate=None):
+        """Exécution complète des tests (planifiée selon le modèle de coût), dans les budgets d'admission"""
+        with self.timer.span("plan"):
+            admission = self._admission_request(user, test_list, len(bit_sequence), cost_model, estimate,
+                                                packed=isinstance(bit_sequence, PackedSequence))
+        with self.timer.span("admission"):
+            ticket = AdmissionController.acquire(**admission)
+        try:
+            with self.timer.span("execute"):
+                execution = run_tests_parallel(
+                    test_list, bit_sequence,
+                    max_workers=settings.TEST_PARALLEL_WORKERS,
+                    cost_model=cost_model,
+                    executor=get_process_pool(settings.TEST_PARALLEL_WORKERS),
+                    on_failure=on_failure,
+                    failure_threshold=failure_threshold,
+                )
+        finally:
+            AdmissionController.release(ticket)
+
+        with self.timer.span("history"):
+            executions = [(AuditHistory.sequence_hash(bit_sequence), len(bit_sequence), execution["results"],
+                           execution["stopped_by"])]
+            audit_id, = AuditHistory.record(user, test_list, executions)
+        AuditMetrics.observe_runs(test_list, executions)
+        self.timer.add_tests(AuditHistory.test_keys(test_list), execution["results"])
+        duration = time.time() - start_time
+
+        return {
+            "results": execution["results"],
+            "count": execution["count"],
+            "sequence_length": len(bit_sequence),
+            "duration": self._format_time(duration),
+            "predicted_duration": self._format_time(execution["predicted_duration"]),
+            "workers": execution["workers"],
+            "stopped_by": execution["stopped_by"],
+            "audit_id": audit_id,
+            "timings": self.timer.as_dict(),
+            "user_info": self._user_info(user)
+        }
+
+    def _preview(self, seed, user, test_list, bit_sequence, cost_model, start_time):
+        """Aperçu : statuts provisoires calculés sur des échantillons de la séquence"""
+        budget = settings.AUDIT_PREVIEW_TIME_BUDGET
+        with AdmissionController.admit(user.pk, budget * settings.TEST_PARALLEL_WORKERS,
+                                       AdmissionController.memory_cost(len(bit_sequence), 1,
+                                                                       isinstance(bit_sequence, PackedSequence)),
+                                       predicted_duration=budget):
+            preview = run_preview(test_list, bit_sequence, budget,
+                                  max_workers=settings.TEST_PARALLEL_WORKERS,
+                                  cost_model=cost_model,
+                                  executor=get_process_pool(settings.TEST_PARALLEL_WORKERS),
+                                  seed=seed)
+
+        return {
+            **preview,
+            "preview": True,
+            "duration": self._format_time(time.time() - start_time),
+            "user_info": self._user_info(user)
+        }
+
+    def _stream(self, seed, user, test_list, bit_sequence, cost_model, on_failure, failure_threshold, start_time):
+        """Génère l'aperçu puis l'exécution complète (NDJSON)"""
+        for step in (lambda: self._preview(seed, user, test_list, bit_sequence, cost_model, start_time),
+                     lambda: self._execute(user, test_list, bit_sequence, cost_model, on_failure,
+                                           failure_threshold, start_time)):
+            try:
+                payload = step()
+            except AdmissionRejected as e:
+                payload = {"error": str(e), "retry_after": e.retry_after}
+            except Exception as e:
+                payload = {"error": f"Erreur lors de l'exécution des tests: {str(e)}"}
+            yield json.dumps(payload, cls=JSONEncoder) + "\n"
+
+    @staticmethod
+    def _admission_request(user, test_list, sequence_length, cost_model, estimate=None, packed=False):
+        """
+        Coûts prévus d'une exécution, transmis au contrôle d'admission
+
+        Args:
+            estimate (dict, optional): Résultat de plan_request déjà calculé pour cette requête
+            packed (bool): La séquence est un fichier compact (voir AdmissionController.memory_cost)
+
+        Returns:
+            dict: Arguments de AdmissionController.admit / acquire
+        """
+        plan = estimate or plan_request(test_list, sequence_length, settings.TEST_PARALLEL_WORKERS, cost_model)
+        return {
+            "user_id": user.pk,
+            "cpu_cost": plan["cpu_cost"],
+            "memory_cost": AdmissionController.memory_cost(sequence_length, plan["workers"], packed),
+            "predicted_duration": plan["predicted_duration"],
+        }
+
+    @staticmethod
+    def _read_failure_mode(data):
+        """
+        Lit les champs 'on_failure' ('continue' ou 'stop') et 'failure_threshold'
+
+        Returns:
+            tuple: (on_failure, seuil de p-value ou None pour le seuil par défaut)
+        """
+        on_failure = data.get("on_failure") or "continue"
+        if on_failure not in ("continue", "stop"):
+            raise ValueError("Le champ 'on_failure' doit valoir 'continue' ou 'stop'.")
+
+        failure_threshold = data.get("failure_threshold")
+        if failure_threshold in (None, ""):
+            return on_failure, None
+        try:
+            failure_threshold = float(failure_threshold)
+        except (TypeError, ValueError):
+            raise ValueError("Le champ 'failure_threshold' doit être un nombre.")
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("Le champ 'failure_threshold' doit être compris entre 0 (exclu) et 1.")
+        return on_failure, failure_threshold
+
+    @staticmethod
+    def _read_preview(data):
+        """
+        Lit le champ 'preview' : true, ou {"seed": entier, "continue": booléen}
+
+        Returns:
+            dict or None: {"seed", "continue"}, None hors mode aperçu
+        """
+        preview = data.get("preview")
+        if isinstance(preview, str):
+            preview = json.loads(preview) if preview.strip().startswith("{") else preview.lower() in ("true", "1")
+        if not preview:
+            return None
+        if preview is True:
+            preview = {}
+        if not isinstance(preview, dict):
+            raise ValueError("Le champ 'preview' doit être un booléen ou un objet {\"seed\": ..., \"continue\": ...}.")
+
+        try:
+            seed = int(preview.get("seed", 0))
+        except (TypeError, ValueError):
+            raise ValueError("La graine de l'aperçu ('seed') doit être un entier.")
+        return {"seed": seed, "continue": bool(preview.get("continue", False))}
+
+    @staticmethod
+    def _read_test_list(data):
+        """
+        Lit et valide le champ 'test_list' de la requête
+
+        Returns:
+            list: Tests à exécuter (noms, ou objets {"test": ..., "params": {...}})
+        """
+        raw_test_list = data.get("test_list")
+        if isinstance(raw_test_list, str):
+            test_list = json.loads(raw_test_list)
+        elif isinstance(raw_test_list, list):
+            test_list = raw_test_list
+        else:
+            raise ValueError("Le champ 'test_list' est requis et doit être une liste.")
+
+        if not isinstance(test_list, list) or not test_list:
+            raise ValueError("La liste de tests ne peut pas être vide.")
+
+        # Vérifie la syntaxe des paramètres et des balayages avant de lire la séquence
+        expand_test_list(test_list)
+        return test_list
+
+    @staticmethod
+    def _read_sequence(data, files, user):
+        """
+        Lit la séquence de bits depuis l'une des sources acceptées par l'API
+
+        Returns:
+            list or PackedSequence: Séquence de bits à tester
+        """
+        if "bit_file" in files:
+            bit_file = files["bit_file"]
+            file_content = bit_file.read().decode("utf-8")
+            return [int(b) for b in file_content.strip() if b in "01"]
+        elif "bit_sequence" in data:
+            bit_sequence = data["bit_sequence"]
+            if isinstance(bit_sequence, str):
+                bit_sequence = [int(b) for b in bit_sequence.strip() if b in "01"]
+            return bit_sequence
+        elif "bit_path" in data:
+            # Fichier binaire compact déjà présent sur le serveur, projeté en mémoire
+            path = PackedSequence.resolve_path(settings.AUDIT_DATA_ROOT, data["bit_path"])
+            return PackedSequence(path, data.get("bit_length"))
+        elif "blob_id" in data:
+            # Séquence téléversée au préalable via /uploads
+            upload = SequenceUpload.objects.filter(pk=data["blob_id"], owner=user.id, status='complete').first()
+            if upload is None:
+                raise ValueError(f"Séquence téléversée introuvable: {data['blob_id']}")
+            return PackedSequence(ChunkedUploadWriter.storage_path(upload.id), upload.bit_length)
+        else:
+            raise ValueError("Veuillez fournir un fichier, une séquence de bits, un chemin serveur ou un id de "
+                             "téléversement ('bit_file', 'bit_sequence', 'bit_path' ou 'blob_id').")
+
+    @staticmethod
+    def _user_info(user):
+        """
+        Récupère les informations de l'utilisateur à joindre au résultat
+        """
+        return {
+            "id": user.id,
+            "username": user.username if user.username else None,
+            "first_name": user.first_name if user.first_name else None,
+            "last_name": user.last_name if user.last_name else None,
+            "last_login": user.last_login.isoformat() if user.last_login else None,
+        }
+
     @staticmethod
     def _format_time(seconds):
         """
@@ -146,6 +422,575 @@ class TestResult(APIView):
             remaining_seconds = seconds % 60
             return f"{hours}h {minutes}m {remaining_seconds:.1f}s"
 
+class TestSuiteRun(TestResult):
+    """
+    Exécute une batterie enregistrée : ses tests sont les clés de ses TestCase (paramètres par
+    défaut). La séquence et le mode d'arrêt sont fournis comme pour /run-tests. Le plan de la
+    batterie et son estimation de coût sont lus depuis le cache (voir SuitePlan).
+    """
+
+    def post(self, request, pk):
+        try:
+            start_time = time.time()
+
+            with self.timer.span("ingest"):
+                data, files = request.data, request.FILES
+            with self.timer.span("validate"):
+                plan = SuitePlan.get(pk)
+                on_failure, failure_threshold = self._read_failure_mode(data)
+            with self.timer.span("decode"):
+                bit_sequence = self._read_sequence(data, files, request.user)
+            with self.timer.span("plan"):
+                cost_model = TestCostModel.load_cached(settings.TEST_COST_MODEL_PATH)
+                estimate = SuitePlan.estimate(plan, len(bit_sequence), settings.TEST_PARALLEL_WORKERS, cost_model)
+
+            result = self._execute(request.user, plan["test_list"], bit_sequence, cost_model,
+                                   on_failure, failure_threshold, start_time, estimate)
+            return Response({**result, "test_suite": {"id": plan["suite"], "name": plan["name"]}})
+
+        except TestSuite.DoesNotExist as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except AdmissionRejected as e:
+            return Response({"error": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS,
+                            headers={"Retry-After": str(e.retry_after)})
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            AuditMetrics.inc("audit_runs_total", outcome="error")
+            return Response({
+                "error": f"Erreur lors de l'exécution des tests: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class TestCatalog(APIView):
+    """
+    Liste les tests disponibles et leurs métadonnées (longueur minimale, paramètres acceptés...)
+    """
+
+    def get(self, request):
+        return Response(describe_tests())
+
+
+class TestRunEstimate(APIView):
+    """
+    Estime la durée d'une exécution sans lancer les tests, pour choisir
+    entre /run-tests et /run-tests/async
+    """
+    parser_classes = [JSONParser]
+
+    def post(self, request):
+        try:
+            test_list = TestResult._read_test_list(request.data)
+            sequence_length = int(request.data.get("sequence_length", 0))
+            if sequence_length <= 0:
+                raise ValueError("Le champ 'sequence_length' est requis et doit être positif.")
+        except (TypeError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        cost_model = TestCostModel.load_cached(settings.TEST_COST_MODEL_PATH)
+        plan = plan_request(test_list, sequence_length, settings.TEST_PARALLEL_WORKERS, cost_model)
+
+        return Response({
+            "sequence_length": sequence_length,
+            "order": plan["order"],
+            "rejected": plan["rejected"],
+            "workers": plan["workers"],
+            "predicted_duration": plan["predicted_duration"],
+            "cpu_cost": plan["cpu_cost"],
+            "memory_cost": AdmissionController.memory_cost(sequence_length, plan["workers"]),
+        })
+
+
+class WindowedTestResult(APIView):
+    """
+    Audit localisé : p-values des tests de fréquence, de runs et de somme cumulative
+    sur des fenêtres fixes (step = window_size) ou glissantes de la séquence
+    """
+    parser_classes = [MultiPartParser, JSONParser]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        try:
+            start_time = time.time()
+
+            test_list = request.data.get("test_list") or None
+            if isinstance(test_list, str):
+                test_list = json.loads(test_list)
+            audit = windowed_audit(request.data.get("window_size"), request.data.get("step"), test_list)
+            bit_sequence = TestResult._read_sequence(request.data, request.FILES, request.user)
+            sequence_length = len(bit_sequence)
+            cpu_cost = audit.estimate(sequence_length)
+
+            with AdmissionController.admit(request.user.pk, cpu_cost,
+                                           AdmissionController.memory_cost(
+                                               sequence_length, 1, isinstance(bit_sequence, PackedSequence)),
+                                           predicted_duration=cpu_cost):
+                result = get_process_pool(settings.TEST_PARALLEL_WORKERS).submit(
+                    run_windowed_audit, audit, bit_sequence).result()
+
+            result["duration"] = TestResult._format_time(time.time() - start_time)
+            return Response(result)
+
+        except AdmissionRejected as e:
+            return Response({"error": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS,
+                            headers={"Retry-After": str(e.retry_after)})
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({
+                "error": f"Erreur lors de l'exécution des tests: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class TestBatchResult(APIView):
+    """
+    Exécute la même batterie sur plusieurs séquences en une requête.
+
+    Les séquences sont envoyées comme fichiers multiples ('bit_files', champ 'encoding' :
+    'bits' pour du texte 0/1, 'bytes' pour du binaire compact) ou dans un conteneur binaire
+    (application/octet-stream, voir SequenceBatchParser; options dans la chaîne de requête).
+    La réponse contient un bloc de résultats par séquence, dans l'ordre d'envoi.
+    """
+    parser_classes = [MultiPartParser, SequenceBatchParser]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        try:
+            start_time = time.time()
+
+            sequences, names = self._read_sequences(request)
+            # Le corps du conteneur binaire ne porte que les séquences
+            options = request.data if names is not None else request.query_params
+            test_list = TestResult._read_test_list(options)
+            on_failure, failure_threshold = TestResult._read_failure_mode(options)
+            cost_model = TestCostModel.load_cached(settings.TEST_COST_MODEL_PATH)
+
+            admission = self._admission_request(request.user, test_list, sequences, cost_model)
+            with AdmissionController.admit(**admission):
+                blocks = run_tests_batch(
+                    test_list, sequences,
+                    max_workers=settings.TEST_PARALLEL_WORKERS,
+                    cost_model=cost_model,
+                    executor=get_process_pool(settings.TEST_PARALLEL_WORKERS),
+                    on_failure=on_failure,
+                    failure_threshold=failure_threshold,
+                )
+
+            # Les séquences d'un lot dont le processus a échoué ne sont ni enregistrées ni comptées comme terminées
+            completed = [index for index, block in enumerate(blocks) if "error" not in block]
+            executions = [(AuditHistory.sequence_hash(sequences[index][0]), sequences[index][1],
+                           blocks[index]["results"], blocks[index]["stopped_by"]) for index in completed]
+            audit_ids = dict(zip(completed, AuditHistory.record(request.user, test_list, executions)))
+            AuditMetrics.observe_runs(test_list, executions)
+            failed = len(blocks) - len(completed)
+            if failed:
+                AuditMetrics.inc("audit_runs_total", failed, outcome="error")
+            for index, block in enumerate(blocks):
+                block["index"] = index
+                block["audit_id"] = audit_ids.get(index)
+                if names is not None:
+                    block["name"] = names[index]
+
+            # Échec partiel : 207, le détail est dans le bloc de chaque séquence ('error')
+            return Response({
+                "sequences": blocks,
+                "count": len(blocks),
+                "failed": failed,
+                "duration": TestResult._format_time(time.time() - start_time),
+                "predicted_duration": TestResult._format_time(admission["predicted_duration"]),
+                "user_info": TestResult._user_info(request.user)
+            }, status=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_200_OK)
+
+        except AdmissionRejected as e:
+            return Response({"error": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS,
+                            headers={"Retry-After": str(e.retry_after)})
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            AuditMetrics.inc("audit_runs_total", outcome="error")
+            return Response({
+                "error": f"Erreur lors de l'exécution des tests: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    def _read_sequences(request):
+        """
+        Lit les séquences du lot
+
+        Returns:
+            tuple: (liste de (octets compacts, longueur en bits), noms des fichiers ou None pour le conteneur)
+        """
+        if request.content_type.startswith(SequenceBatchParser.media_type):
+            sequences, names = request.data["sequences"], None
+        else:
+            files = request.FILES.getlist("bit_files")
+            encoding = request.data.get("encoding") or "bits"
+            if encoding not in ("bits", "bytes"):
+                raise ValueError("Le champ 'encoding' doit valoir 'bits' ou 'bytes'.")
+            if len(files) > settings.AUDIT_BATCH_MAX_SEQUENCES:
+                raise ValueError(f"Le lot dépasse la limite de {settings.AUDIT_BATCH_MAX_SEQUENCES} séquences.")
+            sequences = [TestBatchResult._read_file(bit_file, encoding) for bit_file in files]
+            names = [bit_file.name for bit_file in files]
+            if sum(length for _, length in sequences) > settings.AUDIT_BATCH_MAX_BITS:
+                raise ValueError(f"Le lot dépasse la limite de {settings.AUDIT_BATCH_MAX_BITS} bits au total.")
+
+        if not sequences:
+            raise ValueError("Veuillez fournir au moins une séquence ('bit_files' ou conteneur binaire).")
+        return sequences, names
+
+    @staticmethod
+    def _read_file(bit_file, encoding):
+        """Séquence d'un fichier du lot, sous forme compacte"""
+        content = bit_file.read()
+        if encoding == "bytes":
+            packed, length = content, 8 * len(content)
+        else:
+            raw = np.frombuffer(content, dtype=np.uint8)
+            bits = raw[(raw == ord("0")) | (raw == ord("1"))] - ord("0")
+            packed, length = np.packbits(bits).tobytes(), len(bits)
+        if length == 0:
+            raise ValueError(f"Le fichier '{bit_file.name}' ne contient aucun bit.")
+        return packed, length
+
+    @staticmethod
+    def _admission_request(user, test_list, sequences, cost_model):
+        """
+        Coûts prévus du lot : somme des coûts de la batterie sur chaque séquence, mémoire
+        du lot compact et des séquences en cours de décodage dans les processus
+        """
+        cpu_by_length = {}
+        for _, length in sequences:
+            if length not in cpu_by_length:
+                cpu_by_length[length] = plan_request(test_list, length, 1, cost_model)["cpu_cost"]
+        cpu_cost = sum(cpu_by_length[length] for _, length in sequences)
+        workers = min(settings.TEST_PARALLEL_WORKERS, len(sequences))
+        total_bits = sum(length for _, length in sequences)
+        return {
+            "user_id": user.pk,
+            "cpu_cost": cpu_cost,
+            "memory_cost": total_bits // 8 + AdmissionController.memory_cost(
+                max(length for _, length in sequences), workers),
+            "predicted_duration": cpu_cost / workers,
+        }
+
+
+class TestResultAsync(View):
+    """
+    Variante asynchrone de /run-tests pour le serveur ASGI.
+
+    Le corps de la requête est reçu de façon asynchrone par le serveur, puis les tests
+    sont attendus depuis le pool de processus partagé : aucun thread n'est bloqué
+    pendant le calcul. Si le client se déconnecte, les tests en attente sont annulés.
+    """
+
+    # Taille des morceaux lus sur le flux de la requête (octets)
+    BODY_CHUNK_SIZE = 64 * 1024
+
+    async def post(self, request):
+        try:
+            start_time = time.time()
+
+            user = await self._authenticate(request)
+            if user is None:
+                return self._json_response({"detail": "Informations d'authentification non fournies."},
+                                           status_code=status.HTTP_401_UNAUTHORIZED)
+
+            data, files = await self._parse_body(request)
+            test_list = TestResult._read_test_list(data)
+            on_failure, failure_threshold = TestResult._read_failure_mode(data)
+            bit_sequence = await sync_to_async(TestResult._read_sequence)(data, files, user)
+
+            executor = get_process_pool(settings.TEST_PARALLEL_WORKERS)
+            cost_model = TestCostModel.load_cached(settings.TEST_COST_MODEL_PATH)
+
+            # L'attente d'admission se fait dans un thread pour ne pas bloquer la boucle d'événements
+            admission = TestResult._admission_request(user, test_list, len(bit_sequence), cost_model,
+                                                      packed=isinstance(bit_sequence, PackedSequence))
+            cancel = threading.Event()
+            try:
+                ticket = await sync_to_async(AdmissionController.acquire, thread_sensitive=False)(
+                    **admission, cancel=cancel)
+            except asyncio.CancelledError:
+                # Déconnexion pendant l'attente : le ticket est retiré de la file, ou rendu s'il
+                # vient d'être admis, même si le thread d'attente n'a pas encore rendu la main
+                AdmissionController.cancel(cancel)
+                raise
+            try:
+                execution = await run_tests_async(test_list, bit_sequence, executor, cost_model,
+                                                  on_failure=on_failure, failure_threshold=failure_threshold)
+            finally:
+                AdmissionController.release(ticket)
+
+            executions = [(AuditHistory.sequence_hash(bit_sequence), len(bit_sequence), execution["results"],
+                           execution["stopped_by"])]
+            audit_id, = await sync_to_async(AuditHistory.record)(user, test_list, executions)
+            AuditMetrics.observe_runs(test_list, executions)
+            duration = time.time() - start_time
+
+            return self._json_response({
+                "results": execution["results"],
+                "count": execution["count"],
+                "sequence_length": len(bit_sequence),
+                "duration": TestResult._format_time(duration),
+                "stopped_by": execution["stopped_by"],
+                "audit_id": audit_id,
+                "user_info": TestResult._user_info(user)
+            })
+
+        except AuthenticationFailed as e:
+            return self._json_response({"detail": str(e.detail)}, status_code=status.HTTP_401_UNAUTHORIZED)
+        except AdmissionRejected as e:
+            response = self._json_response({"error": str(e)}, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
+            response["Retry-After"] = str(e.retry_after)
+            return response
+        except ValueError as e:
+            return self._json_response({"error": str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            AuditMetrics.inc("audit_runs_total", outcome="error")
+            return self._json_response({
+                "error": f"Erreur lors de l'exécution des tests: {str(e)}"},
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    async def _authenticate(request):
+        """Authentification par jeton, identique à celle des vues DRF"""
+        result = await sync_to_async(CachedTokenAuthentication().authenticate)(request)
+        return result[0] if result else None
+
+    @staticmethod
+    async def _body_chunks(request):
+        """
+        Itère de façon asynchrone sur le corps de la requête, par morceaux
+
+        Le serveur ASGI reçoit le corps sans bloquer de thread et le place dans un fichier
+        temporaire (en mémoire ou sur disque); chaque morceau y est lu hors de la boucle d'événements.
+        """
+        read = sync_to_async(request.read, thread_sensitive=False)
+        while chunk := await read(TestResultAsync.BODY_CHUNK_SIZE):
+            yield chunk
+
+    @staticmethod
+    async def _parse_body(request):
+        """
+        Décode le corps JSON ou multipart de la requête
+
+        Un corps JSON est lu par morceaux depuis le flux de la requête, dans la limite de
+        DATA_UPLOAD_MAX_MEMORY_SIZE. Un formulaire multipart est décodé en flux par le parseur
+        de Django (fichiers écrits sur disque au-delà de FILE_UPLOAD_MAX_MEMORY_SIZE).
+        """
+        if request.content_type == "application/json":
+            body = bytearray()
+            async for chunk in TestResultAsync._body_chunks(request):
+                body += chunk
+                if settings.DATA_UPLOAD_MAX_MEMORY_SIZE is not None and len(body) > settings.DATA_UPLOAD_MAX_MEMORY_SIZE:
+                    raise ValueError("Le corps de la requête est trop volumineux.")
+            try:
+                return json.loads(body or b"{}"), {}
+            except json.JSONDecodeError as e:
+                raise ValueError(f"JSON invalide: {e}")
+        return await sync_to_async(lambda: (request.POST, request.FILES), thread_sensitive=False)()
+
+    @staticmethod
+    def _json_response(data, status_code=status.HTTP_200_OK):
+        return JsonResponse(data, status=status_code, encoder=JSONEncoder, json_dumps_params={"ensure_ascii": False})
+
+
+class SequenceUploadCreate(APIView):
+    """
+    Démarre un téléversement par morceaux d'une séquence de bits
+    """
+    parser_classes = [JSONParser]
+
+    def post(self, request):
+        serializer = SequenceUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.save(owner=request.user)
+        return Response(SequenceUploadSerializer(upload).data, status=status.HTTP_201_CREATED)
+
+
+class SequenceUploadDetail(APIView):
+    """
+    Consulte la position de reprise (GET) ou ajoute un morceau à cette position (PATCH).
+
+    Le corps du PATCH est lu en flux directement depuis la requête et écrit sur le disque;
+    la position attendue est transmise dans l'en-tête 'Upload-Offset'.
+    """
+    # Aucun parser : le corps n'est jamais chargé entièrement en mémoire
+    parser_classes = []
+
+    def get(self, request, pk):
+        upload = get_object_or_404(SequenceUpload, pk=pk, owner=request.user)
+        return Response(SequenceUploadSerializer(upload).data, headers={"Upload-Offset": str(upload.received_bytes)})
+
+    def patch(self, request, pk):
+        with ChunkedUploadWriter.lock_for(pk):
+            upload = get_object_or_404(SequenceUpload, pk=pk, owner=request.user)
+            if upload.status != 'uploading':
+                return Response({"error": "Ce téléversement est déjà finalisé."}, status=status.HTTP_409_CONFLICT)
+
+            try:
+                offset = int(request.headers.get("Upload-Offset", ""))
+            except ValueError:
+                return Response({"error": "L'en-tête 'Upload-Offset' est requis."},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+            if offset != upload.received_bytes:
+                # Le client doit reprendre exactement là où le serveur s'est arrêté
+                return Response({"error": f"Position invalide: attendu {upload.received_bytes}, reçu {offset}."},
+                                status=status.HTTP_409_CONFLICT,
+                                headers={"Upload-Offset": str(upload.received_bytes)})
+
+            if request.stream is not None:
+                ChunkedUploadWriter(upload).append(request.stream)
+            return Response(SequenceUploadSerializer(upload).data, headers={"Upload-Offset": str(upload.received_bytes)})
+
+    def delete(self, request, pk):
+        with ChunkedUploadWriter.lock_for(pk):
+            upload = get_object_or_404(SequenceUpload, pk=pk, owner=request.user)
+            ChunkedUploadWriter.discard(upload)
+            upload.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class SequenceUploadFinalize(APIView):
+    """
+    Termine un téléversement. Si la même séquence a déjà été téléversée par l'utilisateur,
+    l'id existant est retourné et la copie est supprimée.
+
+    Sinon, la séquence est comparée à l'index des ancres des séquences précédentes de
+    l'utilisateur : les longs segments communs (graine réutilisée) sont signalés dans 'seed_reuse'.
+    """
+
+    def post(self, request, pk):
+        with ChunkedUploadWriter.lock_for(pk):
+            upload = get_object_or_404(SequenceUpload, pk=pk, owner=request.user)
+            if upload.status == 'complete':
+                return Response(SequenceUploadSerializer(upload).data)
+            if upload.bit_length == 0 and not upload.pending_bits:
+                return Response({"error": "Aucune donnée reçue pour ce téléversement."},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+            sha256 = ChunkedUploadWriter(upload).finalize()
+
+            existing = SequenceUpload.objects.filter(
+                owner=request.user, status='complete', sha256=sha256, bit_length=upload.bit_length
+            ).exclude(pk=upload.pk).order_by('created_at').first()
+            if existing is not None:
+                ChunkedUploadWriter.discard(upload)
+                upload.delete()
+                return Response({**SequenceUploadSerializer(existing).data, "deduplicated": True})
+
+            seed_reuse = FingerprintIndex.index(upload)
+            return Response({**SequenceUploadSerializer(upload).data, "deduplicated": False, "seed_reuse": seed_reuse})
+
+
+class AuditRunList(generics.ListAPIView):
+    """
+    Historique des exécutions complètes de l'utilisateur, de la plus récente à la plus ancienne
+    (pagination par curseur). Filtre optionnel : 'sha256' (séquence auditée).
+    """
+    serializer_class = AuditRunSerializer
+    pagination_class = AuditRunPagination
+
+    def get_queryset(self):
+        runs = AuditRun.objects.filter(owner=self.request.user)
+        sha256 = self.request.query_params.get("sha256")
+        if sha256:
+            runs = runs.filter(sequence_sha256=sha256)
+        return runs
+
+
+class AuditRunDetail(generics.RetrieveAPIView):
+    """
+    Exécution conservée avec les résultats de chacun de ses tests
+    """
+    serializer_class = AuditRunDetailSerializer
+
+    def get_queryset(self):
+        return AuditRun.objects.filter(owner=self.request.user).prefetch_related('results')
+
+
+class AuditPassRates(APIView):
+    """
+    Taux de réussite et p-value moyenne par test et par période ('day', 'week' ou 'month'),
+    calculés en une requête SQL. Filtres optionnels : 'test' (répétable), 'since', 'until' (ISO 8601).
+    """
+
+    def get(self, request):
+        try:
+            period = request.query_params.get("period") or "day"
+            series = AuditHistory.pass_rates(
+                request.user, period,
+                test_keys=request.query_params.getlist("test") or None,
+                since=self._read_date(request.query_params, "since"),
+                until=self._read_date(request.query_params, "until"),
+            )
+            return Response({"period": period, "series": series, "count": len(series)})
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    @staticmethod
+    def _read_date(data, field):
+        """Date ou date et heure ISO 8601 (None si le champ est absent)"""
+        value = data.get(field)
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None and parse_date(value) is not None:
+            parsed = datetime.datetime.combine(parse_date(value), datetime.time.min)
+        if parsed is None:
+            raise ValueError(f"Le champ '{field}' doit être une date ISO 8601.")
+        return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+
+
+class CacheStats(APIView):
+    """
+    Taille, version et taux de succès des caches en mémoire de ce processus serveur
+    (jetons, plans des batteries, ...), réservé aux administrateurs
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(VersionedCache.snapshot())
+
+
+class MetricsView(APIView):
+    """
+    Métriques du moteur d'audit au format d'exposition Prometheus (voir AuditMetrics).
+
+    Sans authentification, pour le collecteur : l'accès est à restreindre au niveau du
+    répartiteur de charge ou du proxy.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        pool = pool_status() or {"workers": settings.TEST_PARALLEL_WORKERS, "pending": 0}
+        admission = AdmissionController.snapshot()
+        caches = VersionedCache.snapshot()
+
+        def by_cache(field):
+            return {(("cache", name),): stats[field] for name, stats in caches.items()}
+
+        collected = [
+            ("audit_pool_workers", "gauge", "Processus du pool de calcul", {(): pool["workers"]}),
+            ("audit_pool_queue_depth", "gauge", "Tâches soumises au pool en attente d'un processus",
+             {(): max(0, pool["pending"] - pool["workers"])}),
+            ("audit_pool_tasks_in_flight", "gauge", "Tâches soumises au pool non terminées", {(): pool["pending"]}),
+            ("audit_worker_utilisation", "gauge", "Part des processus du pool occupés (0 à 1)",
+             {(): min(pool["pending"], pool["workers"]) / pool["workers"] if pool["workers"] else None}),
+            ("audit_admission_running", "gauge", "Exécutions admises en cours", {(): admission["running"]}),
+            ("audit_admission_waiting", "gauge", "Exécutions en attente d'admission", {(): admission["waiting"]}),
+            ("audit_admission_cpu_in_use", "gauge", "Secondes-CPU prévues des exécutions en cours",
+             {(): admission["cpu_in_use"]}),
+            ("audit_cache_hits_total", "counter", "Lectures servies par les caches en mémoire", by_cache("hits")),
+            ("audit_cache_misses_total", "counter", "Lectures non servies par les caches en mémoire", by_cache("misses")),
+            ("audit_cache_hit_ratio", "gauge", "Taux de succès des caches en mémoire", by_cache("hit_ratio")),
+            ("audit_cache_entries", "gauge", "Entrées des caches en mémoire", by_cache("size")),
+        ]
+        return HttpResponse(AuditMetrics.render(collected), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 class UserCreateView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserCreateSerializer
@@ -156,11 +156,41 @@ CORS_ALLOW_HEADERS = [
 # Configuration pour les tests parallèles
 TEST_PARALLEL_WORKERS = min(multiprocessing.cpu_count(), 6)  # Ajustez selon vos besoins
 TEST_TIMEOUT = 300  # Timeout global en secondes
+AUDIT_PREVIEW_TIME_BUDGET = 0.5  # Durée visée du mode aperçu de /run-tests (secondes)
+AUDIT_BATCH_MAX_SEQUENCES = 10000  # Séquences par requête /run-tests/batch
+AUDIT_BATCH_MAX_BITS = 1 << 31  # Bits au total par requête /run-tests/batch
+
+# Contrôle d'admission de /run-tests (coûts prévus par le modèle de coût)
+AUDIT_ADMISSION_CPU_BUDGET = TEST_PARALLEL_WORKERS * 120  # Secondes-CPU prévues en cours d'exécution simultanément
+AUDIT_ADMISSION_MEMORY_BUDGET = 4 * 1024 ** 3  # Octets
+AUDIT_USER_CPU_BUDGET = AUDIT_ADMISSION_CPU_BUDGET / 2  # Part maximale d'un utilisateur (jeton)
+AUDIT_USER_MAX_ACTIVE = 2  # Exécutions simultanées par utilisateur
+AUDIT_ADMISSION_QUEUE_TIMEOUT = 30  # Attente maximale dans la file avant une réponse 429 (secondes)
+AUDIT_ADMISSION_MAX_QUEUE = 32  # Requêtes en attente au-delà desquelles les suivantes sont refusées
+
+# Caches en mémoire du processus (plans des batteries, ...), invalidés par les signaux des modèles
+AUDIT_CACHE_TTL = 60  # Durée de vie maximale d'une entrée (secondes), borne la péremption entre processus
+AUDIT_CACHE_MAX_ENTRIES = 4096
+AUDIT_TOKEN_CACHE_TTL = 30  # Durée de vie d'un jeton authentifié en cache (secondes)
+
+# Modèle de coût des tests, calibré avec `python manage.py calibrate_cost_model`
+TEST_COST_MODEL_PATH = BASE_DIR / 'cost_model.json'
+
+# Racine des fichiers binaires compacts référencés par 'bit_path' dans /run-tests.
+# None désactive les références de fichiers côté serveur (ex: BASE_DIR / 'data')
+AUDIT_DATA_ROOT = None
+
+# Répertoire de stockage des séquences téléversées par morceaux (/uploads)
+AUDIT_UPLOAD_ROOT = BASE_DIR / 'uploads'
+
+# Index des ancres des séquences téléversées (détection de réutilisation de graine)
+AUDIT_FINGERPRINT_ANCHORS_PER_MB = 256  # Ancres conservées par Mo de séquence compacte
+AUDIT_SEED_REUSE_MIN_BITS = 4096  # Longueur minimale d'un segment commun signalé (bits)
 
 # Ajout de la configuration REST_FRAMEWORK pour TokenAuthentication
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'api.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -0,0 +1,350 @@
+import math
+
+import numpy as np
+
+from testsuite.attack.output_words import OutputWords
+from testsuite.test_utils.response import TestResponse
+
+
+class LinearWord:
+    """
+    Mot de `width` bits dont chaque bit est une forme linéaire sur GF(2) des bits de l'état initial.
+
+    Le bit i du mot est la ligne rows[i] : un vecteur de bits compacté en uint64 (variable v au
+    bit v % 64 du mot v // 64). Les opérations ^, <<, >> et & (masque constant) agissent sur les
+    lignes comme sur les bits d'un entier : une fonction d'étape écrite avec ces seules
+    opérations s'exécute aussi bien sur des entiers numpy que symboliquement.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @staticmethod
+    def variables(index, width, state_bits):
+        """Mot d'état numéro `index` : ses bits sont les variables index·width .. index·width + width - 1"""
+        rows = np.zeros((width, math.ceil(state_bits / 64)), dtype=np.uint64)
+        variables = index * width + np.arange(width)
+        rows[np.arange(width), variables // 64] = np.uint64(1) << (variables % 64).astype(np.uint64)
+        return LinearWord(rows)
+
+    def __xor__(self, other):
+        return LinearWord(self.rows ^ other.rows)
+
+    def __lshift__(self, count):
+        rows = np.zeros_like(self.rows)
+        rows[count:] = self.rows[:len(rows) - count]
+        return LinearWord(rows)
+
+    def __rshift__(self, count):
+        rows = np.zeros_like(self.rows)
+        rows[:len(rows) - count] = self.rows[count:]
+        return LinearWord(rows)
+
+    def __and__(self, mask):
+        keep = (mask >> np.arange(len(self.rows), dtype=np.uint64)) & np.uint64(1)
+        return LinearWord(np.where(keep[:, None].astype(bool), self.rows, np.uint64(0)))
+
+
+class LinearGenerators:
+    """
+    Générateurs linéaires sur GF(2) reconnus par l'attaque.
+
+    Chaque générateur déclare la taille de ses mots d'état, leur nombre, la taille de ses sorties
+    et une fonction d'étape (état) -> (nouvel état, sortie) n'utilisant que ^, <<, >> et & avec
+    une constante. Une sortie plus étroite que les mots d'état en garde les bits de poids faible.
+    """
+
+    @staticmethod
+    def xorshift32(state):
+        x, = state
+        x = x ^ (x << 13)
+        x = x ^ (x >> 17)
+        x = x ^ (x << 5)
+        return (x,), x
+
+    @staticmethod
+    def xorshift64(state):
+        x, = state
+        x = x ^ (x << 13)
+        x = x ^ (x >> 7)
+        x = x ^ (x << 17)
+        return (x,), x
+
+    @staticmethod
+    def xorshift64_high(state):
+        state, x = LinearGenerators.xorshift64(state)
+        return state, x >> 32
+
+    @staticmethod
+    def xorshift128(state):
+        x, y, z, w = state
+        t = x ^ (x << 11)
+        w_next = w ^ (w >> 19) ^ t ^ (t >> 8)
+        return (y, z, w, w_next), w_next
+
+    @staticmethod
+    def well512a(state):
+        # state[0] est le mot courant (index de l'implémentation de référence), l'état tourne
+        # d'un mot à chaque étape comme l'index décrémenté
+        a, c = state[0], state[13]
+        b = a ^ c ^ (a << 16) ^ (c << 15)
+        c = state[9]
+        c = c ^ (c >> 11)
+        a = b ^ c
+        d = a ^ ((a << 5) & 0xDA442D24)
+        z = state[15]
+        z = z ^ b ^ d ^ (z << 2) ^ (b << 18) ^ (c << 28)
+        return (z, a) + tuple(state[1:15]), z
+
+    # nom: (taille des mots d'état, nombre de mots, taille des sorties, fonction d'étape)
+    FAMILIES = {
+        'xorshift32': (32, 1, 32, xorshift32),
+        'xorshift64': (64, 1, 64, xorshift64),
+        'xorshift64 (32 bits de poids fort)': (64, 1, 32, xorshift64_high),
+        'xorshift128': (32, 4, 32, xorshift128),
+        'WELL512a': (32, 16, 32, well512a),
+    }
+
+
+class Gf2LinearAttack:
+    """
+    Reconstruction de l'état d'un générateur linéaire sur GF(2) (xorshift, WELL...).
+
+    Chaque bit de sortie est une forme linéaire des bits de l'état initial : la fonction
+    d'étape est simulée symboliquement pour construire le système état -> sorties, résolu
+    par élimination de Gauss sur des lignes compactées en uint64 (réductions par XOR).
+    Tous les alignements des sorties sont résolus en une seule élimination (un second membre
+    par alignement) ; les équations en surnombre valident l'alignement.
+
+    La prédiction est ensuite vérifiée sur tout le flux : des voies indépendantes, démarrées
+    à intervalles réguliers grâce à la matrice de saut de l'état, sont simulées en parallèle.
+    """
+
+    # Sorties au-delà du nombre d'inconnues utilisées pour valider un alignement
+    VERIFY_WORDS = 16
+    # Nombre maximum de sorties vérifiées à la fois (voies × étapes)
+    CHUNK_WORDS = 1 << 22
+    # Nombre de sorties suivantes prédites renvoyées
+    PREDICTED_OUTPUTS = 5
+
+    @staticmethod
+    def symbolic_outputs(family, count):
+        """
+        Simule `count` étapes symboliquement à partir de l'état initial
+
+        Returns:
+            tuple: (lignes des bits de sortie, de forme (count · taille des sorties, mots compactés),
+                état symbolique final)
+        """
+        width, words, output_width, step = LinearGenerators.FAMILIES[family]
+        state = tuple(LinearWord.variables(i, width, width * words) for i in range(words))
+        rows = []
+        for _ in range(count):
+            state, output = step(state)
+            rows.append(output.rows[:output_width])
+        return np.concatenate(rows), state
+
+    @staticmethod
+    def eliminate(rows, right_hand_sides):
+        """
+        Élimination de Gauss-Jordan sur GF(2) de plusieurs systèmes de même matrice
+
+        Args:
+            rows (np.ndarray): Coefficients compactés (équations × mots uint64)
+            right_hand_sides (np.ndarray): Seconds membres compactés (équations × mots uint64),
+                un bit par système
+
+        Returns:
+            tuple: (systèmes compatibles (bool), solutions de chaque système (systèmes × variables compactées))
+        """
+        equations, packed = rows.shape
+        systems = right_hand_sides.shape[1] * 64
+        matrix = np.concatenate((rows, right_hand_sides), axis=1)
+        pivots = []
+        rank = 0
+        for variable in range(packed * 64):
+            word, bit = divmod(variable, 64)
+            column = ((matrix[rank:, word] >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+            if not column.any():
+                continue
+            pivot = rank + int(np.argmax(column))
+            matrix[[rank, pivot]] = matrix[[pivot, rank]]
+            reduce = ((matrix[:, word] >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+            reduce[rank] = False
+            matrix[reduce] ^= matrix[rank]
+            pivots.append(variable)
+            rank += 1
+            if rank == equations:
+                break
+
+        right_hand_sides = np.unpackbits(np.ascontiguousarray(matrix[:, packed:]).view(np.uint8),
+                                         axis=1, bitorder='little')
+        # Une équation réduite à 0 = 1 rend le système incompatible
+        consistent = ~right_hand_sides[rank:].any(axis=0)
+        # Variables libres fixées à 0 : chaque pivot prend la valeur du second membre de sa ligne
+        values = right_hand_sides[:rank]
+        solutions = np.zeros((systems, packed * 64), dtype=np.uint8)
+        solutions[:, pivots] = values.T
+        return consistent, np.packbits(solutions, axis=1, bitorder='little').view(np.uint64)
+
+    @staticmethod
+    def find_state(bit_sequence, family):
+        """
+        Cherche l'alignement des sorties et l'état initial d'un générateur
+
+        Returns:
+            tuple or None: (décalage, ordre des octets, état initial compacté), ou None
+        """
+        width, words, output_width, _ = LinearGenerators.FAMILIES[family]
+        count = math.ceil(width * words / output_width) + Gf2LinearAttack.VERIFY_WORDS
+        alignments = OutputWords.alignments(output_width)
+        outputs = [OutputWords.read(bit_sequence, offset, byteorder, output_width, 0, count)
+                   for offset, byteorder in alignments]
+        usable = [i for i, words_read in enumerate(outputs) if len(words_read) == count]
+        if not usable:
+            return None
+
+        rows, _ = Gf2LinearAttack.symbolic_outputs(family, count)
+        # Un second membre par alignement : le bit j de la sortie k est l'équation k·taille + j
+        observed = np.array([np.unpackbits(outputs[i].astype(f'<u{output_width // 8}').view(np.uint8),
+                                           bitorder='little') for i in usable])
+        right_hand_sides = np.packbits(np.ascontiguousarray(observed.T), axis=1, bitorder='little')
+        right_hand_sides = np.pad(right_hand_sides, ((0, 0), (0, (-right_hand_sides.shape[1]) % 8)))
+        consistent, solutions = Gf2LinearAttack.eliminate(rows, right_hand_sides.view(np.uint64))
+        for system in np.flatnonzero(consistent[:len(usable)]):
+            offset, byteorder = alignments[usable[system]]
+            return offset, byteorder, solutions[system]
+        return None
+
+    @staticmethod
+    def unpack_state(packed, family):
+        """Mots d'état (tableaux numpy, une valeur par voie) d'états compactés (voies × mots uint64)"""
+        width, words, _, _ = LinearGenerators.FAMILIES[family]
+        packed = np.atleast_2d(packed)
+        mask = np.uint64((1 << width) - 1)
+        return tuple(((packed[:, i * width // 64] >> np.uint64(i * width % 64)) & mask).astype(f'u{width // 8}')
+                     for i in range(words))
+
+    @staticmethod
+    def jump(matrix, packed):
+        """Applique une matrice d'état (lignes compactées) à un état compacté"""
+        bits = (np.bitwise_count(matrix & packed).sum(axis=1) & 1).astype(np.uint8)
+        bits = np.pad(bits, (0, len(packed) * 64 - len(bits)))
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    @staticmethod
+    def verify(bit_sequence, family, offset, byteorder, initial_state):
+        """
+        Vérifie la prédiction de chaque sortie sur tout le flux
+
+        Le flux est découpé en voies de `steps` sorties ; l'état au début de chaque voie est
+        obtenu par la matrice de saut de `steps` étapes, puis toutes les voies sont simulées
+        ensemble, une étape numpy par sortie de voie.
+
+        Returns:
+            tuple: (sorties vérifiées, sorties exactes, état après la dernière sortie)
+        """
+        width, words, output_width, step = LinearGenerators.FAMILIES[family]
+        total = OutputWords.count(bit_sequence, offset, output_width)
+        steps = int(min(4096, max(64, math.isqrt(total))))
+        _, jump_state = Gf2LinearAttack.symbolic_outputs(family, steps)
+        jump_matrix = np.concatenate([word.rows for word in jump_state])
+        output_mask = (1 << output_width) - 1
+        lanes_per_chunk = max(1, Gf2LinearAttack.CHUNK_WORDS // steps)
+        last_lane, last_step = divmod(total - 1, steps)
+
+        checked = matched = 0
+        final_state = None
+        lane_state = initial_state
+        for first_lane in range(0, math.ceil(total / steps), lanes_per_chunk):
+            expected = OutputWords.read(bit_sequence, offset, byteorder, output_width,
+                                        first_lane * steps, lanes_per_chunk * steps)
+            lanes = math.ceil(len(expected) / steps)
+            starts = []
+            for _ in range(lanes):
+                starts.append(lane_state)
+                lane_state = Gf2LinearAttack.jump(jump_matrix, lane_state)
+            state = Gf2LinearAttack.unpack_state(np.array(starts), family)
+
+            predicted = np.empty((steps, lanes), dtype=f'u{output_width // 8}')
+            for t in range(steps):
+                state, output = step(state)
+                predicted[t] = output & output_mask
+                if t == last_step and first_lane <= last_lane < first_lane + lanes:
+                    final_state = tuple(word[last_lane - first_lane:last_lane - first_lane + 1] for word in state)
+            predicted = predicted.T.ravel()[:len(expected)]
+            checked += len(expected)
+            matched += int((predicted == expected).sum())
+
+        return checked, matched, final_state
+
+    @staticmethod
+    def predict(family, state, count):
+        """Sorties suivant l'état `state` (mots d'état numpy d'une seule voie)"""
+        _, _, output_width, step = LinearGenerators.FAMILIES[family]
+        outputs = []
+        for _ in range(count):
+            state, output = step(state)
+            outputs.append(int(output[0]) & ((1 << output_width) - 1))
+        return outputs
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Recherche dans la séquence les sorties consécutives d'un générateur linéaire sur GF(2)
+        (xorshift, WELL512a...) et reconstruit son état interne.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+
+        Returns:
+            dict: 'attack_success' avec le générateur, l'alignement, la proportion de sorties
+                prédites et les sorties suivantes prédites, 'success' si aucun générateur n'est reconnu
+        """
+        response_handler = TestResponse("Reconstruction d'un générateur linéaire sur GF(2)")
+
+        try:
+            minimum = min(output_width * (math.ceil(width * words / output_width) + Gf2LinearAttack.VERIFY_WORDS)
+                          for width, words, output_width, _ in LinearGenerators.FAMILIES.values())
+            if len(bit_sequence) < minimum:
+                return response_handler.get_response(
+                    error=True,
+                    error_message=f"La séquence est trop courte (minimum {minimum} bits requis)"
+                )
+
+            for family in LinearGenerators.FAMILIES:
+                found = Gf2LinearAttack.find_state(bit_sequence, family)
+                if found is None:
+                    continue
+
+                offset, byteorder, initial_state = found
+                checked, matched, final_state = Gf2LinearAttack.verify(
+                    bit_sequence, family, offset, byteorder, initial_state)
+                predicted = Gf2LinearAttack.predict(family, final_state, Gf2LinearAttack.PREDICTED_OUTPUTS)
+                digits = LinearGenerators.FAMILIES[family][2] // 4
+
+                return response_handler.get_response(
+                    test_status='attack_success',
+                    additional_info={
+                        "Générateur": family,
+                        "Décalage (bits)": offset,
+                        "Ordre des octets": byteorder,
+                        "Sorties vérifiées": checked,
+                        "Proportion de sorties prédites": matched / checked if checked else 1.0,
+                        "Sorties suivantes prédites": [f"{output:0{digits}x}" for output in predicted],
+                    }
+                )
+
+            return response_handler.get_response(
+                test_status='success',
+                additional_info={
+                    "Méthode": "Système linéaire état -> sorties sur GF(2), élimination de Gauss compactée",
+                    "Générateurs testés": list(LinearGenerators.FAMILIES),
+                }
+            )
+
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
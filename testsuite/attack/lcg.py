@@ -0,0 +1,276 @@
+import math
+
+import numpy as np
+
+from testsuite.attack.output_words import OutputWords
+from testsuite.test_utils.response import TestResponse
+
+
+class LcgAttack:
+    """
+    Attaque des générateurs congruentiels linéaires x[k + 1] = (a·x[k] + c) mod m.
+
+    Sorties complètes (module, multiplicateur et incrément inconnus) : les différences
+    t[k] = x[k + 1] - x[k] vérifient t[k + 2]·t[k] - t[k + 1]² ≡ 0 (mod m), le module est
+    donc le PGCD de ces déterminants ; a et c s'en déduisent par inversion modulaire.
+
+    Sorties tronquées (java.util.Random, rand() de MSVC) : les paramètres sont connus mais
+    seuls les bits de poids fort de l'état sont publiés. Les bits cachés de l'état sont
+    retrouvés par recherche exhaustive vectorisée, filtrée par les sorties suivantes.
+
+    La prédiction est ensuite vérifiée sur tout le flux par arithmétique modulaire vectorisée.
+    """
+
+    # Tailles des sorties essayées pour les générateurs à sorties complètes
+    WORD_SIZES = (32, 64)
+    # Générateurs à sorties tronquées : seuls les bits shift .. shift + width de l'état sont publiés
+    TRUNCATED_GENERATORS = (
+        {"name": "java.util.Random", "modulus": 1 << 48, "multiplier": 0x5DEECE66D, "increment": 0xB,
+         "shift": 16, "width": 32, "output_bits": 32},
+        {"name": "rand() (MSVC)", "modulus": 1 << 32, "multiplier": 214013, "increment": 2531011,
+         "shift": 16, "width": 16, "output_bits": 15},
+    )
+
+    # Nombre de sorties utilisées pour retrouver les paramètres, puis pour valider un alignement
+    RECOVERY_WORDS = 12
+    VERIFY_WORDS = 16
+    # Mots traités à la fois lors de la vérification du flux complet
+    CHUNK_WORDS = 1 << 20
+    # Nombre de sorties suivantes prédites renvoyées
+    PREDICTED_OUTPUTS = 5
+
+    @staticmethod
+    def recover_parameters(words):
+        """
+        Module, multiplicateur et incrément d'un LCG à sorties complètes
+
+        Args:
+            words (list[int]): Sorties consécutives (entiers Python)
+
+        Returns:
+            tuple or None: (m, a, c), ou None si les sorties ne sont pas celles d'un LCG
+        """
+        t = [y - x for x, y in zip(words, words[1:])]
+        modulus = 0
+        for k in range(len(t) - 2):
+            modulus = math.gcd(modulus, t[k + 2] * t[k] - t[k + 1] * t[k + 1])
+        # Un module qui ne dépasse pas toutes les sorties ne peut pas les avoir produites
+        if modulus <= max(words):
+            return None
+        for k in range(len(t) - 1):
+            if math.gcd(t[k], modulus) == 1:
+                multiplier = t[k + 1] * pow(t[k], -1, modulus) % modulus
+                increment = (words[1] - multiplier * words[0]) % modulus
+                return modulus, multiplier, increment
+        return None
+
+    @staticmethod
+    def step(states, multiplier, increment, modulus):
+        """
+        États suivants (a·x + c) mod m d'un tableau d'états, sans dépassement
+
+        Les modules puissances de 2 (jusqu'à 2^64) utilisent le débordement naturel des uint64,
+        les modules jusqu'à 2^32 une réduction après produit, les autres des entiers Python.
+        """
+        if modulus & (modulus - 1) == 0 and modulus <= 1 << 64:
+            states = np.asarray(states, dtype=np.uint64)
+            return (states * np.uint64(multiplier % modulus) + np.uint64(increment % modulus)) \
+                & np.uint64(modulus - 1)
+        if modulus <= 1 << 32:
+            states = np.asarray(states, dtype=np.uint64)
+            return (states * np.uint64(multiplier) % np.uint64(modulus) + np.uint64(increment)) \
+                % np.uint64(modulus)
+        return (np.asarray(states, dtype=object) * multiplier + increment) % modulus
+
+    @staticmethod
+    def jump_table(multiplier, increment, modulus, count):
+        """
+        Coefficients (A[j], C[j]) tels que x[k + j] = A[j]·x[k] + C[j] (mod 2^e), j < count
+
+        Construits par doublements successifs : A[L + j] = A[j]·A[L], C[L + j] = A[j]·C[L] + C[j].
+        """
+        mask = np.uint64(modulus - 1)
+        a_table = np.ones(1, dtype=np.uint64)
+        c_table = np.zeros(1, dtype=np.uint64)
+        while len(a_table) < count:
+            a_next = (a_table[-1:] * np.uint64(multiplier)) & mask
+            c_next = (c_table[-1:] * np.uint64(multiplier) + np.uint64(increment)) & mask
+            c_table = np.concatenate((c_table, (a_table * c_next + c_table) & mask))
+            a_table = np.concatenate((a_table, (a_table * a_next) & mask))
+        return a_table[:count], c_table[:count]
+
+    @staticmethod
+    def find_full_output(bit_sequence):
+        """
+        Cherche un alignement dont les sorties complètes sont celles d'un LCG
+
+        Returns:
+            dict or None: Générateur reconnu (paramètres et alignement)
+        """
+        window = LcgAttack.RECOVERY_WORDS + LcgAttack.VERIFY_WORDS
+        for width in LcgAttack.WORD_SIZES:
+            for offset, byteorder in OutputWords.alignments(width):
+                words = OutputWords.read(bit_sequence, offset, byteorder, width, 0, window)
+                if len(words) < window:
+                    continue
+                parameters = LcgAttack.recover_parameters([int(word) for word in words[:LcgAttack.RECOVERY_WORDS]])
+                if parameters is None:
+                    continue
+                modulus, multiplier, increment = parameters
+                predicted = LcgAttack.step(words[:-1], multiplier, increment, modulus)
+                if (predicted == words[1:]).all():
+                    return {"name": "LCG", "modulus": modulus, "multiplier": multiplier, "increment": increment,
+                            "shift": 0, "width": width, "output_bits": width,
+                            "offset": offset, "byteorder": byteorder}
+        return None
+
+    @staticmethod
+    def find_truncated(bit_sequence):
+        """
+        Cherche un alignement dont les sorties sont celles d'un générateur tronqué connu
+
+        Returns:
+            dict or None: Générateur reconnu, avec l'état ayant produit la première sortie
+        """
+        for generator in LcgAttack.TRUNCATED_GENERATORS:
+            modulus, shift = generator["modulus"], generator["shift"]
+            output_mask = np.uint64((1 << generator["output_bits"]) - 1)
+            hidden_high = modulus.bit_length() - 1 - shift - generator["output_bits"]
+            # Bits cachés de l'état : les shift bits de poids faible et les bits au-dessus de la sortie
+            hidden = np.arange(1 << (shift + hidden_high), dtype=np.uint64)
+            hidden = ((hidden >> np.uint64(shift)) << np.uint64(shift + generator["output_bits"])) \
+                | (hidden & np.uint64((1 << shift) - 1))
+            for offset, byteorder in OutputWords.alignments(generator["width"]):
+                words = OutputWords.read(bit_sequence, offset, byteorder, generator["width"],
+                                         0, LcgAttack.VERIFY_WORDS).astype(np.uint64)
+                if len(words) < LcgAttack.VERIFY_WORDS or (words > output_mask).any():
+                    continue
+                states = hidden | (words[0] << np.uint64(shift))
+                candidates = states
+                for word in words[1:]:
+                    candidates = LcgAttack.step(candidates, generator["multiplier"], generator["increment"], modulus)
+                    keep = ((candidates >> np.uint64(shift)) & output_mask) == word
+                    candidates, states = candidates[keep], states[keep]
+                    if not len(states):
+                        break
+                if len(states):
+                    return dict(generator, offset=offset, byteorder=byteorder, state=int(states[0]))
+        return None
+
+    @staticmethod
+    def verify(bit_sequence, generator):
+        """
+        Vérifie la prédiction de chaque sortie à partir de la précédente sur tout le flux
+
+        Sorties complètes : x[k + 1] = (a·x[k] + c) mod m comparé à la sortie lue.
+        Sorties tronquées : les états de chaque morceau sont déduits de l'état initial
+        par la table de sauts, puis tronqués et comparés aux sorties lues.
+
+        Returns:
+            tuple: (prédictions vérifiées, prédictions exactes, dernier état)
+        """
+        offset, byteorder, width = generator["offset"], generator["byteorder"], generator["width"]
+        modulus, multiplier, increment = generator["modulus"], generator["multiplier"], generator["increment"]
+        total = OutputWords.count(bit_sequence, offset, width)
+        checked = matched = 0
+
+        if generator["shift"] == 0:
+            last_state = None
+            for first in range(0, max(1, total - 1), LcgAttack.CHUNK_WORDS):
+                words = OutputWords.read(bit_sequence, offset, byteorder, width, first, LcgAttack.CHUNK_WORDS + 1)
+                holds = LcgAttack.step(words[:-1], multiplier, increment, modulus) == words[1:]
+                checked += len(holds)
+                matched += int(holds.sum())
+                last_state = int(words[-1])
+            return checked, matched, last_state
+
+        shift = np.uint64(generator["shift"])
+        output_mask = np.uint64((1 << generator["output_bits"]) - 1)
+        a_table, c_table = LcgAttack.jump_table(multiplier, increment, modulus, LcgAttack.CHUNK_WORDS)
+        a_chunk = pow(multiplier, LcgAttack.CHUNK_WORDS, modulus)
+        c_chunk = (int(c_table[-1]) * multiplier + increment) % modulus
+        state = generator["state"]
+        states = np.zeros(1, dtype=np.uint64)
+        for first in range(0, total, LcgAttack.CHUNK_WORDS):
+            words = OutputWords.read(bit_sequence, offset, byteorder, width, first, LcgAttack.CHUNK_WORDS)
+            states = (a_table[:len(words)] * np.uint64(state) + c_table[:len(words)]) & np.uint64(modulus - 1)
+            holds = ((states >> shift) & output_mask) == words
+            # La première sortie a servi à reconstruire l'état : elle n'est pas une prédiction
+            if first == 0:
+                holds = holds[1:]
+            checked += len(holds)
+            matched += int(holds.sum())
+            state = (a_chunk * state + c_chunk) % modulus
+        return checked, matched, int(states[-1])
+
+    @staticmethod
+    def predict(generator, state, count):
+        """Sorties suivant l'état `state`"""
+        outputs = []
+        for _ in range(count):
+            state = (generator["multiplier"] * state + generator["increment"]) % generator["modulus"]
+            outputs.append((state >> generator["shift"]) & ((1 << generator["output_bits"]) - 1))
+        return outputs
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Recherche dans la séquence les sorties consécutives d'un générateur congruentiel linéaire
+        et en retrouve les paramètres.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+
+        Returns:
+            dict: 'attack_success' avec les paramètres, l'alignement, la proportion de sorties
+                prédites et les sorties suivantes prédites, 'success' si aucun LCG n'est reconnu
+        """
+        response_handler = TestResponse("Reconstruction des paramètres d'un LCG")
+
+        try:
+            minimum = 32 * (LcgAttack.RECOVERY_WORDS + LcgAttack.VERIFY_WORDS)
+            if len(bit_sequence) < minimum:
+                return response_handler.get_response(
+                    error=True,
+                    error_message=f"La séquence est trop courte (minimum {minimum} bits requis)"
+                )
+
+            generator = LcgAttack.find_full_output(bit_sequence) or LcgAttack.find_truncated(bit_sequence)
+            if generator is None:
+                return response_handler.get_response(
+                    test_status='success',
+                    additional_info={
+                        "Méthode": "PGCD des déterminants des différences successives (sorties complètes de "
+                                   f"{' ou '.join(str(width) for width in LcgAttack.WORD_SIZES)} bits), "
+                                   "recherche exhaustive des bits cachés (sorties tronquées)",
+                        "Générateurs tronqués testés": [g["name"] for g in LcgAttack.TRUNCATED_GENERATORS],
+                    }
+                )
+
+            checked, matched, last_state = LcgAttack.verify(bit_sequence, generator)
+            predicted = LcgAttack.predict(generator, last_state, LcgAttack.PREDICTED_OUTPUTS)
+            digits = (generator["output_bits"] + 3) // 4
+
+            return response_handler.get_response(
+                test_status='attack_success',
+                additional_info={
+                    "Générateur": generator["name"],
+                    "Module": generator["modulus"],
+                    "Multiplicateur": generator["multiplier"],
+                    "Incrément": generator["increment"],
+                    "Bits de l'état publiés": f"{generator['shift']} à "
+                                              f"{generator['shift'] + generator['output_bits'] - 1}",
+                    "Taille des sorties (bits)": generator["width"],
+                    "Décalage (bits)": generator["offset"],
+                    "Ordre des octets": generator["byteorder"],
+                    "Sorties vérifiées": checked,
+                    "Proportion de sorties prédites": matched / checked if checked else 1.0,
+                    "Sorties suivantes prédites": [f"{output:0{digits}x}" for output in predicted],
+                }
+            )
+
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
@@ -0,0 +1,175 @@
+import numpy as np
+
+from testsuite.attack.output_words import OutputWords
+from testsuite.test_utils.response import TestResponse
+
+
+class MersenneTwisterAttack:
+    """
+    Attaque par reconstruction de l'état de MT19937 (random de Python, RandomState de numpy...).
+
+    Chaque sortie de 32 bits est l'image d'un mot de l'état par une fonction de tempérage
+    inversible. Une fois les sorties « détempérées », le flux x vérifie la récurrence
+        x[k + 624] = x[k + 397] ^ twist(x[k], x[k + 1])
+    à toute position k : 624 sorties consécutives forment l'état interne, et la récurrence
+    vérifie la prédiction sur tout le reste du flux en un seul calcul vectorisé.
+    """
+
+    N = 624
+    M = 397
+    MATRIX_A = 0x9908B0DF
+    UPPER_MASK = 0x80000000
+    LOWER_MASK = 0x7FFFFFFF
+
+    # Nombre de prédictions vérifiées pour valider un alignement
+    VERIFY_WORDS = 32
+    # Mots traités à la fois lors de la vérification du flux complet
+    CHUNK_WORDS = 1 << 22
+    # Nombre de sorties suivantes prédites renvoyées
+    PREDICTED_OUTPUTS = 5
+
+    @staticmethod
+    def temper(y):
+        y = y ^ (y >> 11)
+        y = y ^ ((y << 7) & 0x9D2C5680)
+        y = y ^ ((y << 15) & 0xEFC60000)
+        return y ^ (y >> 18)
+
+    @staticmethod
+    def untemper(y):
+        """Inverse du tempérage, appliqué à un tableau de mots de 32 bits"""
+        y = np.asarray(y, dtype=np.uint32)
+        y = y ^ (y >> 18)
+        y = y ^ ((y << 15) & np.uint32(0xEFC60000))
+        result = y
+        for _ in range(4):
+            result = y ^ ((result << 7) & np.uint32(0x9D2C5680))
+        y = result
+        for _ in range(2):
+            result = y ^ (result >> 11)
+        return result
+
+    @staticmethod
+    def recurrence_holds(state):
+        """
+        Pour chaque k, vrai si le mot détempéré k + 624 est celui que prédit la récurrence de MT19937
+
+        Args:
+            state (np.ndarray): Sorties détempérées consécutives (uint32)
+
+        Returns:
+            np.ndarray: Tableau booléen de longueur len(state) - 624
+        """
+        count = len(state) - MersenneTwisterAttack.N
+        if count <= 0:
+            return np.zeros(0, dtype=bool)
+        return state[MersenneTwisterAttack.N:] == MersenneTwisterAttack._twist(state, count)
+
+    @staticmethod
+    def _twist(state, count):
+        """Mots k + 624 prédits à partir des mots k, k + 1 et k + 397, pour k < count"""
+        y = (state[:count] & np.uint32(MersenneTwisterAttack.UPPER_MASK)) | \
+            (state[1:count + 1] & np.uint32(MersenneTwisterAttack.LOWER_MASK))
+        magic = np.where(y & np.uint32(1), np.uint32(MersenneTwisterAttack.MATRIX_A), np.uint32(0))
+        return state[MersenneTwisterAttack.M:MersenneTwisterAttack.M + count] ^ (y >> np.uint32(1)) ^ magic
+
+    @staticmethod
+    def find_alignment(bit_sequence):
+        """
+        Cherche le décalage (0 à 31 bits) et l'ordre des octets des sorties de 32 bits
+
+        Returns:
+            tuple or None: (décalage, ordre des octets) du premier alignement dont les
+                VERIFY_WORDS premières prédictions sont exactes
+        """
+        window = MersenneTwisterAttack.N + MersenneTwisterAttack.VERIFY_WORDS
+        for offset, byteorder in OutputWords.alignments(32):
+            words = OutputWords.read(bit_sequence, offset, byteorder, 32, 0, window)
+            if len(words) < window:
+                continue
+            if MersenneTwisterAttack.recurrence_holds(MersenneTwisterAttack.untemper(words)).all():
+                return offset, byteorder
+        return None
+
+    @staticmethod
+    def verify(bit_sequence, offset, byteorder):
+        """
+        Vérifie la récurrence sur tout le flux, par morceaux recouvrants de 624 mots
+
+        Returns:
+            tuple: (prédictions vérifiées, prédictions exactes, 624 derniers mots détempérés)
+        """
+        total = OutputWords.count(bit_sequence, offset, 32)
+        checked = matched = 0
+        last_state = None
+        for first in range(0, max(1, total - MersenneTwisterAttack.N), MersenneTwisterAttack.CHUNK_WORDS):
+            words = OutputWords.read(bit_sequence, offset, byteorder, 32, first,
+                                     MersenneTwisterAttack.CHUNK_WORDS + MersenneTwisterAttack.N)
+            state = MersenneTwisterAttack.untemper(words)
+            holds = MersenneTwisterAttack.recurrence_holds(state)
+            checked += len(holds)
+            matched += int(holds.sum())
+            last_state = state[-MersenneTwisterAttack.N:]
+        return checked, matched, last_state
+
+    @staticmethod
+    def predict(state, count):
+        """Sorties (tempérées) suivant les 624 mots détempérés `state`"""
+        state = np.array(state, dtype=np.uint32)
+        for _ in range(count):
+            state = np.append(state, MersenneTwisterAttack._twist(state[-MersenneTwisterAttack.N:], 1))
+        return MersenneTwisterAttack.temper(state[-count:])
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Recherche dans la séquence des sorties consécutives de MT19937 et reconstruit son état interne.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+
+        Returns:
+            dict: 'attack_success' avec l'alignement, la proportion de sorties prédites et les
+                sorties suivantes prédites, 'success' si aucune sortie de MT19937 n'est reconnue
+        """
+        response_handler = TestResponse("Reconstruction de l'état de MT19937")
+
+        try:
+            minimum = 32 * (MersenneTwisterAttack.N + MersenneTwisterAttack.VERIFY_WORDS)
+            if len(bit_sequence) < minimum:
+                return response_handler.get_response(
+                    error=True,
+                    error_message=f"La séquence est trop courte (minimum {minimum} bits requis)"
+                )
+
+            alignment = MersenneTwisterAttack.find_alignment(bit_sequence)
+            if alignment is None:
+                return response_handler.get_response(
+                    test_status='success',
+                    additional_info={
+                        "Méthode": "Détempérage de 624 sorties de 32 bits et vérification de la récurrence de MT19937",
+                        "Alignements testés": 64,
+                    }
+                )
+
+            offset, byteorder = alignment
+            checked, matched, last_state = MersenneTwisterAttack.verify(bit_sequence, offset, byteorder)
+            predicted = MersenneTwisterAttack.predict(last_state, MersenneTwisterAttack.PREDICTED_OUTPUTS)
+
+            return response_handler.get_response(
+                test_status='attack_success',
+                additional_info={
+                    "Générateur": "MT19937",
+                    "Décalage (bits)": offset,
+                    "Ordre des octets": byteorder,
+                    "Sorties vérifiées": checked,
+                    "Proportion de sorties prédites": matched / checked if checked else 1.0,
+                    "Sorties suivantes prédites": [f"{int(word):08x}" for word in predicted],
+                }
+            )
+
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
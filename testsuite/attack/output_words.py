@@ -0,0 +1,50 @@
+import numpy as np
+
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+class OutputWords:
+    """
+    Lecture de la séquence comme une suite de sorties de `width` bits d'un générateur.
+
+    L'alignement des sorties est inconnu : les attaques essaient chaque décalage de
+    0 à width - 1 bits et les deux ordres d'octets (sorties écrites en gros ou petit boutiste).
+    """
+
+    BYTE_ORDERS = ('big', 'little')
+
+    @staticmethod
+    def alignments(width):
+        """Alignements possibles (décalage en bits, ordre des octets) de sorties de `width` bits"""
+        return [(offset, byteorder) for offset in range(width) for byteorder in OutputWords.BYTE_ORDERS]
+
+    @staticmethod
+    def count(bit_sequence, offset, width):
+        """Nombre de sorties complètes à partir du bit `offset`"""
+        return max(0, (len(bit_sequence) - offset) // width)
+
+    @staticmethod
+    def read(bit_sequence, offset, byteorder, width, first_word=0, count=None):
+        """
+        Sorties de `width` bits (16, 32 ou 64) lues à partir du bit `offset`
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+            offset (int): Décalage de la première sortie (bits)
+            byteorder (str): 'big' ou 'little'
+            width (int): Taille des sorties en bits
+            first_word (int): Indice de la première sortie lue
+            count (int, optional): Nombre maximum de sorties lues (défaut: toutes)
+
+        Returns:
+            np.ndarray: Sorties (entiers non signés de `width` bits)
+        """
+        available = OutputWords.count(bit_sequence, offset, width) - first_word
+        count = max(0, available if count is None else min(count, available))
+        start = offset + width * first_word
+        if isinstance(bit_sequence, PackedSequence):
+            bits = bit_sequence.bit_range(start, start + width * count)
+        else:
+            bits = np.asarray(bit_sequence[start:start + width * count], dtype=np.uint8)
+        dtype = ('>' if byteorder == 'big' else '<') + f'u{width // 8}'
+        return np.packbits(bits).view(dtype).astype(f'u{width // 8}')
@@ -0,0 +1,272 @@
+import heapq
+
+import numpy as np
+
+from testsuite.test_utils.packed_sequence import PackedSequence
+from testsuite.test_utils.response import TestResponse
+
+
+class RepetitionAttack:
+    """
+    Détection de la période et des longues répétitions exactes d'une séquence.
+
+    Un générateur de courte période ou mal initialisé répète son flux : les tests
+    statistiques peuvent réussir sur un long bloc répété. La séquence compacte est indexée
+    par des ancres : la fenêtre de 64 bits commençant à chaque position de bit est hachée,
+    et seule la position de plus petite empreinte de chaque bloc de `spacing` positions est
+    retenue (au plus MAX_ANCHORS ancres, quelle que soit la longueur de la séquence).
+    Deux copies d'une même région retiennent en grande partie les mêmes ancres : le tri des
+    ancres par valeur (O(n log n)) fait apparaître les distances de répétition candidates,
+    chacune vérifiée exactement par comparaison de la séquence avec elle-même décalée.
+    """
+
+    WINDOW_BITS = 64
+    # Nombre maximum d'ancres indexées (l'espacement des ancres augmente avec la longueur)
+    MAX_ANCHORS = 1 << 22
+    MIN_SPACING = 64
+    # Octets traités à la fois lors du calcul des ancres et des comparaisons
+    CHUNK_BYTES = 1 << 18
+    # Nombre maximum de distances candidates vérifiées
+    MAX_CANDIDATES = 8
+    # Nombre maximum de répétitions détaillées dans la réponse
+    MAX_REPORTED_REPEATS = 20
+    HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+    # Bits à 0 en tête (poids fort) et en queue (poids faible) de chaque octet
+    LEADING_ZEROS = np.array([8 - int(b).bit_length() for b in range(256)], dtype=np.int64)
+    TRAILING_ZEROS = np.array([8] + [(b & -b).bit_length() - 1 for b in range(1, 256)], dtype=np.int64)
+
+    @staticmethod
+    def packed_bytes(bit_sequence):
+        """Octets de la séquence (projection en mémoire pour une PackedSequence)"""
+        if isinstance(bit_sequence, PackedSequence):
+            return bit_sequence.packed()
+        return np.packbits(np.asarray(bit_sequence, dtype=np.uint8))
+
+    @staticmethod
+    def shifted_bytes(packed, first_byte, count, distance):
+        """
+        `count` octets de la séquence commençant au bit 8·first_byte + distance
+
+        Les octets au-delà de la fin de la séquence valent 0.
+        """
+        start = first_byte + distance // 8
+        source = np.zeros(count + 1, dtype=np.uint8)
+        available = np.asarray(packed[start:start + count + 1])
+        source[:len(available)] = available
+        shift = distance % 8
+        if shift == 0:
+            return source[:count]
+        return (source[:-1] << np.uint8(shift)) | (source[1:] >> np.uint8(8 - shift))
+
+    @staticmethod
+    def byte_words(packed, first_byte, count):
+        """
+        Mots de 64 bits commençant à chaque octet du morceau, et octet suivant chacun d'eux
+
+        La fenêtre commençant au bit 8·(first_byte + j) + r vaut (words[j] << r) | (following[j] >> (8 - r)).
+        """
+        source = RepetitionAttack.shifted_bytes(packed, first_byte, count + 8, 0)
+        words = np.empty(count, dtype=np.uint64)
+        # count est multiple de 8 : les mots commençant aux octets o, o + 8, o + 16... sont une simple vue
+        for offset in range(8):
+            words[offset::8] = source[offset:offset + count].view('>u8')
+        return words, source[8:8 + count].astype(np.uint64)
+
+    @staticmethod
+    def spacing(n):
+        """Espacement des ancres (puissance de 2) pour une séquence de n bits"""
+        spacing = RepetitionAttack.MIN_SPACING
+        while n // spacing > RepetitionAttack.MAX_ANCHORS:
+            spacing *= 2
+        return spacing
+
+    @staticmethod
+    def anchors(packed, n, spacing):
+        """
+        Ancres de la séquence : dans chaque bloc de `spacing` positions, la position dont la
+        fenêtre de 64 bits a la plus petite empreinte
+
+        Returns:
+            tuple: (positions des ancres, valeurs de leurs fenêtres)
+        """
+        last_position = n - RepetitionAttack.WINDOW_BITS
+        chunk_bytes = max(RepetitionAttack.CHUNK_BYTES, spacing // 8)
+        positions, values = [], []
+        for first_byte in range(0, last_position // 8 + 1, chunk_bytes):
+            words, following = RepetitionAttack.byte_words(packed, first_byte, chunk_bytes)
+            # Plus petite empreinte des 8 fenêtres commençant dans chaque octet
+            last_chunk = 8 * (first_byte + chunk_bytes) > last_position
+            if last_chunk:
+                last_bits = last_position - 8 * first_byte - 8 * np.arange(chunk_bytes)
+            best_hashes = np.full(chunk_bytes, np.iinfo(np.uint64).max, dtype=np.uint64)
+            best_shifts = np.zeros(chunk_bytes, dtype=np.uint64)
+            for shift in range(8):
+                hashes = words << np.uint64(shift)
+                hashes |= following >> np.uint64(8 - shift)
+                hashes *= RepetitionAttack.HASH_MULTIPLIER
+                # Seul le dernier morceau contient des fenêtres dépassant la fin de la séquence
+                if last_chunk:
+                    hashes[last_bits < shift] = np.iinfo(np.uint64).max
+                np.copyto(best_shifts, np.uint64(shift), where=hashes < best_hashes)
+                np.minimum(best_hashes, hashes, out=best_hashes)
+            # Puis plus petite empreinte des octets de chaque bloc de `spacing` positions
+            best = best_hashes.reshape(-1, spacing // 8).argmin(axis=1) + np.arange(0, chunk_bytes, spacing // 8)
+            if last_chunk:
+                best = best[last_bits[best] >= best_shifts[best].astype(np.int64)]
+            shifts = best_shifts[best]
+            positions.append(8 * (first_byte + best) + shifts.astype(np.int64))
+            values.append((words[best] << shifts) | (following[best] >> (np.uint64(8) - shifts)))
+        return np.concatenate(positions), np.concatenate(values)
+
+    @staticmethod
+    def candidate_distances(positions, values):
+        """
+        Distances entre ancres consécutives de même valeur, triées par nombre d'ancres concordantes
+
+        Returns:
+            list[tuple]: (distance, nombre d'ancres) pour au plus MAX_CANDIDATES distances
+                confirmées par au moins deux ancres
+        """
+        order = np.lexsort((positions, values))
+        same = values[order][1:] == values[order][:-1]
+        distances = (positions[order][1:] - positions[order][:-1])[same]
+        distances, support = np.unique(distances, return_counts=True)
+        best = np.argsort(-support, kind='stable')[:RepetitionAttack.MAX_CANDIDATES]
+        return [(int(distances[i]), int(support[i])) for i in best if support[i] >= 2]
+
+    @staticmethod
+    def differences(packed, n, distance, start=0):
+        """
+        Parcourt par morceaux les octets de s[i] XOR s[i + distance], pour i ≥ start (arrondi à l'octet)
+
+        Yields:
+            tuple: (indice du premier octet du morceau, octets de différences)
+        """
+        end = n - distance
+        last_byte = (end + 7) // 8
+        for first_byte in range(start // 8, last_byte, RepetitionAttack.CHUNK_BYTES):
+            count = min(RepetitionAttack.CHUNK_BYTES, last_byte - first_byte)
+            diff = RepetitionAttack.shifted_bytes(packed, first_byte, count, 0) ^ \
+                RepetitionAttack.shifted_bytes(packed, first_byte, count, distance)
+            if first_byte + count == last_byte and end % 8:
+                diff[-1] &= np.uint8((0xFF << (8 - end % 8)) & 0xFF)
+            yield first_byte, diff
+
+    @staticmethod
+    def matching_runs(packed, n, distance, min_length):
+        """
+        Plages maximales où la séquence coïncide avec elle-même décalée de `distance` bits
+
+        Returns:
+            tuple: (les MAX_REPORTED_REPEATS plus longues plages (début, longueur) d'au moins
+                min_length bits, début de la plage finale (partie périodique))
+        """
+        end = n - distance
+        longest = []
+        run_start = 0
+        for first_byte, diff in RepetitionAttack.differences(packed, n, distance):
+            nonzero = np.flatnonzero(diff)
+            if not len(nonzero):
+                continue
+            # Une plage s'étend du bit suivant la dernière différence d'un octet au premier bit différent du suivant
+            first_diff = 8 * (first_byte + nonzero) + RepetitionAttack.LEADING_ZEROS[diff[nonzero]]
+            after_diff = 8 * (first_byte + nonzero) + 8 - RepetitionAttack.TRAILING_ZEROS[diff[nonzero]]
+            starts = np.concatenate(([run_start], after_diff[:-1]))
+            lengths = first_diff - starts
+            for i in np.flatnonzero(lengths >= min_length):
+                RepetitionAttack._keep_longest(longest, int(starts[i]), int(lengths[i]))
+            run_start = int(after_diff[-1])
+        if end - run_start >= min_length:
+            RepetitionAttack._keep_longest(longest, run_start, end - run_start)
+        return sorted(longest, key=lambda run: -run[0]), run_start
+
+    @staticmethod
+    def _keep_longest(longest, start, length):
+        """Tas des plus longues plages (longueur, début)"""
+        if len(longest) < RepetitionAttack.MAX_REPORTED_REPEATS:
+            heapq.heappush(longest, (length, start))
+        elif length > longest[0][0]:
+            heapq.heapreplace(longest, (length, start))
+
+    @staticmethod
+    def has_period(packed, n, period, start):
+        """Vrai si s[i] = s[i + period] pour tout i ≥ start (arrêt à la première différence)"""
+        return all(not diff.any() for _, diff in RepetitionAttack.differences(packed, n, period, start))
+
+    @staticmethod
+    def smallest_period(packed, n, period, start):
+        """Plus petite période de la partie périodique : un diviseur de toute période observée sur deux cycles"""
+        divisors = [d for d in range(1, int(period ** 0.5) + 1) if period % d == 0]
+        divisors = sorted(set(divisors + [period // d for d in divisors]))
+        for divisor in divisors[:-1]:
+            if RepetitionAttack.has_period(packed, n, divisor, start):
+                return divisor
+        return period
+
+    @staticmethod
+    def run_test(bit_sequence, min_repeat=1024):
+        """
+        Recherche la plus petite période et les longues répétitions exactes de la séquence.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+            min_repeat (int): Longueur minimale (bits) d'une répétition signalée
+
+        Returns:
+            dict: 'attack_success' avec la période et les répétitions trouvées (positions,
+                distance et longueur), 'success' si aucune répétition n'est trouvée
+        """
+        response_handler = TestResponse("Détection de période et de répétitions")
+
+        try:
+            n = len(bit_sequence)
+            if n < 2 * min_repeat or n < 2 * RepetitionAttack.WINDOW_BITS:
+                return response_handler.get_response(
+                    error=True,
+                    error_message=f"La séquence est trop courte (minimum {2 * min_repeat} bits requis)"
+                )
+
+            packed = RepetitionAttack.packed_bytes(bit_sequence)
+            spacing = RepetitionAttack.spacing(n)
+            positions, values = RepetitionAttack.anchors(packed, n, spacing)
+            candidates = RepetitionAttack.candidate_distances(positions, values)
+
+            repeats = []
+            period = None
+            for distance, _ in candidates:
+                runs, periodic_start = RepetitionAttack.matching_runs(packed, n, distance, min_repeat)
+                repeats.extend({"position": start, "position de la copie": start + distance,
+                                "distance": distance, "longueur (bits)": length}
+                               for length, start in runs)
+                # Au moins deux cycles complets observés jusqu'à la fin de la séquence
+                if n - periodic_start >= 2 * distance and (period is None or distance < period[0]):
+                    period = (distance, periodic_start)
+
+            additional_info = {
+                "Méthode": "Ancres de 64 bits (plus petite empreinte par bloc), tri des ancres et "
+                           "vérification exacte des distances candidates",
+                "Espacement des ancres (bits)": spacing,
+                "Ancres indexées": len(positions),
+                "Distances candidates vérifiées": [distance for distance, _ in candidates],
+            }
+            if period is not None:
+                smallest, periodic_start = RepetitionAttack.smallest_period(packed, n, *period), period[1]
+                additional_info["Période (bits)"] = smallest
+                additional_info["Début de la partie périodique (bits)"] = periodic_start
+                # Les répétitions de la partie périodique sont déjà décrites par la période
+                repeats = [repeat for repeat in repeats
+                           if repeat["distance"] % smallest or repeat["position"] < periodic_start]
+            repeats.sort(key=lambda repeat: -repeat["longueur (bits)"])
+            additional_info["Répétitions"] = repeats[:RepetitionAttack.MAX_REPORTED_REPEATS]
+
+            return response_handler.get_response(
+                test_status='attack_success' if period is not None or repeats else 'success',
+                additional_info=additional_info
+            )
+
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
@@ -1,40 +1,141 @@
-from testsuite.nist.binary_matrix_rank_test import BinaryMatrixRankTest
-from testsuite.nist.frequency_monobit_test import FrequencyMonobitTest
-from testsuite.nist.frequency_test_within_a_block import FrequencyTestWithinABlock
-from testsuite.nist.linear_complexity_test import LinearComplexityTest
-from testsuite.nist.longest_run_of_one_in_a_block_test import LongestRunOfOneInABlockTest
-from testsuite.nist.non_overlapping_template_matching_test import NonOverlappingTemplateMatchingTest
-from testsuite.nist.runs_test import RunsTest
-from testsuite.nist.serial_test import SerialTest
-from testsuite.nist.discrete_fourier_transform_test import DiscreteFourierTransformTest
-from testsuite.nist.overlapping_template_matching_test import OverlappingTemplateMatchingTest
-from testsuite.nist.maurer_universal_statistical_test import MaurerUniversalTest
-from testsuite.nist.approximate_entropy_test import ApproximateEntropyTest
-from testsuite.nist.cumulative_sums_test import CumulativeSumsTest
-from testsuite.nist.random_excursions_test import RandomExcursionsTest
-from testsuite.nist.random_excursions_variant_test import RandomExcursionsVariantTest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+import asyncio
+import multiprocessing
+import pickle
+from collections.abc import KeysView, ValuesView
+import threading
+import time
+
 from testsuite.test_utils.response import TestResponse
-from testsuite.attack.berlekamp_massey import  BerlekampMassey
+from testsuite.test_utils.packed_sequence import PackedSequence
+from testsuite.test_utils.cost_model import TestScheduler
+from testsuite.test_utils.registry import TestEntry
+from testsuite.test_utils.nist_parameters import NistTestParameters
 
 
-# Dictionnaire qui mappe les noms de tests aux fonctions correspondantes
+# Registre des tests : chaque module n'est importé qu'à la première exécution du test
 TEST_FUNCTIONS = {
-    'frequency_monobit': FrequencyMonobitTest.run_test,
-    'block_frequency': FrequencyTestWithinABlock.run_test,
-    'runs': RunsTest.run_test,
-    'longest_runs': LongestRunOfOneInABlockTest.run_test,
-    'non_overlapping_template_matching': NonOverlappingTemplateMatchingTest.run_test,
-    'binary_matrix_rank': BinaryMatrixRankTest.run_test,
-    'linear_complexity': LinearComplexityTest.run_test,
-    'serial': SerialTest.run_test,
-    'dft_spectral': DiscreteFourierTransformTest.run_test,
-    'overlapping_template_matching': OverlappingTemplateMatchingTest.run_test,
-    'maurer': MaurerUniversalTest.run_test,
-    'entropy': ApproximateEntropyTest.run_test,
-    'cusum': CumulativeSumsTest.run_test,
-    'random_excursion': RandomExcursionsTest.run_test,
-    'random_excursion_variant': RandomExcursionsVariantTest.run_test,
-    'belkamp_massey': BerlekampMassey.run_test
+    'frequency_monobit': TestEntry(
+        'testsuite.nist.frequency_monobit_test:FrequencyMonobitTest.run_test',
+        'Test de fréquence monobit', min_length=100,
+        precomputations=('bits',)),
+    'block_frequency': TestEntry(
+        'testsuite.nist.frequency_test_within_a_block:FrequencyTestWithinABlock.run_test',
+        'Test de fréquence par block', min_length=100,
+        params={'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        precomputations=('bits',), block_decomposable=True),
+    'runs': TestEntry(
+        'testsuite.nist.runs_test:RunsTest.run_test',
+        'Test de runs', min_length=100,
+        params={'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        precomputations=('bits',)),
+    'longest_runs': TestEntry(
+        'testsuite.nist.longest_run_of_one_in_a_block_test:LongestRunOfOneInABlockTest.run_test',
+        'Test du plus long run de 1 dans un bloc', min_length=128,
+        params={'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        cost_class='fixed_blocks', precomputations=('bits',), block_decomposable=True),
+    'non_overlapping_template_matching': TestEntry(
+        'testsuite.nist.non_overlapping_template_matching_test:NonOverlappingTemplateMatchingTest.run_test',
+        'Test de non-chevauchement de modèles', min_length=100,
+        params={'template': {'type': 'bits', 'default': '000000001'}},
+        precomputations=('bits',), block_decomposable=True),
+    'binary_matrix_rank': TestEntry(
+        'testsuite.nist.binary_matrix_rank_test:BinaryMatrixRankTest.run_test',
+        'Test de rang de matrices binaires', min_length=38 * 32 * 32,
+        precomputations=('bits',), block_decomposable=True),
+    'linear_complexity': TestEntry(
+        'testsuite.nist.linear_complexity_test:LinearComplexityTest.run_test',
+        'Test de complexité linéaire', min_length=lambda p: p['M'],
+        params={'M': {'type': 'int', 'default': 500, 'min': 2},
+                'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        cost_class='block_quadratic', precomputations=('bits',), block_decomposable=True),
+    'serial': TestEntry(
+        'testsuite.nist.serial_test:SerialTest.run_test',
+        # Recommandation NIST : m < ⌊log₂n⌋ - 2
+        'Test sériel', min_length=lambda p: max(100, 2 ** (p['m'] + 3)),
+        params={'m': {'type': 'int', 'default': 3, 'min': 2}},
+        cost_class='patterns', precomputations=('bits', 'pattern_counts'),
+        sweep='testsuite.nist.serial_test:SerialTest.run_sweep'),
+    'dft_spectral': TestEntry(
+        'testsuite.nist.discrete_fourier_transform_test:DiscreteFourierTransformTest.run_test',
+        'Test de transformation de Fourier discrète (spectral)', min_length=100,
+        params={'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        cost_class='n_log_n', precomputations=('bits', 'fft')),
+    'overlapping_template_matching': TestEntry(
+        'testsuite.nist.overlapping_template_matching_test:OverlappingTemplateMatchingTest.run_test',
+        'Test de correspondance de template avec chevauchement', min_length=1000,
+        params={'template': {'type': 'bits'}},
+        precomputations=('bits',), block_decomposable=True),
+    'autocorrelation': TestEntry(
+        'testsuite.nist.autocorrelation_test:AutocorrelationTest.run_test',
+        # Décalages 1..max_lag (par défaut n/2) : la séquence doit couvrir au moins 2 * max_lag bits
+        "Test d'autocorrélation", min_length=lambda p: max(100, 2 * p.get('max_lag', 0)),
+        params={'max_lag': {'type': 'int', 'min': 1},
+                'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        cost_class='n_log_n', precomputations=('bits', 'fft')),
+    'maurer': TestEntry(
+        'testsuite.nist.maurer_universal_statistical_test:MaurerUniversalTest.run_test',
+        'Test statistique universel de Maurer', min_length=387840,
+        precomputations=('bits',)),
+    'entropy': TestEntry(
+        'testsuite.nist.approximate_entropy_test:ApproximateEntropyTest.run_test',
+        # Le test exige 0 < m < log2(n)
+        "Test d'entropie approximative", min_length=lambda p: 2 ** p['m'] + 1,
+        params={'m': {'type': 'int', 'default': 2, 'min': 1}},
+        cost_class='patterns_plus_one', precomputations=('bits', 'pattern_counts'),
+        sweep='testsuite.nist.approximate_entropy_test:ApproximateEntropyTest.run_sweep'),
+    'cusum': TestEntry(
+        'testsuite.nist.cumulative_sums_test:CumulativeSumsTest.run_test',
+        "Test de somme cumulative",
+        params={'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        precomputations=('bits', 'cumsum')),
+    'random_excursion': TestEntry(
+        'testsuite.nist.random_excursions_test:RandomExcursionsTest.run_test',
+        "Test d'excursion aléatoire",
+        params={'decision_rule': {'type': 'float', 'default': 0.01, 'min': 0.0, 'max': 1.0}},
+        precomputations=('bits', 'cumsum')),
+    'random_excursion_variant': TestEntry(
+        'testsuite.nist.random_excursions_variant_test:RandomExcursionsVariantTest.run_test',
+        'Test des excursions aléatoires – variante', min_length=1000000,
+        precomputations=('bits', 'cumsum')),
+    'belkamp_massey': TestEntry(
+        'testsuite.attack.berlekamp_massey:BerlekampMassey.run_test',
+        "Berlkamp-Massey", min_length=1,
+        cost_class='quadratic', precomputations=('bits',)),
+    'lcg': TestEntry(
+        'testsuite.attack.lcg:LcgAttack.run_test',
+        "Reconstruction des paramètres d'un LCG", min_length=32 * (12 + 16),
+        precomputations=('packed',), packed_input=True),
+    'gf2_linear': TestEntry(
+        'testsuite.attack.gf2_linear:Gf2LinearAttack.run_test',
+        "Reconstruction d'un générateur linéaire sur GF(2)", min_length=32 * (1 + 16),
+        precomputations=('packed',), packed_input=True),
+    'repetition': TestEntry(
+        'testsuite.attack.repetition:RepetitionAttack.run_test',
+        "Détection de période et de répétitions", min_length=lambda p: 2 * p['min_repeat'],
+        params={'min_repeat': {'type': 'int', 'default': 1024, 'min': 64}},
+        precomputations=('packed',), packed_input=True),
+    'mt19937': TestEntry(
+        'testsuite.attack.mersenne_twister:MersenneTwisterAttack.run_test',
+        "Reconstruction de l'état de MT19937", min_length=32 * (624 + 32),
+        precomputations=('packed',), packed_input=True),
+    # Tests FIPS 140-2 : blocs de 20 000 bits évalués par lots sur la séquence compacte
+    'fips_monobit': TestEntry(
+        'testsuite.fips.monobit_test:FipsMonobitTest.run_test',
+        'Test monobit FIPS 140-2', min_length=20000,
+        precomputations=('packed',), packed_input=True),
+    'fips_poker': TestEntry(
+        'testsuite.fips.poker_test:FipsPokerTest.run_test',
+        'Test poker FIPS 140-2', min_length=20000,
+        precomputations=('packed',), packed_input=True),
+    'fips_runs': TestEntry(
+        'testsuite.fips.runs_test:FipsRunsTest.run_test',
+        'Test des runs FIPS 140-2', min_length=20000,
+        precomputations=('packed', 'run_lengths'), packed_input=True),
+    'fips_long_run': TestEntry(
+        'testsuite.fips.long_run_test:FipsLongRunTest.run_test',
+        'Test du long run FIPS 140-2', min_length=20000,
+        precomputations=('packed', 'run_lengths'), packed_input=True),
     # Ajoutez ici d'autres tests
 }
 
@@ -45,20 +146,61 @@ def get_available_tests():
     return list(TEST_FUNCTIONS.keys())
 
 
+def describe_tests():
+    """
+    Renvoie les métadonnées déclarées de chaque test, sans importer le code des tests
+    """
+    return {test_name: entry.describe() for test_name, entry in TEST_FUNCTIONS.items()}
+
+
+def validate_test(test_name, sequence_length, params=None):
+    """
+    Valide une exécution à partir des métadonnées du registre, avant tout calcul
+
+    Args:
+        test_name (str): Nom du test
+        sequence_length (int): Longueur de la séquence
+        params (dict, optional): Paramètres fournis pour le test
+
+    Returns:
+        dict or None: Réponse d'erreur du test si l'exécution est invalide, None sinon
+    """
+    entry = TEST_FUNCTIONS.get(test_name)
+    if entry is None:
+        response_handler = TestResponse('Test inconnu')
+        return response_handler.get_response(
+            error=True,
+            error_message=f"Test '{test_name}' non reconnu"
+        )
+
+    try:
+        entry.validate(sequence_length, params)
+    except ValueError as e:
+        response_handler = TestResponse(entry.name)
+        return response_handler.get_response(error=True, error_message=str(e))
+    return None
+
+
 def run_test(test_name, bit_sequence, **kwargs):
     """
     Exécute un test spécifique
 
     Args:
         test_name (str): Nom du test à exécuter
-        bit_sequence (list): Séquence de bits à tester
+        bit_sequence (list, memoryview or PackedSequence): Séquence de bits à tester
         **kwargs: Arguments supplémentaires à passer au test
 
     Returns:
         dict: Résultat du test
     """
+    entry = TEST_FUNCTIONS.get(test_name)
+    if isinstance(bit_sequence, PackedSequence) and not (entry is not None and entry.packed_input):
+        # Le fichier est projeté en mémoire dans le processus qui exécute le test, puis décodé
+        # en une vue d'un octet par bit (et non en liste d'entiers)
+        bit_sequence = bit_sequence.view()
+
     if test_name in TEST_FUNCTIONS:
-        return TEST_FUNCTIONS[test_name](bit_sequence, **kwargs)
+        return _portable(TEST_FUNCTIONS[test_name](bit_sequence, **kwargs))
     else:
         response_handler = TestResponse('Test inconnu')
         return response_handler.get_response(
@@ -67,52 +209,678 @@ def run_test(test_name, bit_sequence, **kwargs):
         )
 
 
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import multiprocessing
-from django.http import JsonResponse
+def run_sweep(test_name, bit_sequence, param_sets):
+    """
+    Exécute un test pour plusieurs jeux de paramètres dans le même processus
+
+    Les tests qui déclarent une fonction de balayage mutualisent les calculs communs
+    (histogramme des motifs du plus grand m, ...); les autres sont exécutés un par un.
+
+    Returns:
+        list[dict]: Résultat de chaque jeu de paramètres, dans l'ordre de param_sets
+    """
+    if isinstance(bit_sequence, PackedSequence):
+        bit_sequence = bit_sequence.view()
 
+    entry = TEST_FUNCTIONS.get(test_name)
+    if entry is not None and entry.sweep is not None:
+        return [_portable(result) for result in entry.load_sweep()(bit_sequence, param_sets)]
+    return [run_test(test_name, bit_sequence, **params) for params in param_sets]
 
-def run_tests_parallel(test_list, bit_sequence, max_workers=None):
+
+def _portable(value):
+    """
+    Convertit un résultat de test en types natifs (dict, list, int, float, str...)
+
+    Les résultats sont renvoyés par les processus du pool : une vue de dictionnaire, un
+    tableau numpy ou une memoryview ne peuvent pas être sérialisés et feraient échouer la tâche.
+    """
+    if isinstance(value, dict):
+        return {key: _portable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset, KeysView, ValuesView)):
+        return [_portable(item) for item in value]
+    if hasattr(value, 'tolist'):
+        # Scalaires et tableaux numpy, memoryview
+        return value.tolist()
+    return value
+
+
+def run_task(test_name, bit_sequence, params, **kwargs):
+    """
+    Exécute une tâche planifiée : un test (params est un dict) ou un balayage (params est une liste)
+
+    Chaque résultat reçoit sa durée de calcul en secondes ('compute_time', horloge monotone);
+    la durée d'un balayage est répartie également entre ses jeux de paramètres.
+    """
+    start = time.perf_counter()
+    if isinstance(params, list):
+        results = run_sweep(test_name, bit_sequence, params)
+        compute_time = (time.perf_counter() - start) / max(1, len(results))
+        return [_serializable(test_name, {**result, "compute_time": compute_time}) for result in results]
+    return _serializable(test_name, {**run_test(test_name, bit_sequence, **params, **kwargs),
+                                     "compute_time": time.perf_counter() - start})
+
+
+def _serializable(test_name, result):
+    """
+    Résultat d'un test tel quel s'il peut être renvoyé par un processus du pool, réponse d'erreur
+    du test sinon : un résultat non sérialisable ferait échouer toute la tâche (ou tout le lot)
+    """
+    try:
+        pickle.dumps(result)
+    except Exception as exc:
+        response_handler = TestResponse(TEST_FUNCTIONS[test_name].name)
+        return {**response_handler.get_response(error=True, error_message=f"Résultat non sérialisable: {exc}"),
+                "compute_time": result.get("compute_time")}
+    return result
+
+
+def windowed_audit(window_size, step=None, test_list=None):
+    """
+    Prépare un audit localisé des tests à sommes préfixes (fréquence, runs, somme cumulative)
+    sur des fenêtres fixes ou glissantes de la séquence (voir WindowedAudit)
+
+    Raises:
+        ValueError: Si la fenêtre, le pas ou un test n'est pas accepté
+    """
+    # numpy et scipy ne sont importés qu'à la première utilisation du mode fenêtré
+    from testsuite.test_utils.windowed_audit import WindowedAudit
+    return WindowedAudit(window_size, step, test_list)
+
+
+def run_windowed_audit(audit, bit_sequence):
+    """
+    Exécute un audit localisé (dans un processus du pool)
+
+    Returns:
+        dict: p-values par fenêtre, fenêtres en échec et heatmap des échecs
+    """
+    return audit.run(bit_sequence)
+
+
+def expand_test_list(test_list):
+    """
+    Développe les éléments de 'test_list' en jeux de paramètres
+
+    Chaque élément est soit un nom de test, soit un objet {"test": nom, "params": {...}}.
+    Une valeur de paramètre numérique peut être un balayage : "2..16", "500..5000:500"
+    (bornes incluses, pas optionnel) ou une liste de valeurs; plusieurs balayages
+    produisent toutes les combinaisons.
+
+    Returns:
+        list: Couples (nom du test, liste des jeux de paramètres), dans l'ordre de la requête
+
+    Raises:
+        ValueError: Si un élément est mal formé
+    """
+    items = []
+    for item in test_list:
+        if isinstance(item, str):
+            items.append((item, [{}]))
+            continue
+        if not isinstance(item, dict) or not isinstance(item.get('test'), str):
+            raise ValueError("Chaque élément de 'test_list' doit être un nom de test ou un objet {\"test\": ..., \"params\": {...}}.")
+
+        params = item.get('params') or {}
+        if not isinstance(params, dict):
+            raise ValueError(f"Les paramètres du test '{item['test']}' doivent être un objet.")
+
+        entry = TEST_FUNCTIONS.get(item['test'])
+        items.append((item['test'], entry.expand(params) if entry is not None else [params]))
+
+    return items
+
+
+def plan_runs(test_list, sequence_length):
+    """
+    Développe, valide et regroupe en tâches les tests demandés
+
+    Les jeux de paramètres invalides sont rejetés avant tout calcul. Les balayages d'un test
+    qui sait mutualiser ses calculs forment une seule tâche; les autres exécutions sont
+    des tâches indépendantes, réparties entre les processus.
+
+    Returns:
+        tuple: (exécutions [(nom, paramètres)], erreurs {indice d'exécution: réponse},
+                tâches [(indices d'exécution, nom, paramètres ou liste de paramètres)])
+    """
+    runs, rejected, tasks = [], {}, []
+    for test_name, param_sets in expand_test_list(test_list):
+        accepted = []
+        for params in param_sets:
+            index = len(runs)
+            error = validate_test(test_name, sequence_length, params)
+            if error is not None:
+                runs.append((test_name, params))
+                rejected[index] = error
+            else:
+                params = TEST_FUNCTIONS[test_name].normalize_params(params)
+                runs.append((test_name, params))
+                accepted.append((index, params))
+
+        entry = TEST_FUNCTIONS.get(test_name)
+        if len(accepted) > 1 and entry.sweep is not None:
+            tasks.append(([index for index, _ in accepted], test_name, [params for _, params in accepted]))
+        else:
+            tasks.extend(([index], test_name, params) for index, params in accepted)
+
+    return runs, rejected, tasks
+
+
+def plan_request(test_list, sequence_length, max_workers, cost_model=None):
+    """
+    Planifie une requête sans l'exécuter (estimation, contrôle d'admission)
+
+    Returns:
+        dict: tâches dans l'ordre de soumission avec leur coût prévu, exécutions rejetées,
+            nombre de processus, durée prévue et coût total en secondes-CPU
+    """
+    _, rejected, tasks = plan_runs(test_list, sequence_length)
+    plan = TestScheduler(cost_model).plan([t[1] for t in tasks], sequence_length, max_workers,
+                                          [t[2] for t in tasks])
+    return {
+        "order": [
+            {"test": tasks[i][1], "params": tasks[i][2], "predicted_cost": plan["predicted_costs"][i]}
+            for i in plan["order"]
+        ],
+        "rejected": list(rejected.values()),
+        "workers": plan["workers"],
+        "predicted_duration": plan["predicted_duration"],
+        "cpu_cost": sum(plan["predicted_costs"]),
+    }
+
+
+def _collect_results(runs, rejected, tasks, results_by_task):
+    """
+    Répartit les résultats des tâches sur les exécutions, dans l'ordre de la requête
+    """
+    results_by_run = dict(rejected)
+    for task_index, (indices, test_name, params) in enumerate(tasks):
+        if task_index not in results_by_task:
+            # Tâche annulée par le mode on_failure=stop
+            response_handler = TestResponse(TEST_FUNCTIONS[test_name].name)
+            results_by_run.update((index, response_handler.get_response(test_status='skipped')) for index in indices)
+            continue
+        result = results_by_task[task_index]
+        results_by_run.update(zip(indices, result if isinstance(params, list) else [result]))
+
+    test_results = []
+    for index, (test_name, params) in enumerate(runs):
+        result = results_by_run[index]
+        if params:
+            # Les paramètres identifient l'exécution dans un balayage
+            result = {**result, "parameters": params}
+        test_results.append(result)
+    return test_results
+
+
+def _stop_condition(on_failure, failure_threshold=None):
+    """
+    Condition d'arrêt d'une batterie
+
+    Args:
+        on_failure (str): 'continue' (tous les tests sont exécutés) ou 'stop'
+        failure_threshold (float, optional): p-value au-dessous de laquelle un échec est décisif. Une attaque
+            réussie ('attack_success') et un échec sans p-value (tests à seuils fixes) sont toujours décisifs.
+
+    Returns:
+        callable or None: Fonction (résultat d'une tâche) -> True si la batterie doit s'arrêter
+    """
+    if on_failure == 'continue':
+        return None
+    if on_failure != 'stop':
+        raise ValueError("Le champ 'on_failure' doit valoir 'continue' ou 'stop'.")
+
+    threshold = NistTestParameters.get_fail_fast_threshold(failure_threshold)
+
+    def is_decisive_failure(result):
+        for response in result if isinstance(result, list) else [result]:
+            if response.get('test_status') == 'attack_success':
+                # La séquence a été reproduite : l'échec le plus décisif qui soit
+                return True
+            if response.get('test_status') != 'failed':
+                continue
+            p_values = response.get('p_value')
+            if p_values is None or isinstance(p_values, (int, float)):
+                p_values = [p_values]
+            else:
+                p_values = list(p_values.values() if isinstance(p_values, dict) else p_values)
+            p_values = [p for p in p_values if p is not None]
+            # Un échec sans p-value (tests FIPS 140-2 à seuils fixes) est décisif
+            if not p_values or any(p < threshold for p in p_values):
+                return True
+        return False
+
+    return is_decisive_failure
+
+
+def _submission_order(plan, stop):
+    """
+    Ordre de soumission des tâches : les plus longues d'abord, ou les moins coûteuses d'abord
+    en mode on_failure=stop afin de détecter un échec au plus tôt
+    """
+    return plan["order"] if stop is None else plan["order"][::-1]
+
+
+def _with_queue_time(result, queue_time):
+    """Ajoute l'attente avant le calcul ('queue_time', secondes) au résultat d'une tâche"""
+    if isinstance(result, list):
+        return [{**item, "queue_time": queue_time} for item in result]
+    return {**result, "queue_time": queue_time}
+
+
+def _pool_queue_time(result, submitted):
+    """
+    Attente d'une tâche du pool : durée écoulée depuis sa soumission moins sa durée de calcul
+    (file du pool et transfert entre processus)
+    """
+    items = result if isinstance(result, list) else [result]
+    compute_time = sum(item.get("compute_time") or 0.0 for item in items)
+    return max(0.0, time.perf_counter() - submitted - compute_time)
+
+
+def _task_error(task, exc):
+    """Résultat d'erreur d'une tâche dont le processus a échoué"""
+    indices, test_name, params = task
+    import logging
+    logging.error(f'Test {test_name} failed: {exc}')
+    error = {
+        'test_name': test_name,
+        'error': True,
+        'error_message': str(exc)
+    }
+    return [error] * len(indices) if isinstance(params, list) else error
+
+
+# Pool de processus partagé par les requêtes asynchrones (créé à la première utilisation)
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _pool_context():
+    """
+    Contexte de création des processus du pool
+
+    Les tests sont importés à la demande, éventuellement depuis plusieurs threads : un fork
+    effectué pendant un import hériterait d'un verrou d'import bloqué. Les processus sont donc
+    créés par un serveur 'forkserver' (processus sans threads), lorsque la plateforme le permet.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context()
+
+
+def get_process_pool(max_workers=None):
+    """
+    Renvoie le pool de processus partagé, en le créant si nécessaire
+
+    Un pool dont un processus s'est arrêté brutalement (SIGKILL, manque de mémoire) n'accepte
+    plus aucune tâche (BrokenProcessPool) : il est alors remplacé par un nouveau pool. Les
+    tâches qu'il exécutait échouent avec une erreur, les requêtes suivantes utilisent le nouveau pool.
+
+    Args:
+        max_workers: Nombre de processus lors de la création (None = nombre de CPU)
+    """
+    global _process_pool
+    with _process_pool_lock:
+        # ProcessPoolExecutor n'expose pas son état : lecture de son attribut interne '_broken'
+        if _process_pool is not None and _process_pool._broken:
+            import logging
+            logging.error(f'Process pool broken, replacing it: {_process_pool._broken}')
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context())
+        return _process_pool
+
+
+def pool_status():
+    """
+    État du pool partagé : nombre de processus et tâches soumises non terminées (en file ou en cours)
+
+    Returns:
+        dict or None: {"workers", "pending"}, None si le pool n'a pas encore été créé
+    """
+    pool = _process_pool
+    if pool is None:
+        return None
+    # ProcessPoolExecutor n'expose pas la profondeur de sa file : lecture de ses attributs internes
+    return {"workers": pool._max_workers, "pending": len(pool._pending_work_items)}
+
+
+async def run_tests_async(test_list, bit_sequence, executor, cost_model=None, on_failure='continue',
+                          failure_threshold=None):
+    """
+    Exécute les tests dans le pool de processus sans bloquer la boucle d'événements
+
+    Si la tâche appelante est annulée (déconnexion du client), les tests pas encore
+    démarrés sont retirés de la file du pool.
+
+    Args:
+        test_list: Liste des tests à exécuter (noms ou objets avec paramètres)
+        bit_sequence: Séquence de bits à tester
+        executor: Pool de processus utilisé pour les calculs
+        cost_model: Modèle de coût utilisé pour ordonner les soumissions
+        on_failure: 'stop' pour annuler les tests restants dès un échec décisif (voir run_tests_parallel)
+        failure_threshold: p-value au-dessous de laquelle un échec est décisif
+
+    Returns:
+        dict: Résultats des tests dans l'ordre de test_list ("results"), "count", "sequence_length"
+            et le test dont l'échec a arrêté la batterie ("stopped_by", None sinon)
+    """
+    stop = _stop_condition(on_failure, failure_threshold)
+    loop = asyncio.get_running_loop()
+    runs, rejected, tasks = plan_runs(test_list, len(bit_sequence))
+    # Les tests les plus longs sont placés en tête de la file du pool (les moins coûteux en mode 'stop')
+    plan = TestScheduler(cost_model).plan([t[1] for t in tasks], len(bit_sequence), 1, [t[2] for t in tasks])
+    submitted = time.perf_counter()
+    future_to_task = {loop.run_in_executor(executor, run_task, tasks[i][1], bit_sequence, tasks[i][2]): i
+                      for i in _submission_order(plan, stop)}
+
+    results_by_task = {}
+    pending = set(future_to_task)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                i = future_to_task[future]
+                exc = future.exception()
+                if exc is not None:
+                    results_by_task[i] = _task_error(tasks[i], exc)
+                else:
+                    results_by_task[i] = _with_queue_time(future.result(), _pool_queue_time(future.result(), submitted))
+            if stop is not None and any(stop(results_by_task[future_to_task[f]]) for f in done):
+                break
+    finally:
+        # Déconnexion du client ou échec décisif : les tests pas encore démarrés sont retirés de la file
+        for future in pending:
+            future.cancel()
+
+    test_results = _collect_results(runs, rejected, tasks, results_by_task)
+    stopped_by = next((tasks[i][1] for i in _submission_order(plan, stop)
+                       if stop is not None and i in results_by_task and stop(results_by_task[i])), None)
+    return {
+        "results": test_results,
+        "count": len(test_results),
+        "sequence_length": len(bit_sequence),
+        "stopped_by": stopped_by,
+    }
+
+
+def run_tests_parallel(test_list, bit_sequence, max_workers=None, cost_model=None, executor=None,
+                       on_failure='continue', failure_threshold=None):
     """
     Exécute les tests en parallèle avec des processus séparés
 
+    Les tests sont soumis du plus long au plus court selon le modèle de coût, et le nombre
+    de processus est choisi par le planificateur (1 = exécution dans le processus courant).
+
+    Avec on_failure='stop', les tests les moins coûteux sont exécutés en premier et la batterie
+    s'arrête dès qu'un échec est décisif (p-value inférieure à failure_threshold, échec sans p-value
+    ou attaque réussie, voir _stop_condition) : les tests en attente sont annulés et ceux en cours
+    ne sont plus attendus (statut 'skipped').
+    Les tests ne sont alors pas répartis par blocs, afin de pouvoir être annulés individuellement.
+
     Args:
-        test_list: Liste des noms de tests à exécuter
+        test_list: Liste des tests à exécuter (noms ou objets avec paramètres, voir expand_test_list)
         bit_sequence: Séquence de bits à tester
         max_workers: Nombre maximum de processus (None = auto)
+        cost_model: Modèle de coût utilisé pour la planification (None = coefficients par défaut)
+        executor: Pool de processus existant à utiliser (None = pool dédié à l'appel)
+        on_failure: 'continue' (défaut) ou 'stop'
+        failure_threshold: p-value au-dessous de laquelle un échec est décisif
+            (défaut: NistTestParameters.DEFAULT_FAIL_FAST_THRESHOLD)
     """
+    stop = _stop_condition(on_failure, failure_threshold)
+    # Les tests invalides (longueur, paramètres) sont écartés avant la planification
+    runs, rejected, tasks = plan_runs(test_list, len(bit_sequence))
+
     if max_workers is None:
         # Utiliser le nombre de CPU disponibles, mais limiter à 8 max
-        max_workers = min(multiprocessing.cpu_count(), len(test_list), 8)
-
-    test_results = []
+        max_workers = max(1, min(multiprocessing.cpu_count(), len(tasks), 8))
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Soumettre tous les tests
-        future_to_test = {
-            executor.submit(run_test, test_name, bit_sequence): test_name
-            for test_name in test_list
-        }
+    plan = TestScheduler(cost_model).plan([t[1] for t in tasks], len(bit_sequence), max_workers,
+                                          [t[2] for t in tasks], shard=stop is None)
 
-        # Collecter les résultats au fur et à mesure
-        for future in as_completed(future_to_test):
-            test_name = future_to_test[future]
+    if plan["workers"] == 1:
+        results_by_task = {}
+        started = time.perf_counter()
+        for i in _submission_order(plan, stop):
+            # Attente : exécution des tests précédents dans le même processus
+            queue_time = time.perf_counter() - started
             try:
-                result = future.result()
-                test_results.append(result)
+                results_by_task[i] = _with_queue_time(run_task(tasks[i][1], bit_sequence, tasks[i][2]), queue_time)
             except Exception as exc:
-                # Logger l'erreur
-                import logging
-                logging.error(f'Test {test_name} failed: {exc}')
-                # Ajouter un résultat d'erreur
-                test_results.append({
-                    'test_name': test_name,
-                    'error': True,
-                    'error_message': str(exc)
-                })
+                # Comme dans le pool : l'échec d'un test n'interrompt pas les autres
+                results_by_task[i] = _task_error(tasks[i], exc)
+            if stop is not None and stop(results_by_task[i]):
+                break
+    elif executor is not None:
+        results_by_task = _run_planned(executor, tasks, bit_sequence, plan, stop)
+    else:
+        own_executor = ProcessPoolExecutor(max_workers=plan["workers"], mp_context=_pool_context())
+        results_by_task = {}
+        try:
+            results_by_task = _run_planned(own_executor, tasks, bit_sequence, plan, stop)
+        finally:
+            # Après un arrêt, les tests encore en cours ne sont pas attendus
+            own_executor.shutdown(wait=len(results_by_task) == len(tasks), cancel_futures=True)
+
+    # Les résultats sont renvoyés dans l'ordre de la requête
+    test_results = _collect_results(runs, rejected, tasks, results_by_task)
+    stopped_by = next((tasks[i][1] for i in _submission_order(plan, stop)
+                       if stop is not None and i in results_by_task and stop(results_by_task[i])), None)
 
     return {
         "results": test_results,
         "count": len(test_results),
         "sequence_length": len(bit_sequence),
-    }
\ No newline at end of file
+        "workers": plan["workers"],
+        "predicted_duration": plan["predicted_duration"],
+        "stopped_by": stopped_by,
+    }
+
+
+def run_tests_batch(test_list, sequences, max_workers=1, cost_model=None, executor=None,
+                    on_failure='continue', failure_threshold=None):
+    """
+    Exécute la même batterie sur plusieurs séquences
+
+    Les séquences sont regroupées en lots contigus (quelques lots par processus) : chaque lot
+    est une seule tâche du pool qui exécute la batterie sur ses séquences l'une après l'autre.
+    La soumission, la sérialisation et la planification sont payées par lot et non par séquence,
+    et les séquences circulent sous forme compacte (8 bits par octet).
+
+    Args:
+        test_list: Liste des tests à exécuter (voir expand_test_list)
+        sequences (list[tuple]): (octets compacts, longueur en bits) de chaque séquence
+        max_workers (int): Nombre de processus utilisables
+        cost_model: Modèle de coût utilisé pour planifier chaque séquence
+        executor: Pool de processus (None = exécution dans le processus courant)
+        on_failure, failure_threshold: Arrêt de la batterie d'une séquence dès un échec décisif
+            (voir run_tests_parallel)
+
+    Returns:
+        list[dict]: Résultats de chaque séquence ("results", "count", "sequence_length", "stopped_by"),
+            dans l'ordre de `sequences`
+    """
+    # Le mode d'arrêt est validé avant toute soumission
+    _stop_condition(on_failure, failure_threshold)
+    if not sequences:
+        return []
+
+    chunk_count = max(1, min(len(sequences), max_workers * 4)) if executor is not None else 1
+    bounds = [len(sequences) * i // chunk_count for i in range(chunk_count + 1)]
+    chunks = [sequences[bounds[i]:bounds[i + 1]] for i in range(chunk_count)]
+    arguments = (test_list, cost_model, on_failure, failure_threshold)
+
+    if executor is None or chunk_count == 1:
+        return [block for chunk in chunks for block in _run_batch_chunk(chunk, *arguments)]
+
+    futures = [executor.submit(_run_batch_chunk, chunk, *arguments) for chunk in chunks]
+    blocks = []
+    for chunk, future in zip(chunks, futures):
+        try:
+            blocks.extend(future.result())
+        except Exception as exc:
+            # Un lot dont le processus a échoué donne un bloc d'erreur pour chacune de ses séquences
+            import logging
+            logging.error(f'Batch chunk failed: {exc}')
+            blocks.extend({"results": [], "count": 0, "sequence_length": length, "stopped_by": None,
+                           "error": str(exc)} for _, length in chunk)
+    return blocks
+
+
+def _run_batch_chunk(chunk, test_list, cost_model, on_failure, failure_threshold):
+    """Exécute la batterie sur chaque séquence d'un lot, dans le processus courant"""
+    import numpy as np
+
+    blocks = []
+    for packed, length in chunk:
+        try:
+            bit_sequence = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=length).tolist()
+            execution = run_tests_parallel(test_list, bit_sequence, max_workers=1, cost_model=cost_model,
+                                           on_failure=on_failure, failure_threshold=failure_threshold)
+            blocks.append({key: execution[key] for key in ("results", "count", "sequence_length", "stopped_by")})
+        except Exception as exc:
+            # Seule la séquence en cause reçoit un bloc d'erreur, les autres séquences du lot sont conservées
+            import logging
+            logging.error(f'Batch sequence failed: {exc}')
+            blocks.append({"results": [], "count": 0, "sequence_length": length, "stopped_by": None,
+                           "error": str(exc)})
+    return blocks
+
+
+def run_preview(test_list, bit_sequence, time_budget, max_workers=1, cost_model=None, executor=None, seed=0):
+    """
+    Aperçu rapide : exécute chaque test sur un échantillon déterministe de la séquence
+    (voir PreviewSampler) et renvoie des statuts provisoires
+
+    Les tests qui ne tiennent pas dans le budget même à leur longueur minimale sont
+    reportés à l'exécution complète (statut 'deferred').
+
+    Args:
+        test_list: Liste des tests à exécuter (voir expand_test_list)
+        bit_sequence: Séquence de bits complète
+        time_budget (float): Durée visée de l'aperçu (secondes)
+        max_workers (int): Nombre de processus utilisables
+        cost_model: Modèle de coût utilisé pour dimensionner les échantillons
+        executor: Pool de processus (None = exécution dans le processus courant)
+        seed (int): Graine du placement des échantillons
+    """
+    from testsuite.test_utils.preview import PreviewSampler
+
+    n = len(bit_sequence)
+    runs, rejected, _ = plan_runs(test_list, n)
+    accepted = [i for i in range(len(runs)) if i not in rejected]
+    sampler = PreviewSampler(time_budget, max_workers if executor is not None else 1, cost_model, seed)
+    lengths = dict(zip(accepted, sampler.sample_lengths([runs[i] for i in accepted], n)))
+
+    samples = {i: sampler.sample(bit_sequence, length) for i, length in lengths.items() if length is not None}
+    if executor is not None and len(samples) > 1:
+        futures = {i: executor.submit(run_test, runs[i][0], sample, **runs[i][1]) for i, sample in samples.items()}
+        results_by_run = {}
+        for i, future in futures.items():
+            try:
+                results_by_run[i] = future.result()
+            except Exception as exc:
+                results_by_run[i] = _task_error(([i], runs[i][0], runs[i][1]), exc)
+    else:
+        results_by_run = {i: run_test(runs[i][0], sample, **runs[i][1]) for i, sample in samples.items()}
+
+    test_results = []
+    for index, (test_name, params) in enumerate(runs):
+        if index in rejected:
+            result = rejected[index]
+        elif index in results_by_run:
+            result = {**results_by_run[index], "preview": sampler.describe(n, lengths[index])}
+        else:
+            result = TestResponse(TEST_FUNCTIONS[test_name].name).get_response(test_status='deferred')
+        if params:
+            result = {**result, "parameters": params}
+        test_results.append(result)
+
+    return {
+        "results": test_results,
+        "count": len(test_results),
+        "sequence_length": n,
+        "seed": seed,
+    }
+
+
+def _run_planned(executor, tasks, bit_sequence, plan, stop=None):
+    """
+    Exécute un plan dans le pool : les tests répartis par blocs sont pilotés depuis des threads
+    du processus courant (qui fusionnent les statistiques des tranches), les autres tâches sont
+    soumises entières au pool.
+    """
+    from testsuite.test_utils.block_sharding import BlockShardingExecutor
+
+    order = _submission_order(plan, stop)
+    sharded = [i for i in order if i in plan["shards"]]
+    whole = [i for i in order if i not in plan["shards"]]
+
+    if not sharded:
+        return _run_in_executor(executor, tasks, whole, bit_sequence, plan["workers"], stop)
+
+    with ThreadPoolExecutor(max_workers=len(sharded)) as threads:
+        sharded_futures = {
+            i: threads.submit(run_task, tasks[i][1], bit_sequence, tasks[i][2],
+                              block_executor=BlockShardingExecutor(executor, plan["shards"][i], bit_sequence))
+            for i in sharded
+        }
+        results_by_task = _run_in_executor(executor, tasks, whole, bit_sequence, plan["workers"])
+        for i, future in sharded_futures.items():
+            try:
+                results_by_task[i] = future.result()
+            except Exception as exc:
+                results_by_task[i] = _task_error(tasks[i], exc)
+
+    return results_by_task
+
+
+def _run_in_executor(executor, tasks, order, bit_sequence, workers, stop=None):
+    """
+    Soumet les tâches dans l'ordre donné en gardant au plus `workers` tâches en cours,
+    ce qui limite la part d'un pool partagé utilisée par une requête.
+
+    Args:
+        tasks: Tâches de la requête (voir plan_runs)
+        order: Indices des tâches dans l'ordre de soumission
+        stop: Condition d'arrêt (voir _stop_condition) : dès qu'elle est remplie, les tâches en attente
+            sont annulées et celles en cours ne sont plus attendues
+
+    Returns:
+        dict: Résultat de chaque tâche, indexé par sa position dans `tasks`
+    """
+    results_by_task = {}
+    pending = list(order)
+    future_to_task = {}
+    submitted = {}
+
+    def submit_next():
+        i = pending.pop(0)
+        submitted[i] = time.perf_counter()
+        future_to_task[executor.submit(run_task, tasks[i][1], bit_sequence, tasks[i][2])] = i
+
+    while pending and len(future_to_task) < workers:
+        submit_next()
+
+    # Collecter les résultats au fur et à mesure
+    while future_to_task:
+        done, _ = wait(future_to_task, return_when=FIRST_COMPLETED)
+        for future in done:
+            i = future_to_task.pop(future)
+            try:
+                result = future.result()
+                results_by_task[i] = _with_queue_time(result, _pool_queue_time(result, submitted[i]))
+            except Exception as exc:
+                # Logger l'erreur et ajouter un résultat d'erreur
+                results_by_task[i] = _task_error(tasks[i], exc)
+            if stop is not None and stop(results_by_task[i]):
+                for other in future_to_task:
+                    other.cancel()
+                return results_by_task
+            if pending:
+                submit_next()
+
+    return results_by_task
@@ -0,0 +1,158 @@
+import numpy as np
+
+from testsuite.test_utils.packed_sequence import PackedSequence
+from testsuite.test_utils.response import TestResponse
+
+
+class Fips140Blocks:
+    """
+    Découpage d'une séquence en blocs consécutifs de 20 000 bits (FIPS 140-2, section 4.9.1).
+
+    Les blocs sont traités par lots sous forme compacte (2 500 octets par bloc) : un fichier
+    de plusieurs dizaines de Go est lu par morceaux depuis sa projection en mémoire, sans
+    jamais être décodé en entier. Les bits restants après le dernier bloc complet sont ignorés.
+    """
+
+    BLOCK_BITS = 20000
+    BLOCK_BYTES = BLOCK_BITS // 8
+    # Nombre de blocs traités à la fois (20 Mbits)
+    CHUNK_BLOCKS = 1024
+    # Nombre maximum de positions de blocs en échec renvoyées
+    MAX_REPORTED_FAILURES = 1000
+
+    @staticmethod
+    def block_count(bit_sequence):
+        return len(bit_sequence) // Fips140Blocks.BLOCK_BITS
+
+    @staticmethod
+    def packed_chunks(bit_sequence):
+        """
+        Parcourt les blocs complets par lots
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+
+        Yields:
+            np.ndarray: Octets d'un lot de blocs, de forme (blocs, 2500)
+        """
+        count = Fips140Blocks.block_count(bit_sequence)
+        for first in range(0, count, Fips140Blocks.CHUNK_BLOCKS):
+            last = min(count, first + Fips140Blocks.CHUNK_BLOCKS)
+            if isinstance(bit_sequence, PackedSequence):
+                chunk = bit_sequence.packed()[first * Fips140Blocks.BLOCK_BYTES:last * Fips140Blocks.BLOCK_BYTES]
+            else:
+                bits = np.asarray(bit_sequence[first * Fips140Blocks.BLOCK_BITS:last * Fips140Blocks.BLOCK_BITS],
+                                  dtype=np.uint8)
+                chunk = np.packbits(bits)
+            yield np.asarray(chunk).reshape(last - first, Fips140Blocks.BLOCK_BYTES)
+
+    @staticmethod
+    def popcount(masks):
+        """Nombre de bits à 1 de chaque bloc d'un lot compact (popcount des octets)"""
+        return np.bitwise_count(masks).sum(axis=1, dtype=np.int64)
+
+    @staticmethod
+    def run_masks(chunk, value, max_length):
+        """
+        Masques compacts des débuts de plages de `value` d'au moins k bits, pour k = 1..max_length
+
+        Calcul bit-parallèle sur les octets, sans plage à cheval sur deux blocs :
+        G(1) = débuts de plages, G(k) = G(k - 1) & (bits décalés de k - 1 positions).
+
+        Yields:
+            np.ndarray: G(k) de forme (blocs, 2500), pour k croissant
+        """
+        bits = chunk if value else ~chunk
+        mask = bits & ~Fips140Blocks._shift_previous(bits)
+        yield mask
+        shifted = bits
+        for _ in range(1, max_length):
+            shifted = Fips140Blocks._shift_next(shifted)
+            mask = mask & shifted
+            yield mask
+
+    @staticmethod
+    def uniform_windows(chunk, value, length):
+        """
+        Masque compact des positions i telles que les bits i..i + length - 1 du bloc valent tous `value`
+
+        Les fenêtres sont construites par doublement (W(2k) = W(k) & W(k) décalé de k),
+        en O(log length) décalages.
+        """
+        window = chunk if value else ~chunk
+        result, covered, size = None, 0, 1
+        while True:
+            if length & size:
+                result = window if result is None else result & Fips140Blocks._shift_next(window, covered)
+                covered += size
+            if size * 2 > length:
+                return result
+            window = window & Fips140Blocks._shift_next(window, size)
+            size *= 2
+
+    @staticmethod
+    def _shift_next(packed, positions=1):
+        """Bit i du résultat = bit i + positions du bloc (0 après la fin du bloc)"""
+        whole_bytes, remaining_bits = divmod(positions, 8)
+        source = packed[:, whole_bytes:]
+        width = source.shape[1]
+        shifted = np.zeros_like(packed)
+        if remaining_bits == 0:
+            shifted[:, :width] = source
+        else:
+            shifted[:, :width] = source << remaining_bits
+            shifted[:, :width - 1] |= source[:, 1:] >> (8 - remaining_bits)
+        return shifted
+
+    @staticmethod
+    def _shift_previous(packed):
+        """Bit i du résultat = bit i - 1 du bloc (0 avant le début du bloc)"""
+        shifted = packed >> 1
+        shifted[:, 1:] |= packed[:, :-1] << 7
+        return shifted
+
+    @staticmethod
+    def evaluate(test_name, bit_sequence, block_check, method):
+        """
+        Applique un critère de conformité à tous les blocs et construit la réponse du test
+
+        Le test est réussi si tous les blocs sont conformes, comme l'exige FIPS 140-2.
+
+        Args:
+            test_name (str): Nom affiché du test
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+            block_check: Fonction (lot de blocs compacts) -> tableau booléen, True si le bloc est conforme
+            method (str): Description du critère
+
+        Returns:
+            dict: Réponse du test (blocs conformes et positions des blocs en échec)
+        """
+        response_handler = TestResponse(test_name)
+
+        try:
+            if Fips140Blocks.block_count(bit_sequence) == 0:
+                return response_handler.get_response(
+                    error=True,
+                    error_message=f"La séquence est trop courte (minimum {Fips140Blocks.BLOCK_BITS} bits requis)"
+                )
+
+            passes = np.concatenate([block_check(chunk) for chunk in Fips140Blocks.packed_chunks(bit_sequence)])
+            failed = np.flatnonzero(~passes)
+
+            return response_handler.get_response(
+                test_status='success' if failed.size == 0 else 'failed',
+                additional_info={
+                    "Méthode": method,
+                    "Blocs de 20000 bits analysés": int(passes.size),
+                    "Blocs conformes": int(passes.size - failed.size),
+                    "Blocs en échec": int(failed.size),
+                    "Positions des blocs en échec (bits)":
+                        (failed[:Fips140Blocks.MAX_REPORTED_FAILURES] * Fips140Blocks.BLOCK_BITS).tolist(),
+                }
+            )
+
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
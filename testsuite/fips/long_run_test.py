@@ -0,0 +1,31 @@
+import numpy as np
+
+from testsuite.fips.blocks import Fips140Blocks
+
+
+class FipsLongRunTest:
+    # Longueur à partir de laquelle une plage de 0 ou de 1 fait échouer le bloc
+    LONG_RUN = 26
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Effectue le test du long run FIPS 140-2 sur chaque bloc de 20 000 bits.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): La séquence de bits à tester
+
+        Returns:
+            dict: Résultats du test (blocs conformes et positions des blocs en échec)
+        """
+        return Fips140Blocks.evaluate(
+            'Test du long run FIPS 140-2', bit_sequence, FipsLongRunTest.check_blocks,
+            f"Aucune plage de 0 ou de 1 de {FipsLongRunTest.LONG_RUN} bits ou plus dans chaque bloc")
+
+    @staticmethod
+    def check_blocks(chunk):
+        """Conformité de chaque bloc d'un lot : aucune fenêtre de LONG_RUN bits identiques"""
+        passes = np.ones(chunk.shape[0], dtype=bool)
+        for value in (0, 1):
+            passes &= ~Fips140Blocks.uniform_windows(chunk, value, FipsLongRunTest.LONG_RUN).any(axis=1)
+        return passes
@@ -0,0 +1,28 @@
+from testsuite.fips.blocks import Fips140Blocks
+
+
+class FipsMonobitTest:
+    # Nombre de 1 d'un bloc conforme (bornes exclues)
+    LOWER = 9725
+    UPPER = 10275
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Effectue le test monobit FIPS 140-2 sur chaque bloc de 20 000 bits.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): La séquence de bits à tester
+
+        Returns:
+            dict: Résultats du test (blocs conformes et positions des blocs en échec)
+        """
+        return Fips140Blocks.evaluate(
+            'Test monobit FIPS 140-2', bit_sequence, FipsMonobitTest.check_blocks,
+            f"Nombre de 1 de chaque bloc compris entre {FipsMonobitTest.LOWER} et {FipsMonobitTest.UPPER} (exclus)")
+
+    @staticmethod
+    def check_blocks(chunk):
+        """Conformité de chaque bloc d'un lot, par popcount des octets"""
+        ones = Fips140Blocks.popcount(chunk)
+        return (ones > FipsMonobitTest.LOWER) & (ones < FipsMonobitTest.UPPER)
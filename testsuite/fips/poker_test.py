@@ -0,0 +1,37 @@
+import numpy as np
+
+from testsuite.fips.blocks import Fips140Blocks
+
+
+class FipsPokerTest:
+    # Statistique X d'un bloc conforme (bornes exclues)
+    LOWER = 2.16
+    UPPER = 46.17
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Effectue le test poker FIPS 140-2 sur chaque bloc de 20 000 bits.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): La séquence de bits à tester
+
+        Returns:
+            dict: Résultats du test (blocs conformes et positions des blocs en échec)
+        """
+        return Fips140Blocks.evaluate(
+            'Test poker FIPS 140-2', bit_sequence, FipsPokerTest.check_blocks,
+            f"Statistique X = 16/5000 × Σ f(i)² - 5000 des 5000 quartets de chaque bloc comprise entre "
+            f"{FipsPokerTest.LOWER} et {FipsPokerTest.UPPER} (exclus)")
+
+    @staticmethod
+    def check_blocks(chunk):
+        """Conformité de chaque bloc d'un lot, à partir de l'histogramme des quartets (4 bits) de chaque bloc"""
+        blocks = chunk.shape[0]
+        # Histogramme des octets de chaque bloc, puis somme sur le quartet bas (quartets hauts)
+        # et sur le quartet haut (quartets bas)
+        bytes_histogram = np.bincount((chunk + (np.arange(blocks, dtype=np.int64) * 256)[:, None]).ravel(),
+                                      minlength=256 * blocks).reshape(blocks, 16, 16)
+        counts = bytes_histogram.sum(axis=2) + bytes_histogram.sum(axis=1)
+        x = 16 / 5000 * (counts ** 2).sum(axis=1) - 5000
+        return (x > FipsPokerTest.LOWER) & (x < FipsPokerTest.UPPER)
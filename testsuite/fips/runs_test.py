@@ -0,0 +1,37 @@
+import numpy as np
+
+from testsuite.fips.blocks import Fips140Blocks
+
+
+class FipsRunsTest:
+    # Intervalles (bornes incluses) du nombre de plages de 1, 2, 3, 4, 5 et 6+ bits,
+    # identiques pour les plages de 0 et de 1
+    INTERVALS = ((2343, 2657), (1135, 1365), (542, 708), (251, 373), (111, 201), (111, 201))
+
+    @staticmethod
+    def run_test(bit_sequence):
+        """
+        Effectue le test des runs FIPS 140-2 sur chaque bloc de 20 000 bits.
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): La séquence de bits à tester
+
+        Returns:
+            dict: Résultats du test (blocs conformes et positions des blocs en échec)
+        """
+        return Fips140Blocks.evaluate(
+            'Test des runs FIPS 140-2', bit_sequence, FipsRunsTest.check_blocks,
+            "Nombre de plages de 0 et de 1 de chaque longueur (1 à 5, puis 6 et plus) dans les intervalles "
+            "de FIPS 140-2")
+
+    @staticmethod
+    def check_blocks(chunk):
+        """Conformité de chaque bloc d'un lot, à partir du nombre de plages d'au moins k bits"""
+        passes = np.ones(chunk.shape[0], dtype=bool)
+        for value in (0, 1):
+            at_least = [Fips140Blocks.popcount(mask) for mask in Fips140Blocks.run_masks(chunk, value, 6)]
+            # Plages d'exactement k bits pour k = 1..5, puis de 6 bits et plus
+            counts = [at_least[k] - at_least[k + 1] for k in range(5)] + [at_least[5]]
+            for count, (low, high) in zip(counts, FipsRunsTest.INTERVALS):
+                passes &= (count >= low) & (count <= high)
+        return passes
@@ -1,4 +1,5 @@
 import math
+from testsuite.test_utils.pattern_counts import PatternCounts
 from testsuite.test_utils.response import TestResponse
 from testsuite.test_utils.test_status_determiner import TestStatusDeterminer
 
@@ -7,33 +8,12 @@ class ApproximateEntropyTest:
     DEFAULT_DECISION_RULE = 0.01
 
     @staticmethod
-    def _max_of_runs(bit_sequence, pattern_length):
+    def _phi_from_counts(counts, n):
         """
-        Calcule les occurrences de tous les patterns de longueur donnée
+        Calcule la fonction phi à partir de l'histogramme des motifs d'une longueur donnée
         """
-        n = len(bit_sequence)
-        patterns = {}
-
-        # Créer une séquence circulaire en ajoutant les premiers (pattern_length-1) bits à la fin
-        extended_sequence = bit_sequence + bit_sequence[:pattern_length - 1]
-
-        # Compter les occurrences de chaque pattern
-        for i in range(n):
-            pattern = tuple(extended_sequence[i:i + pattern_length])
-            patterns[pattern] = patterns.get(pattern, 0) + 1
-
-        return patterns
-
-    @staticmethod
-    def _calculate_phi(bit_sequence, pattern_length):
-        """
-        Calcule la fonction phi(m) pour une longueur de pattern donnée
-        """
-        n = len(bit_sequence)
-        patterns = ApproximateEntropyTest._max_of_runs(bit_sequence, pattern_length)
-
         phi = 0.0
-        for count in patterns.values():
+        for count in counts.tolist():
             if count > 0:
                 probability = count / n
                 phi += probability * math.log(probability)
@@ -72,47 +52,99 @@ class ApproximateEntropyTest:
                     error_message=f"Longueur de motif invalide m={m}. Doit être: 0 < m < log2(n)"
                 )
 
-            # Calcul de phi(m) et phi(m+1)
-            phi_m = ApproximateEntropyTest._calculate_phi(bit_sequence, m)
-            phi_m_plus_1 = ApproximateEntropyTest._calculate_phi(bit_sequence, m + 1)
+            # Les histogrammes des motifs de m et m+1 bits sont obtenus en un seul parcours
+            counts = PatternCounts.all_lengths(bit_sequence, m + 1)
+            return ApproximateEntropyTest._evaluate(response_handler, counts, n, m)
 
-            # Calcul de l'entropie approximative
-            apen = phi_m - phi_m_plus_1
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
 
-            # Calcul de la statistique de test selon NIST
-            chi_squared = 2 * n * (math.log(2) - apen)
+    @staticmethod
+    def run_sweep(bit_sequence: list[int], param_sets):
+        """
+        Exécute le test pour plusieurs valeurs de m avec un seul comptage des motifs :
+        les histogrammes des petites longueurs sont déduits de celui de la plus grande.
 
-            # Calcul de la p-value using chi-squared distribution with 2^m degrees of freedom
-            degrees_of_freedom = 2 ** m
+        Args:
+            bit_sequence (list[int]): La séquence de bits à tester
+            param_sets (list[dict]): Paramètres de chaque exécution ({'m': ...})
 
-            # Approximation de la p-value pour une distribution chi-carré
-            # Utilisation de la fonction gamma incomplète
+        Returns:
+            list[dict]: Résultat de chaque exécution, dans l'ordre de param_sets
+        """
+        response_handler = TestResponse("Test d'entropie approximative")
+        n = len(bit_sequence)
+        m_values = [params.get('m', 2) for params in param_sets]
+
+        if n == 0 or not all(bit in [0, 1] for bit in bit_sequence):
+            # Séquence invalide : chaque exécution renvoie l'erreur du test isolé
+            return [ApproximateEntropyTest.run_test(bit_sequence, m=m) for m in m_values]
+
+        valid = [m for m in m_values if 0 < m < math.log2(n)]
+        counts = PatternCounts.all_lengths(bit_sequence, max(valid) + 1) if valid else {}
+
+        results = []
+        for m in m_values:
+            if m not in valid:
+                results.append(ApproximateEntropyTest.run_test(bit_sequence, m=m))
+                continue
             try:
-                from scipy.special import gammaincc
-                p_value = gammaincc(degrees_of_freedom / 2, chi_squared / 2)
-            except ImportError:
-                # Approximation alternative si scipy n'est pas disponible
-                # Utilisation de l'approximation normale pour grands degrés de liberté
-                if degrees_of_freedom > 30:
-                    z = (chi_squared - degrees_of_freedom) / math.sqrt(2 * degrees_of_freedom)
-                    p_value = 0.5 * math.erfc(z / math.sqrt(2))
-                else:
-                    # Pour de petits degrés de liberté, approximation simple
-                    p_value = math.exp(-chi_squared / 2)
-
-            # Assurer que p_value est dans [0, 1]
-            p_value = max(0.0, min(1.0, p_value))
-
-            # Détermination du résultat
-            test_status = TestStatusDeterminer.determine_status(p_value)
+                results.append(ApproximateEntropyTest._evaluate(response_handler, counts, n, m))
+            except Exception as e:
+                results.append(response_handler.get_response(
+                    error=True,
+                    error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+                ))
+        return results
 
-            return response_handler.get_response(
-                p_value=p_value,
-                test_status=test_status,
-            )
+    @staticmethod
+    def _evaluate(response_handler, counts, n, m):
+        """
+        Calcule l'entropie approximative et la p-value à partir des histogrammes des motifs
 
-        except Exception as e:
-            return response_handler.get_response(
-                error=True,
-                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
-            )
\ No newline at end of file
+        Args:
+            counts (dict): Histogrammes {longueur: nombre d'occurrences de chaque motif}
+            n (int): Longueur de la séquence
+            m (int): Longueur des motifs
+        """
+        # Calcul de phi(m) et phi(m+1)
+        phi_m = ApproximateEntropyTest._phi_from_counts(counts[m], n)
+        phi_m_plus_1 = ApproximateEntropyTest._phi_from_counts(counts[m + 1], n)
+
+        # Calcul de l'entropie approximative
+        apen = phi_m - phi_m_plus_1
+
+        # Calcul de la statistique de test selon NIST
+        chi_squared = 2 * n * (math.log(2) - apen)
+
+        # Calcul de la p-value using chi-squared distribution with 2^m degrees of freedom
+        degrees_of_freedom = 2 ** m
+
+        # Approximation de la p-value pour une distribution chi-carré
+        # Utilisation de la fonction gamma incomplète
+        try:
+            from scipy.special import gammaincc
+            p_value = gammaincc(degrees_of_freedom / 2, chi_squared / 2)
+        except ImportError:
+            # Approximation alternative si scipy n'est pas disponible
+            # Utilisation de l'approximation normale pour grands degrés de liberté
+            if degrees_of_freedom > 30:
+                z = (chi_squared - degrees_of_freedom) / math.sqrt(2 * degrees_of_freedom)
+                p_value = 0.5 * math.erfc(z / math.sqrt(2))
+            else:
+                # Pour de petits degrés de liberté, approximation simple
+                p_value = math.exp(-chi_squared / 2)
+
+        # Assurer que p_value est dans [0, 1]
+        p_value = max(0.0, min(1.0, p_value))
+
+        # Détermination du résultat
+        test_status = TestStatusDeterminer.determine_status(p_value)
+
+        return response_handler.get_response(
+            p_value=p_value,
+            test_status=test_status,
+        )
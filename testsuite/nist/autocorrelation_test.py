@@ -0,0 +1,92 @@
+from testsuite.test_utils.response import TestResponse
+import math
+import numpy as np
+import scipy.fft
+import scipy.special
+from testsuite.test_utils.test_status_determiner import TestStatusDeterminer
+
+
+class AutocorrelationTest:
+    DEFAULT_DECISION_RULE = 0.01
+    # Nombre maximum de décalages significatifs détaillés dans la réponse
+    MAX_REPORTED_LAGS = 20
+
+    @staticmethod
+    def run_test(bit_sequence: list[int], max_lag=None, decision_rule=DEFAULT_DECISION_RULE):
+        """
+        Effectue le test d'autocorrélation pour tous les décalages d = 1..max_lag.
+
+        Pour chaque décalage, C(d) = Σ X(i)·X(i+d) sur les n - d couples de la séquence ±1
+        (C(d) = accords - désaccords) suit approximativement une loi normale N(0, n - d).
+        Toutes les autocorrélations sont obtenues par une seule convolution FFT.
+        Le statut global applique la correction de Bonferroni au plus petit des max_lag p-values.
+
+        Args:
+            bit_sequence (list[int]): La séquence de bits à tester
+            max_lag (int, optional): Plus grand décalage testé (par défaut: n / 2)
+            decision_rule (float): Seuil de décision (par défaut: 0.01)
+
+        Returns:
+            dict: Résultats du test
+        """
+        response_handler = TestResponse("Test d'autocorrélation")
+
+        try:
+            n = len(bit_sequence)
+
+            if n < 100:
+                return response_handler.get_response(
+                    error=True,
+                    error_message="La séquence est trop courte (minimum 100 bits requis)"
+                )
+
+            max_lag = n // 2 if max_lag is None else int(max_lag)
+            if not 1 <= max_lag <= n // 2:
+                return response_handler.get_response(
+                    error=True,
+                    error_message=f"Le décalage maximal doit être compris entre 1 et n/2 ({n // 2})"
+                )
+
+            # Étape 1: Conversion des 0 et 1 en valeurs -1 et +1
+            X = 2 * np.asarray(bit_sequence, dtype=np.float64) - 1
+
+            # Étape 2: Autocorrélations de tous les décalages par FFT
+            # (complétion par des zéros : la corrélation circulaire est alors linéaire jusqu'à max_lag)
+            size = scipy.fft.next_fast_len(n + max_lag, real=True)
+            spectrum = scipy.fft.rfft(X, size)
+            C = np.rint(scipy.fft.irfft(spectrum * np.conj(spectrum), size)[1:max_lag + 1])
+
+            # Étape 3: Statistique normalisée et p-value de chaque décalage
+            pairs = n - np.arange(1, max_lag + 1)
+            z = C / np.sqrt(pairs)
+            p_values = scipy.special.erfc(np.abs(z) / math.sqrt(2))
+
+            # Étape 4: Correction de Bonferroni sur l'ensemble des décalages
+            worst = int(np.argmin(p_values))
+            p_value = min(1.0, float(p_values[worst]) * max_lag)
+            test_status = TestStatusDeterminer.determine_status(p_value, decision_rule)
+
+            significant = np.flatnonzero(p_values * max_lag < decision_rule)
+            significant = significant[np.argsort(p_values[significant])][:AutocorrelationTest.MAX_REPORTED_LAGS]
+
+            return response_handler.get_response(
+                p_value=p_value,
+                test_status=test_status,
+                additional_info={
+                    "Méthode": "Autocorrélation de la séquence ±1 pour tous les décalages (convolution FFT), "
+                               "correction de Bonferroni",
+                    "Décalages testés": max_lag,
+                    "Décalage le plus significatif": worst + 1,
+                    "P-value brute minimale": float(p_values[worst]),
+                    "Décalages significatifs (après correction)": {
+                        int(d + 1): {"accords": int((pairs[d] + C[d]) // 2), "p_value": float(p_values[d])}
+                        for d in significant
+                    },
+                }
+            )
+
+        except Exception as e:
+            return response_handler.get_response(
+                error=True,
+                error_message=f"Erreur lors de l'exécution du test: {str(e)}"
+            )
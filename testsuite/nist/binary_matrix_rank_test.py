@@ -7,13 +7,14 @@ from testsuite.test_utils.test_status_determiner import TestStatusDeterminer
 class BinaryMatrixRankTest:
 
     @staticmethod
-    def run_test(bit_sequence: list[int]):
+    def run_test(bit_sequence: list[int], block_executor=None):
         """
         Effectue le test de rang de matrices binaires NIST sur une séquence de bits.
 
         Args:
             bit_sequence (list[int] ou str): La séquence de bits à tester (liste ou chaîne de '0' et '1')
             decision_rule (float): Seuil de décision pour le test (default: 0.01)
+            block_executor (BlockShardingExecutor, optional): Répartit les matrices entre plusieurs processus
 
         Returns:
             dict: Résultats du test contenant la p-value et la décision (True si la séquence passe le test)
@@ -43,22 +44,12 @@ class BinaryMatrixRankTest:
             # Nombre de matrices complètes possibles
             N = n // (M * Q)
 
-            # Création des matrices
-            matrices = []
-            for i in range(N):
-                start = i * M * Q
-                block = bit_sequence[start:start + M * Q]
-                # Reshape le bloc en matrice M x Q
-                matrix = np.array(block).reshape(M, Q)
-                matrices.append(matrix)
-
-            # Calculer le rang de chaque matrice
-            ranks = [np.linalg.matrix_rank(matrix) for matrix in matrices]
-
-            # Compter les matrices selon leur rang
-            FM = sum(1 for r in ranks if r == M)        # Nombre de matrices de rang complet
-            FM1 = sum(1 for r in ranks if r == M - 1)   # Nombre de matrices de rang M-1
-            remaining = N - FM - FM1                    # Matrices de rang inférieur
+            # Compter les matrices selon leur rang (calcul indépendant par matrice)
+            if block_executor is not None:
+                FM, FM1, remaining = block_executor.map_blocks(
+                    BinaryMatrixRankTest.block_statistics, bit_sequence, M * Q, N, M=M, Q=Q)
+            else:
+                FM, FM1, remaining = BinaryMatrixRankTest.block_statistics(bit_sequence[:N * M * Q], M=M, Q=Q)
 
             # Calculer chi carré
             # Les valeurs 0.2888, 0.5776 et 0.1336 sont les probabilités théoriques
@@ -90,3 +81,34 @@ class BinaryMatrixRankTest:
                 error=True,
                 error_message=f"Erreur lors de l'exécution du test: {str(e)}"
             )
+
+    @staticmethod
+    def block_statistics(bits: list[int], M=32, Q=32):
+        """
+        Calcule le rang de chaque matrice M x Q formée à partir des bits.
+
+        Args:
+            bits (list[int]): Suite de blocs complets de M * Q bits
+            M (int): Nombre de lignes de chaque sous-matrice
+            Q (int): Nombre de colonnes de chaque sous-matrice
+
+        Returns:
+            list[int]: [matrices de rang complet, matrices de rang M-1, matrices de rang inférieur]
+        """
+        N = len(bits) // (M * Q)
+
+        # Création des matrices
+        matrices = []
+        for i in range(N):
+            start = i * M * Q
+            block = bits[start:start + M * Q]
+            # Reshape le bloc en matrice M x Q
+            matrix = np.array(block).reshape(M, Q)
+            matrices.append(matrix)
+
+        # Calculer le rang de chaque matrice
+        ranks = [np.linalg.matrix_rank(matrix) for matrix in matrices]
+
+        FM = sum(1 for r in ranks if r == M)        # Nombre de matrices de rang complet
+        FM1 = sum(1 for r in ranks if r == M - 1)   # Nombre de matrices de rang M-1
+        return [FM, FM1, N - FM - FM1]
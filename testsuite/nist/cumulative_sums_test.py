@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from scipy.stats import norm
 from testsuite.test_utils.response import TestResponse
 from testsuite.test_utils.test_status_determiner import TestStatusDeterminer
@@ -15,18 +16,24 @@ class CumulativeSumsTest:
         for i in range(1, n + 1):
             S[i] = S[i - 1] + x_seq[i - 1]
         z = max(abs(s) for s in S)
+        return CumulativeSumsTest.p_value_from_excursion(z, n)
+
+    @staticmethod
+    def p_value_from_excursion(z, n):
+        """
+        P-value de la formule NIST à partir de l'excursion maximale z de la marche sur n pas
+        """
         z_norm = z / math.sqrt(n)
         # p-value formula de NIST
-        sum1 = 0.0
+        # (termes évalués en un seul appel vectorisé de norm.cdf)
         k_min = int(math.ceil((-n / z) + 1) / 4)
         k_max = int(math.floor((n / z - 1) / 4))
-        for k in range(k_min, k_max + 1):
-            sum1 += norm.cdf((4 * k + 1) * z_norm) - norm.cdf((4 * k - 1) * z_norm)
-        sum2 = 0.0
+        k = np.arange(k_min, k_max + 1)
+        sum1 = float(np.sum(norm.cdf((4 * k + 1) * z_norm) - norm.cdf((4 * k - 1) * z_norm)))
         k_min2 = int(math.ceil((-n / z - 1) / 4))
         k_max2 = int(math.floor((n / z - 3) / 4))
-        for k in range(k_min2, k_max2 + 1):
-            sum2 += norm.cdf((4 * k + 3) * z_norm) - norm.cdf((4 * k + 1) * z_norm)
+        k = np.arange(k_min2, k_max2 + 1)
+        sum2 = float(np.sum(norm.cdf((4 * k + 3) * z_norm) - norm.cdf((4 * k + 1) * z_norm)))
         p_val = 1.0 - sum1 + sum2
         return p_val
 
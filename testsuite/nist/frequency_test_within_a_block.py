@@ -9,7 +9,7 @@ class FrequencyTestWithinABlock:
     DEFAULT_DECISION_RULE = 0.01
 
     @staticmethod
-    def run_test(bit_sequence: list[int], decision_rule=DEFAULT_DECISION_RULE):
+    def run_test(bit_sequence: list[int], decision_rule=DEFAULT_DECISION_RULE, block_executor=None):
         response_handler = TestResponse('Test de fréquence par block')
 
         try:
@@ -28,13 +28,15 @@ class FrequencyTestWithinABlock:
                     error_message="Impossible de déterminer une taille de bloc convenable"
                 )
 
-            observation = 0
             number_of_blocks = int(n/block_size)
-            for j in range(1, number_of_blocks + 1):
-                pi_j = 0
-                for i in range(block_size):
-                    pi_j = pi_j + bit_sequence[(j-1) * block_size + i] / block_size
-                observation = observation + (pi_j - 0.5)**2
+            # Somme des écarts de chaque bloc (calcul indépendant par bloc)
+            if block_executor is not None:
+                observation, = block_executor.map_blocks(
+                    FrequencyTestWithinABlock.block_statistics, bit_sequence, block_size, number_of_blocks,
+                    block_size=block_size)
+            else:
+                observation, = FrequencyTestWithinABlock.block_statistics(
+                    bit_sequence[:number_of_blocks * block_size], block_size=block_size)
 
             x_2_observation = 4 * block_size * observation
             p_value = 1 - scipy.special.gammainc(number_of_blocks/2, x_2_observation/2)
@@ -51,6 +53,26 @@ class FrequencyTestWithinABlock:
             )
 
 
+    @staticmethod
+    def block_statistics(bits: list[int], block_size: int):
+        """
+        Calcule la somme des (pi_j - 1/2)² sur les blocs de block_size bits.
+
+        Args:
+            bits (list[int]): Suite de blocs complets de block_size bits
+            block_size (int): Taille des blocs
+
+        Returns:
+            list[float]: [somme des écarts au carré]
+        """
+        observation = 0
+        for j in range(1, len(bits) // block_size + 1):
+            pi_j = 0
+            for i in range(block_size):
+                pi_j = pi_j + bits[(j-1) * block_size + i] / block_size
+            observation = observation + (pi_j - 0.5)**2
+        return [observation]
+
     @staticmethod
     def determine_block_size(sequence_length: int):
         """
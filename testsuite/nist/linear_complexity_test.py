@@ -7,7 +7,7 @@ class LinearComplexityTest:
     DEFAULT_DECISION_RULE = 0.01
 
     @staticmethod
-    def run_test(bit_sequence: list[int], M=500, decision_rule=DEFAULT_DECISION_RULE):
+    def run_test(bit_sequence: list[int], M=500, decision_rule=DEFAULT_DECISION_RULE, block_executor=None):
         """
         Effectue le test de complexité linéaire NIST sur une séquence de bits.
 
@@ -15,6 +15,7 @@ class LinearComplexityTest:
             bit_sequence (list[int] ou str): La séquence de bits à tester (liste ou chaîne de '0' et '1')
             M (int): La longueur des bits dans un bloc (recommandé: M = 500)
             decision_rule (float): Seuil de décision pour le test (default: 0.01)
+            block_executor (BlockShardingExecutor, optional): Répartit les blocs entre plusieurs processus
 
         Returns:
             dict: Résultats du test contenant la p-value et la décision (True si la séquence passe le test)
@@ -41,34 +42,12 @@ class LinearComplexityTest:
 
             # 1. Diviser la séquence en N blocs de M bits
             N = n // M
-            blocks = [bit_sequence[i*M:(i+1)*M] for i in range(N)]
-
-            # 2. Calculer la complexité linéaire Li pour chaque bloc
-            L_values = [LinearComplexityTest.berlekamp_massey(block) for block in blocks]
-
-            # 3. Calculer la moyenne théorique μ
-            mu = M/2 + (9 + (-1)**(M+1))/36 - (M/3 + 2/9)/2**M
-
-            # 4. Calculer Ti pour chaque bloc
-            T = [((-1)**M * (Li - mu) + 2/9) for Li in L_values]
-
-            # 5. Compter les occurrences dans les intervalles v0 à v6
-            v = [0] * 7
-            for Ti in T:
-                if Ti <= -2.5:
-                    v[0] += 1
-                elif Ti <= -1.5:
-                    v[1] += 1
-                elif Ti <= -0.5:
-                    v[2] += 1
-                elif Ti <= 0.5:
-                    v[3] += 1
-                elif Ti <= 1.5:
-                    v[4] += 1
-                elif Ti <= 2.5:
-                    v[5] += 1
-                else:
-                    v[6] += 1
+
+            # 2 à 5. Compter les blocs dans les intervalles v0 à v6 (calcul indépendant par bloc)
+            if block_executor is not None:
+                v = block_executor.map_blocks(LinearComplexityTest.block_statistics, bit_sequence, M, N, M=M)
+            else:
+                v = LinearComplexityTest.block_statistics(bit_sequence[:N * M], M=M)
 
             # 6. Calculer chi_square
             pi = [0.010417, 0.03125, 0.125, 0.5, 0.25, 0.0625, 0.020833]
@@ -96,6 +75,45 @@ class LinearComplexityTest:
                 error_message=f"Erreur lors de l'exécution du test: {str(e)}"
             )
 
+    @staticmethod
+    def block_statistics(bits: list[int], M=500):
+        """
+        Classe chaque bloc de M bits selon sa complexité linéaire.
+
+        Args:
+            bits (list[int]): Suite de blocs complets de M bits
+            M (int): Taille des blocs
+
+        Returns:
+            list[int]: Nombre de blocs dans chacun des intervalles v0 à v6
+        """
+        # Calculer la moyenne théorique μ
+        # 2.0**-M plutôt que /2**M : l'entier 2**M n'est pas convertible en flottant au-delà de M = 1023
+        mu = M/2 + (9 + (-1)**(M+1))/36 - (M/3 + 2/9) * 2.0**-M
+
+        v = [0] * 7
+        for i in range(len(bits) // M):
+            # Calculer la complexité linéaire Li du bloc puis Ti
+            Li = LinearComplexityTest.berlekamp_massey(bits[i*M:(i+1)*M])
+            Ti = (-1)**M * (Li - mu) + 2/9
+
+            if Ti <= -2.5:
+                v[0] += 1
+            elif Ti <= -1.5:
+                v[1] += 1
+            elif Ti <= -0.5:
+                v[2] += 1
+            elif Ti <= 0.5:
+                v[3] += 1
+            elif Ti <= 1.5:
+                v[4] += 1
+            elif Ti <= 2.5:
+                v[5] += 1
+            else:
+                v[6] += 1
+
+        return v
+
     @staticmethod
     def berlekamp_massey(block: list):
         """
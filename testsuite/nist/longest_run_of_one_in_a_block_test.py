@@ -9,13 +9,14 @@ class LongestRunOfOneInABlockTest:
     DEFAULT_DECISION_RULE = 0.01
 
     @staticmethod
-    def run_test(bit_sequence: list[int], decision_rule=DEFAULT_DECISION_RULE):
+    def run_test(bit_sequence: list[int], decision_rule=DEFAULT_DECISION_RULE, block_executor=None):
         """
         Effectue le test du plus long run de uns dans un bloc selon la méthode NIST SP 800-22.
 
         Args:
             bit_sequence (list[int] ou str): La séquence de bits à tester
             decision_rule (float): Seuil de décision (par défaut: 0.01)
+            block_executor (BlockShardingExecutor, optional): Répartit les blocs entre plusieurs processus
 
         Returns:
             dict: Résultats du test
@@ -66,31 +67,12 @@ class LongestRunOfOneInABlockTest:
                     error_message=f"Nombre de blocs insuffisant. Requis: {N}, Obtenu: {num_blocks}"
                 )
 
-            # Compter le plus long run de uns dans chaque bloc
-            v = [0] * (K + 1)  # Tableau pour stocker les fréquences
-
-            for i in range(N):
-                block = bit_sequence[i * M:(i + 1) * M]
-                max_run = 0
-                current_run = 0
-
-                for bit in block:
-                    if bit == 1:
-                        current_run += 1
-                        max_run = max(max_run, current_run)
-                    else:
-                        current_run = 0
-
-                # Catégoriser le plus long run selon les intervalles v_values
-                if max_run <= v_values[0]:
-                    v[0] += 1
-                elif max_run >= v_values[-1]:
-                    v[-1] += 1
-                else:
-                    for j in range(1, len(v_values)):
-                        if max_run == v_values[j-1] + (j-1):
-                            v[j] += 1
-                            break
+            # Compter le plus long run de uns dans chaque bloc (calcul indépendant par bloc)
+            if block_executor is not None:
+                v = block_executor.map_blocks(
+                    LongestRunOfOneInABlockTest.block_statistics, bit_sequence, M, N, M=M, v_values=v_values)
+            else:
+                v = LongestRunOfOneInABlockTest.block_statistics(bit_sequence[:N * M], M=M, v_values=v_values)
 
             # Calcul de la statistique de test chi-carré
             chi_squared = 0
@@ -114,3 +96,43 @@ class LongestRunOfOneInABlockTest:
                 error=True,
                 error_message=f"Erreur lors de l'exécution du test: {str(e)}"
             )
+
+    @staticmethod
+    def block_statistics(bits: list[int], M: int, v_values: list[int]):
+        """
+        Classe chaque bloc de M bits selon la longueur de son plus long run de uns.
+
+        Args:
+            bits (list[int]): Suite de blocs complets de M bits
+            M (int): Taille des blocs
+            v_values (list[int]): Bornes des classes v0 à vK
+
+        Returns:
+            list[int]: Tableau des fréquences v0 à vK
+        """
+        v = [0] * len(v_values)  # Tableau pour stocker les fréquences
+
+        for i in range(len(bits) // M):
+            block = bits[i * M:(i + 1) * M]
+            max_run = 0
+            current_run = 0
+
+            for bit in block:
+                if bit == 1:
+                    current_run += 1
+                    max_run = max(max_run, current_run)
+                else:
+                    current_run = 0
+
+            # Catégoriser le plus long run selon les intervalles v_values
+            if max_run <= v_values[0]:
+                v[0] += 1
+            elif max_run >= v_values[-1]:
+                v[-1] += 1
+            else:
+                for j in range(1, len(v_values)):
+                    if max_run == v_values[j-1] + (j-1):
+                        v[j] += 1
+                        break
+
+        return v
@@ -6,7 +6,7 @@ from testsuite.test_utils.test_status_determiner import TestStatusDeterminer
 class NonOverlappingTemplateMatchingTest:
 
     @staticmethod
-    def run_test(bit_sequence: list[int], template='000000001'):
+    def run_test(bit_sequence: list[int], template='000000001', block_executor=None):
         """
         Effectue le test de non-chevauchement de modèles NIST sur une séquence de bits.
 
@@ -15,6 +15,7 @@ class NonOverlappingTemplateMatchingTest:
             m (int): Longueur du modèle à rechercher (default: 9)
             template (str): Le modèle à rechercher dans la séquence (default: '000000001')
             decision_rule (float): Seuil de décision pour le test (default: 0.01)
+            block_executor (BlockShardingExecutor, optional): Répartit les blocs entre plusieurs processus
 
         Returns:
             dict: Résultats du test contenant la p-value et la décision (True si la séquence passe le test)
@@ -62,29 +63,14 @@ class NonOverlappingTemplateMatchingTest:
                     error_message=f"La séquence est trop courte pour la taille de bloc M={M}"
                 )
 
-            # Tronquer la séquence au multiple de M
-            bit_sequence = bit_sequence[:N * M]
-
-            # Compter les occurrences du modèle dans chaque bloc
-            W = []
-            for i in range(N):
-                block = bit_sequence[i * M:(i + 1) * M]
-                count = 0
-                j = 0
-                while j <= M - m:
-                    if block[j:j + m] == template:
-                        count += 1
-                        j += m  # Avancer à la position après le modèle (non-chevauchement)
-                    else:
-                        j += 1
-                W.append(count)
-
-            # Calcul des statistiques
-            mu = (M - m + 1) / (2 ** m)
-            sigma2 = M * ((1 / (2 ** m)) - ((2 * m - 1) / (2 ** (2 * m))))
-
-            # Calcul du chi carré
-            chi_square = sum([(w - mu) ** 2 / sigma2 for w in W])
+            # Compter les occurrences du modèle dans chaque bloc et calculer le chi carré
+            if block_executor is not None:
+                chi_square, total_count = block_executor.map_blocks(
+                    NonOverlappingTemplateMatchingTest.block_statistics, bit_sequence, M, N, template=template, M=M)
+            else:
+                # Tronquer la séquence au multiple de M
+                chi_square, total_count = NonOverlappingTemplateMatchingTest.block_statistics(
+                    bit_sequence[:N * M], template=template, M=M)
 
             # Calcul de la p-value
             p_value = scipy.special.gammaincc(N / 2, chi_square / 2)
@@ -99,7 +85,7 @@ class NonOverlappingTemplateMatchingTest:
                     "Motif recherché": ''.join(str(bit) for bit in template),
                     "Nombre de blocs analysés": N,
                     "Taille de chaque bloc": M,
-                    "Nombre total d’occurrences du motif": sum(W)
+                    "Nombre total d’occurrences du motif": total_count
                 }
             )
 
@@ -108,3 +94,38 @@ class NonOverlappingTemplateMatchingTest:
                 error=True,
                 error_message=f"Erreur lors de l'exécution du test: {str(e)}"
             )
+
+    @staticmethod
+    def block_statistics(bits: list[int], template: list[int], M: int):
+        """
+        Compte les occurrences non chevauchantes du modèle dans chaque bloc de M bits.
+
+        Args:
+            bits (list[int]): Suite de blocs complets de M bits
+            template (list[int]): Le modèle recherché
+            M (int): Taille des blocs
+
+        Returns:
+            list: [contribution des blocs au chi carré, nombre total d'occurrences]
+        """
+        m = len(template)
+        W = []
+        for i in range(len(bits) // M):
+            # Copie du bloc en liste : la séquence peut être une vue (memoryview), dont les tranches
+            # ne sont jamais égales à une liste
+            block = list(bits[i * M:(i + 1) * M])
+            count = 0
+            j = 0
+            while j <= M - m:
+                if block[j:j + m] == template:
+                    count += 1
+                    j += m  # Avancer à la position après le modèle (non-chevauchement)
+                else:
+                    j += 1
+            W.append(count)
+
+        # Calcul des statistiques
+        mu = (M - m + 1) / (2 ** m)
+        sigma2 = M * ((1 / (2 ** m)) - ((2 * m - 1) / (2 ** (2 * m))))
+
+        return [sum([(w - mu) ** 2 / sigma2 for w in W]), sum(W)]
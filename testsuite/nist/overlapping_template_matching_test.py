@@ -8,7 +8,7 @@ from testsuite.test_utils.test_status_determiner import TestStatusDeterminer
 class OverlappingTemplateMatchingTest:
 
     @staticmethod
-    def run_test(bit_sequence: list[int], template=None):
+    def run_test(bit_sequence: list[int], template=None, block_executor=None):
         """
         Effectue le test de correspondance de template avec chevauchement selon la méthode NIST SP 800-22.
 
@@ -16,6 +16,7 @@ class OverlappingTemplateMatchingTest:
             bit_sequence (list[int] ou str): La séquence de bits à tester
             decision_rule (float): Seuil de décision (par défaut: 0.01)
             template (list[int]): Template à rechercher (par défaut: [1,1,1,1,1,1,1,1,1] - 9 uns)
+            block_executor (BlockShardingExecutor, optional): Répartit les blocs entre plusieurs processus
 
         Returns:
             dict: Résultats du test
@@ -83,26 +84,12 @@ class OverlappingTemplateMatchingTest:
                     error_message=f"Séquence trop courte pour créer des blocs de taille {M}"
                 )
 
-            # Compter les occurrences dans chaque bloc
-            v = [0] * (K + 1)  # Compteurs pour chaque classe
-
-            for i in range(N):
-                # Extraire le bloc
-                block_start = i * M
-                block_end = min(block_start + M, n)
-                block = bit_sequence[block_start:block_end]
-
-                # Compter les occurrences chevauchantes du template dans ce bloc
-                count = 0
-                for j in range(len(block) - m + 1):
-                    if block[j:j + m] == template:
-                        count += 1
-
-                # Classer le nombre d'occurrences
-                if count <= K:
-                    v[count] += 1
-                else:
-                    v[K] += 1  # Plus de K occurrences
+            # Compter les occurrences dans chaque bloc (calcul indépendant par bloc)
+            if block_executor is not None:
+                v = block_executor.map_blocks(
+                    OverlappingTemplateMatchingTest.block_statistics, bit_sequence, M, N, template=template, M=M, K=K)
+            else:
+                v = OverlappingTemplateMatchingTest.block_statistics(bit_sequence[:N * M], template=template, M=M, K=K)
 
             # Calcul de la statistique chi-carré
             chi_squared = 0
@@ -136,4 +123,41 @@ class OverlappingTemplateMatchingTest:
             return response_handler.get_response(
                 error=True,
                 error_message=f"Erreur lors de l'exécution du test: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    def block_statistics(bits: list[int], template: list[int], M: int, K: int):
+        """
+        Classe chaque bloc de M bits selon le nombre d'occurrences chevauchantes du template.
+
+        Args:
+            bits (list[int]): Suite de blocs complets de M bits
+            template (list[int]): Template recherché
+            M (int): Taille des blocs
+            K (int): Nombre de classes (la dernière regroupe K occurrences et plus)
+
+        Returns:
+            list[int]: Nombre de blocs dans chacune des K + 1 classes
+        """
+        m = len(template)
+        v = [0] * (K + 1)  # Compteurs pour chaque classe
+
+        for i in range(len(bits) // M):
+            # Extraire le bloc
+            # Copie du bloc en liste : la séquence peut être une vue (memoryview), dont les tranches
+            # ne sont jamais égales à une liste
+            block = list(bits[i * M:(i + 1) * M])
+
+            # Compter les occurrences chevauchantes du template dans ce bloc
+            count = 0
+            for j in range(len(block) - m + 1):
+                if block[j:j + m] == template:
+                    count += 1
+
+            # Classer le nombre d'occurrences
+            if count <= K:
+                v[count] += 1
+            else:
+                v[K] += 1  # Plus de K occurrences
+
+        return v
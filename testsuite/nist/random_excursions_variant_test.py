@@ -86,7 +86,7 @@ class RandomExcursionsVariantTest:
             test_status = TestStatusDeterminer.determine_status(min_p_value)
 
             return response_handler.get_response(
-                p_value=p_values.values(),
+                p_value=list(p_values.values()),
                 test_status=test_status,
                 additional_info={
                     "P-valeurs par état": {
@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+import numpy as np
+
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+# Sous Linux, /dev/shm est un système de fichiers en mémoire partagée (tmpfs)
+SHARED_MEMORY_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def _compute_shard(source, bit_start, bit_end, block_function, params):
+    """
+    Calcule les statistiques d'une tranche de blocs dans un processus du pool.
+
+    Args:
+        source (PackedSequence): Séquence compacte, projetée en mémoire par le processus
+        bit_start (int): Premier bit de la tranche (début d'un bloc)
+        bit_end (int): Fin de la tranche (exclue)
+        block_function: Fonction (bits, **params) -> liste de statistiques
+        params (dict): Paramètres de la fonction de bloc
+    """
+    return block_function(source.bit_range(bit_start, bit_end).tolist(), **params)
+
+
+class BlockShardingExecutor:
+    """
+    Répartit les blocs indépendants d'un test entre les processus d'un pool.
+
+    La séquence est écrite une seule fois sous forme compacte en mémoire partagée (/dev/shm),
+    ou lue directement depuis le fichier projeté si c'est déjà une PackedSequence. Chaque processus
+    ne décode que sa tranche de blocs; les statistiques sont additionnées avant l'étape du chi-carré.
+    """
+
+    def __init__(self, executor, shards, source=None):
+        """
+        Args:
+            executor: Pool de processus utilisé pour les tranches
+            shards (int): Nombre de tranches
+            source (PackedSequence, optional): Fichier à lire directement plutôt que la liste de bits
+        """
+        self.executor = executor
+        self.shards = max(1, int(shards))
+        self.source = source if isinstance(source, PackedSequence) else None
+
+    def map_blocks(self, block_function, bit_sequence, block_length, num_blocks, /, **params):
+        """
+        Calcule block_function sur les num_blocks premiers blocs de block_length bits.
+
+        Args:
+            block_function: Fonction (bits, **params) -> liste de statistiques additives
+            bit_sequence (list[int]): Séquence complète
+            block_length (int): Taille des blocs
+            num_blocks (int): Nombre de blocs à traiter
+            **params: Paramètres transmis à block_function
+
+        Returns:
+            list: Somme terme à terme des statistiques de chaque tranche
+        """
+        shards = min(self.shards, num_blocks)
+        total_bits = num_blocks * block_length
+        if shards <= 1:
+            return block_function(bit_sequence[:total_bits], **params)
+
+        temp_path = None
+        if self.source is not None and len(self.source) >= total_bits:
+            source = self.source
+        else:
+            packed = np.packbits(np.asarray(bit_sequence[:total_bits], dtype=np.uint8))
+            fd, temp_path = tempfile.mkstemp(suffix='.bin', dir=SHARED_MEMORY_DIR)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(packed.tobytes())
+            source = PackedSequence(temp_path, total_bits)
+
+        try:
+            bounds = np.linspace(0, num_blocks, shards + 1).astype(int)
+            futures = [
+                self.executor.submit(_compute_shard, source, int(start) * block_length, int(end) * block_length,
+                                     block_function, params)
+                for start, end in zip(bounds[:-1], bounds[1:]) if end > start
+            ]
+            partials = [future.result() for future in futures]
+        finally:
+            if temp_path is not None:
+                os.unlink(temp_path)
+
+        return [sum(values) for values in zip(*partials)]
@@ -0,0 +1,302 @@
+import json
+import math
+import random
+import time
+from pathlib import Path
+
+
+def registered_test(test_name):
+    """Entrée du registre des tests (None si le test est inconnu)"""
+    # Import différé : le registre (testsuite.config) dépend lui-même de ce module
+    from testsuite.config import TEST_FUNCTIONS
+    return TEST_FUNCTIONS.get(test_name)
+
+
+class TestCostModel:
+    """
+    Modèle de coût des tests : durée estimée = a * f(n, paramètres) + b
+
+    f est la complexité du test (nombre d'opérations élémentaires à une constante près),
+    a et b sont calibrés par un benchmark sur la machine d'audit puis stockés sur le disque.
+    """
+
+    # Complexité de chaque classe de coût (déclarée par les tests dans le registre)
+    # en fonction de la longueur n et des paramètres
+    COST_CLASSES = {
+        'linear': lambda n, p: n,
+        # Seuls N blocs de M bits sont parcourus (16x8, 49x128 ou 75x10000 selon n)
+        'fixed_blocks': lambda n, p: 128 if n < 6272 else 6272 if n < 750000 else 750000,
+        # Berlekamp-Massey quadratique sur chacun des n/M blocs
+        'block_quadratic': lambda n, p: n * p['M'],
+        'patterns': lambda n, p: n * p['m'],
+        'patterns_plus_one': lambda n, p: n * (p['m'] + 1),
+        'n_log_n': lambda n, p: n * math.log2(max(n, 2)),
+        'quadratic': lambda n, p: n * n,
+    }
+
+    # Coefficients (a, b) par défaut, mesurés sur un poste de développement
+    DEFAULT_COEFFICIENTS = {
+        'frequency_monobit': (1.2e-7, 0.0),
+        'block_frequency': (1.5e-7, 0.0),
+        'runs': (1.2e-7, 0.0),
+        'longest_runs': (1.5e-6, 0.0),
+        'non_overlapping_template_matching': (4.0e-7, 0.0),
+        'binary_matrix_rank': (2.5e-7, 0.0),
+        'linear_complexity': (4.8e-8, 0.0),
+        'serial': (1.8e-6, 0.0),
+        'dft_spectral': (1.5e-8, 0.0),
+        'autocorrelation': (1.1e-8, 0.0),
+        'overlapping_template_matching': (2.6e-7, 0.0),
+        'maurer': (3.0e-7, 0.0),
+        'entropy': (4.1e-7, 0.0),
+        'cusum': (1.0e-6, 0.0),
+        'random_excursion': (1.2e-7, 0.0),
+        'random_excursion_variant': (4.0e-7, 0.0),
+        'belkamp_massey': (1.0e-7, 0.0),
+        'lcg': (1.5e-9, 0.0),
+        'gf2_linear': (4.0e-9, 0.0),
+        'repetition': (2.0e-8, 0.0),
+        'mt19937': (2.0e-9, 0.0),
+        # Tests FIPS 140-2 vectorisés sur la séquence compacte
+        'fips_monobit': (2.0e-10, 0.0),
+        'fips_poker': (1.0e-9, 0.0),
+        'fips_runs': (4.5e-9, 0.0),
+        'fips_long_run': (2.0e-9, 0.0),
+    }
+
+    # Coût d'un test inconnu du modèle (par bit)
+    FALLBACK_COEFFICIENT = 1.0e-6
+    # Tirages d'une séquence de mesure dont le résultat est une erreur, par taille
+    CALIBRATION_ATTEMPTS = 3
+
+    _cache = {}
+
+    def __init__(self, coefficients=None):
+        self.coefficients = dict(self.DEFAULT_COEFFICIENTS)
+        if coefficients:
+            self.coefficients.update({key: tuple(value) for key, value in coefficients.items()})
+
+    @classmethod
+    def load(cls, path):
+        """
+        Charge un modèle calibré depuis le disque, ou le modèle par défaut si le fichier n'existe pas
+        """
+        if path is None or not Path(path).is_file():
+            return cls()
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f).get('coefficients'))
+
+    @classmethod
+    def load_cached(cls, path):
+        """
+        Comme load(), mais ne relit le fichier que s'il a été modifié depuis le dernier appel
+        """
+        try:
+            mtime = Path(path).stat().st_mtime if path is not None else None
+        except OSError:
+            mtime = None
+        key = (str(path), mtime)
+        cached = cls._cache.get('model')
+        if cached is None or cached[0] != key:
+            cached = (key, cls.load(path))
+            cls._cache['model'] = cached
+        return cached[1]
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'coefficients': self.coefficients}, f, indent=2)
+
+    def estimate(self, test_name, n, params=None):
+        """
+        Estime la durée d'exécution d'un test en secondes
+
+        Args:
+            test_name (str): Nom du test
+            n (int): Longueur de la séquence
+            params (dict or list, optional): Paramètres passés au test, ou liste de jeux
+                de paramètres pour un balayage exécuté en une seule tâche
+        """
+        if isinstance(params, list):
+            costs = [self.estimate(test_name, n, p) for p in params]
+            entry = registered_test(test_name)
+            # Un balayage mutualisé est dominé par le calcul commun du plus grand paramètre
+            return max(costs, default=0.0) if entry is not None and entry.sweep else sum(costs)
+
+        complexity = self.complexity(test_name, n, params)
+        if complexity is None:
+            return self.FALLBACK_COEFFICIENT * n
+        a, b = self.coefficients.get(test_name, (self.FALLBACK_COEFFICIENT, 0.0))
+        return max(0.0, a * complexity + b)
+
+    def complexity(self, test_name, n, params=None):
+        """
+        Complexité d'un test selon la classe de coût déclarée dans le registre
+        (None si le test ou sa classe est inconnu)
+        """
+        entry = registered_test(test_name)
+        if entry is None or entry.cost_class not in self.COST_CLASSES:
+            return None
+        return self.COST_CLASSES[entry.cost_class](n, {**entry.defaults(), **(params or {})})
+
+    def calibrate(self, run_test, test_names, sizes=(20000, 100000, 400000), time_budget=None):
+        """
+        Mesure chaque test sur des séquences aléatoires de plusieurs tailles et ajuste (a, b)
+        par moindres carrés.
+
+        Les tailles inférieures à la longueur minimale d'un test sont ignorées, ainsi que les
+        mesures dont le résultat est une erreur : elles ne mesurent que le rejet immédiat de la
+        séquence. Une séquence aléatoire peut être inapplicable (trop peu de cycles pour les tests
+        d'excursion) : une nouvelle séquence est alors tirée, jusqu'à CALIBRATION_ATTEMPTS fois. Si aucune taille ne
+        convient, le test est mesuré à sa longueur minimale et au double. Un test sans aucune mesure
+        valide conserve ses coefficients.
+
+        Args:
+            run_test: Fonction run_test(test_name, bit_sequence)
+            test_names (list): Tests à calibrer
+            sizes (tuple): Longueurs des séquences de mesure
+            time_budget (float, optional): Durée maximale d'une mesure; les tailles suivantes sont ignorées au-delà
+        """
+        sequences = {}
+
+        for test_name in test_names:
+            if self.complexity(test_name, 1) is None:
+                continue
+
+            required = registered_test(test_name).required_length() or 0
+            test_sizes = [n for n in sizes if n >= required] or [required, 2 * required]
+
+            points = []
+            for n in test_sizes:
+                for attempt in range(self.CALIBRATION_ATTEMPTS):
+                    if attempt > 0 or n not in sequences:
+                        sequences[n] = [random.getrandbits(1) for _ in range(n)]
+                    start = time.perf_counter()
+                    result = run_test(test_name, sequences[n])
+                    duration = time.perf_counter() - start
+                    if not (isinstance(result, dict) and result.get('error')):
+                        points.append((self.complexity(test_name, n), duration))
+                        break
+                if time_budget is not None and duration > time_budget:
+                    break
+
+            if points:
+                self.coefficients[test_name] = self._fit(points)
+
+        return self
+
+    @staticmethod
+    def _fit(points):
+        """Régression linéaire duration = a * x + b, avec a > 0 et b >= 0"""
+        if len(points) == 1:
+            x, y = points[0]
+            return (y / x if x else TestCostModel.FALLBACK_COEFFICIENT, 0.0)
+
+        count = len(points)
+        mean_x = sum(x for x, _ in points) / count
+        mean_y = sum(y for _, y in points) / count
+        var_x = sum((x - mean_x) ** 2 for x, _ in points)
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+
+        a = cov / var_x if var_x else 0.0
+        b = mean_y - a * mean_x
+        if a <= 0 or b < 0:
+            # Mesures trop bruitées : on retombe sur une droite passant par l'origine
+            a = sum(x * y for x, y in points) / sum(x * x for x, _ in points)
+            b = 0.0
+        return (a, b)
+
+
+class TestScheduler:
+    """
+    Planifie l'exécution d'une batterie de tests à partir du modèle de coût :
+    ordre de soumission (le plus long d'abord), nombre de processus et durée prévue.
+    """
+
+    # Au-dessous de cette durée totale, les tests sont exécutés dans le processus courant
+    INLINE_THRESHOLD = 0.5
+    # Surcoût estimé de l'envoi d'une séquence à un processus du pool (par bit)
+    DISPATCH_COST_PER_BIT = 5.0e-8
+    # Durée minimale d'une tranche lorsqu'un test est réparti par blocs entre plusieurs processus
+    MIN_SHARD_COST = 1.0
+
+    def __init__(self, cost_model=None):
+        self.cost_model = cost_model or TestCostModel()
+
+    def plan(self, test_list, n, max_workers, params=None, shard=True):
+        """
+        Construit le plan d'exécution d'une requête
+
+        Args:
+            test_list (list): Noms des tests de chaque tâche
+            n (int): Longueur de la séquence
+            max_workers (int): Nombre maximum de processus utilisables
+            params (list, optional): Paramètres de chaque tâche, alignés sur test_list
+                (dict, ou liste de dicts pour un balayage)
+            shard (bool): Autoriser la répartition par blocs des tests décomposables
+
+        Returns:
+            dict: ordre de soumission (indices des tâches), nombre de processus,
+                tranches par tâche, coûts (alignés sur test_list) et durée prévue
+        """
+        params = params or [None] * len(test_list)
+        costs = [self.cost_model.estimate(test_name, n, task_params)
+                 for test_name, task_params in zip(test_list, params)]
+
+        # Ordonnancement LPT : les tests les plus longs sont soumis en premier
+        order = sorted(range(len(test_list)), key=lambda i: costs[i], reverse=True)
+        total = sum(costs)
+
+        workers = 1
+        shards = {}
+        predicted = total
+        if total >= self.INLINE_THRESHOLD and max_workers > 1:
+            shards = self._shards(test_list, params, costs, total, max_workers) if shard else {}
+            dispatch = self.DISPATCH_COST_PER_BIT * n
+
+            # Un test réparti en k tranches compte comme k tâches de coût c / k
+            jobs = sorted(
+                (costs[i] / shards.get(i, 1) + dispatch / shards.get(i, 1)
+                 for i in order for _ in range(shards.get(i, 1))),
+                reverse=True)
+            max_candidates = min(max_workers, len(jobs))
+            best = self._makespan(jobs, max_candidates)
+            # Plus petit nombre de processus qui atteint (à 10 % près) la meilleure durée possible
+            for candidate in range(2, max_candidates + 1):
+                makespan = self._makespan(jobs, candidate)
+                if makespan <= best * 1.1:
+                    workers, predicted = candidate, makespan
+                    break
+            if predicted >= total:
+                workers, shards, predicted = 1, {}, total
+            else:
+                shards = {i: min(k, workers) for i, k in shards.items() if min(k, workers) > 1}
+
+        return {
+            "order": order,
+            "workers": workers,
+            "shards": shards,
+            "predicted_duration": predicted,
+            "predicted_costs": costs,
+        }
+
+    def _shards(self, test_list, params, costs, total, max_workers):
+        """
+        Nombre de tranches des tâches décomposables en blocs dont la durée dépasse
+        la part équitable d'un processus
+        """
+        target = max(total / max_workers, self.MIN_SHARD_COST)
+        shards = {}
+        for i, (test_name, cost) in enumerate(zip(test_list, costs)):
+            # Seuls les tests constitués de blocs indépendants peuvent être répartis (pas les balayages)
+            entry = registered_test(test_name)
+            if entry is not None and entry.block_decomposable and not isinstance(params[i], list) and cost > target:
+                shards[i] = min(max_workers, math.ceil(cost / target))
+        return shards
+
+    @staticmethod
+    def _makespan(costs, workers):
+        """Durée totale de l'ordonnancement glouton LPT des coûts (déjà triés) sur `workers` processus"""
+        loads = [0.0] * workers
+        for cost in costs:
+            loads[loads.index(min(loads))] += cost
+        return max(loads)
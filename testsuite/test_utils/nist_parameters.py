@@ -5,6 +5,8 @@ class NistTestParameters:
     # Paramètres de décision
     DEFAULT_DECISION_RULE = 0.01
     DEFAULT_WARNING_THRESHOLD = 0.002
+    # Seuil plus strict au-dessous duquel un échec arrête une batterie en mode on_failure=stop
+    DEFAULT_FAIL_FAST_THRESHOLD = 0.0001
 
     @classmethod
     def get_decision_rule(cls, custom_rule=None):
@@ -15,3 +17,8 @@ class NistTestParameters:
     def get_warning_threshold(cls, custom_threshold=None):
         """Retourne le seuil de warning (custom ou par défaut)"""
         return custom_threshold if custom_threshold is not None else cls.DEFAULT_WARNING_THRESHOLD
+
+    @classmethod
+    def get_fail_fast_threshold(cls, custom_threshold=None):
+        """Retourne le seuil d'arrêt du mode on_failure=stop (custom ou par défaut)"""
+        return custom_threshold if custom_threshold is not None else cls.DEFAULT_FAIL_FAST_THRESHOLD
@@ -0,0 +1,106 @@
+import threading
+from pathlib import Path
+
+
+class PackedSequence:
+    """
+    Référence vers une séquence de bits stockée sous forme compacte (8 bits par octet,
+    bit de poids fort en premier) dans un fichier présent sur le serveur.
+
+    Le fichier est projeté en mémoire (np.memmap) au lieu d'être lu : les pages sont
+    partagées via le cache du système entre les requêtes et les processus de calcul.
+    Seul le chemin est transmis aux processus du pool, jamais le contenu.
+    """
+
+    # Dernier fichier décodé par ce processus : (clé, bits) (voir view)
+    _decoded = (None, None)
+    _decoded_lock = threading.Lock()
+
+    def __init__(self, path, bit_length=None):
+        self.path = str(path)
+        size = Path(self.path).stat().st_size
+        if size == 0:
+            raise ValueError("Le fichier de séquence est vide.")
+
+        max_bits = size * 8
+        if bit_length is None:
+            bit_length = max_bits
+        bit_length = int(bit_length)
+        if bit_length <= 0 or bit_length > max_bits:
+            raise ValueError(f"Longueur de séquence invalide: {bit_length} (maximum {max_bits} bits pour ce fichier)")
+
+        self.bit_length = bit_length
+
+    @staticmethod
+    def resolve_path(data_root, relative_path):
+        """
+        Résout un chemin relatif à l'intérieur de la racine de données autorisée.
+
+        Args:
+            data_root (str or Path): Racine configurée côté serveur
+            relative_path (str): Chemin fourni par le client
+
+        Returns:
+            Path: Chemin absolu du fichier
+
+        Raises:
+            ValueError: Si la racine n'est pas configurée ou si le chemin sort de la racine
+        """
+        if not data_root:
+            raise ValueError("Les références de fichiers serveur ne sont pas activées (AUDIT_DATA_ROOT).")
+
+        root = Path(data_root).resolve()
+        candidate = (root / str(relative_path)).resolve()
+
+        # resolve() suit les liens symboliques : un lien pointant hors de la racine est refusé
+        if not candidate.is_relative_to(root) or candidate == root:
+            raise ValueError("Le chemin demandé est en dehors de la racine de données autorisée.")
+        if not candidate.is_file():
+            raise ValueError(f"Fichier introuvable: {relative_path}")
+
+        return candidate
+
+    def packed(self):
+        """Retourne une vue en lecture seule (sans copie) sur les octets du fichier"""
+        # numpy n'est importé que par les processus qui lisent réellement la séquence
+        import numpy as np
+        return np.memmap(self.path, dtype=np.uint8, mode='r', shape=((self.bit_length + 7) // 8,))
+
+    def bits(self):
+        """Retourne les bits sous forme de tableau numpy de 0 et 1"""
+        import numpy as np
+        return np.unpackbits(self.packed(), count=self.bit_length)
+
+    def bit_range(self, start, end):
+        """Retourne les bits [start, end) en ne décodant que les octets correspondants"""
+        import numpy as np
+        first_byte, last_byte = start // 8, (end + 7) // 8
+        offset = start - first_byte * 8
+        return np.unpackbits(self.packed()[first_byte:last_byte])[offset:offset + end - start]
+
+    def view(self):
+        """
+        Retourne les bits décodés (1 octet par bit) sous forme de memoryview, format attendu par
+        les tests qui ne lisent pas la séquence compacte.
+
+        Les éléments et les tranches se lisent comme ceux d'une liste de 0 et de 1 (entiers Python),
+        sans construire de liste; np.asarray() sur la vue ne copie pas les données.
+
+        Le décodage est conservé par processus, identifié par (chemin, date de modification,
+        longueur) : les tâches suivantes d'un même processus sur le même fichier le réutilisent.
+        Un seul fichier décodé est conservé par processus (1 octet par bit).
+        """
+        key = (self.path, Path(self.path).stat().st_mtime_ns, self.bit_length)
+        with PackedSequence._decoded_lock:
+            if PackedSequence._decoded[0] == key:
+                return PackedSequence._decoded[1]
+            # Le décodage précédent est libéré avant d'en construire un nouveau
+            PackedSequence._decoded = (None, None)
+
+        bits = memoryview(self.bits())
+        with PackedSequence._decoded_lock:
+            PackedSequence._decoded = (key, bits)
+        return bits
+
+    def __len__(self):
+        return self.bit_length
@@ -0,0 +1,54 @@
+import numpy as np
+
+
+class PatternCounts:
+    """
+    Histogrammes des motifs de m bits (avec chevauchement, séquence circulaire),
+    indexés par la valeur entière du motif (premier bit = bit de poids fort).
+
+    L'histogramme des motifs de k < m bits se déduit de celui des motifs de m bits en sommant
+    sur les m - k derniers bits : un balayage de paramètres ne parcourt la séquence qu'une fois.
+    """
+
+    @staticmethod
+    def circular(bit_sequence, m):
+        """
+        Compte les n motifs de m bits de la séquence étendue par ses m - 1 premiers bits
+
+        Args:
+            bit_sequence (list[int] or np.ndarray): Séquence de bits
+            m (int): Longueur des motifs
+
+        Returns:
+            np.ndarray: Nombre d'occurrences de chacun des 2^m motifs
+        """
+        bits = np.asarray(bit_sequence, dtype=np.int64)
+        n = len(bits)
+        if m <= 0:
+            return np.array([n], dtype=np.int64)
+
+        extended = np.concatenate([bits, bits[:m - 1]])
+        values = np.zeros(n, dtype=np.int64)
+        for j in range(m):
+            values = (values << 1) | extended[j:j + n]
+        return np.bincount(values, minlength=2 ** m)
+
+    @staticmethod
+    def marginalize(counts, m, k):
+        """
+        Déduit l'histogramme des motifs de k bits de celui des motifs de m bits (k <= m)
+        """
+        if k >= m:
+            return counts
+        return counts.reshape(2 ** max(k, 0), 2 ** (m - max(k, 0))).sum(axis=1)
+
+    @staticmethod
+    def all_lengths(bit_sequence, max_m):
+        """
+        Histogrammes des motifs de 0 à max_m bits, calculés à partir d'un seul parcours
+
+        Returns:
+            dict: {longueur: histogramme}
+        """
+        largest = PatternCounts.circular(bit_sequence, max_m)
+        return {k: PatternCounts.marginalize(largest, max_m, k) for k in range(max_m + 1)}
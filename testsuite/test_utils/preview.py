@@ -0,0 +1,108 @@
+import math
+import random
+
+from testsuite.test_utils.cost_model import TestCostModel, registered_test
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+class PreviewSampler:
+    """
+    Échantillonnage des exécutions en mode aperçu (preview).
+
+    Chaque test est exécuté sur un échantillon de la séquence dont la longueur est choisie
+    avec le modèle de coût pour tenir dans le budget de temps, sans descendre sous la
+    longueur minimale déclarée du test. L'échantillon est formé de sous-blocs placés
+    aléatoirement, un par strate de la séquence, à partir d'une graine : la même requête
+    produit toujours le même échantillon.
+    """
+
+    # Nombre de sous-blocs d'un échantillon (une strate de la séquence par sous-bloc)
+    BLOCKS = 8
+    # Longueur maximale d'un échantillon
+    MAX_SAMPLE_BITS = 1 << 20
+
+    def __init__(self, time_budget, workers=1, cost_model=None, seed=0):
+        """
+        Args:
+            time_budget (float): Durée visée de l'aperçu (secondes)
+            workers (int): Nombre de processus entre lesquels les exécutions sont réparties
+            cost_model (TestCostModel, optional): Modèle de coût (défaut: coefficients par défaut)
+            seed (int): Graine du placement des sous-blocs
+        """
+        self.time_budget = time_budget
+        self.workers = max(1, workers)
+        self.cost_model = cost_model or TestCostModel()
+        self.seed = seed
+
+    def sample_lengths(self, runs, sequence_length):
+        """
+        Longueur de l'échantillon de chaque exécution
+
+        Args:
+            runs (list): Exécutions validées [(nom du test, paramètres)]
+            sequence_length (int): Longueur de la séquence complète
+
+        Returns:
+            list: Longueur de chaque échantillon, ou None si le test ne tient pas dans le budget
+                même à sa longueur minimale (il est alors reporté à l'exécution complète)
+        """
+        # Chaque exécution dispose d'une part du budget total des processus, au plus du budget entier
+        budget = min(self.time_budget, self.time_budget * self.workers / max(1, len(runs)))
+        return [self._sample_length(test_name, params, sequence_length, budget) for test_name, params in runs]
+
+    def _sample_length(self, test_name, params, sequence_length, budget):
+        entry = registered_test(test_name)
+        required = (entry.required_length(params) if entry is not None else None) or 1
+        upper = min(sequence_length, max(required, self.MAX_SAMPLE_BITS))
+
+        if self.cost_model.estimate(test_name, required, params) > budget:
+            return None
+        if self.cost_model.estimate(test_name, upper, params) <= budget:
+            return upper
+
+        # Recherche dichotomique de la plus grande longueur qui tient dans le budget
+        low, high = required, upper
+        while high - low > max(1, low // 100):
+            middle = (low + high) // 2
+            if self.cost_model.estimate(test_name, middle, params) <= budget:
+                low = middle
+            else:
+                high = middle
+        return low
+
+    def placement(self, sequence_length, length):
+        """
+        Position des sous-blocs d'un échantillon de `length` bits
+
+        Returns:
+            tuple: (débuts des sous-blocs, longueur d'un sous-bloc)
+        """
+        rng = random.Random(f"{self.seed}:{sequence_length}:{length}")
+        block_length = math.ceil(length / self.BLOCKS)
+        stratum = sequence_length // self.BLOCKS
+        if length * 2 > sequence_length or block_length > stratum:
+            # Échantillon trop long pour être stratifié : un seul bloc contigu
+            return [rng.randint(0, sequence_length - length)], length
+
+        return [i * stratum + rng.randint(0, stratum - block_length) for i in range(self.BLOCKS)], block_length
+
+    def sample(self, bit_sequence, length):
+        """
+        Extrait l'échantillon de `length` bits (seuls les octets échantillonnés d'une PackedSequence sont lus)
+
+        Returns:
+            list[int]: Bits de l'échantillon
+        """
+        starts, block_length = self.placement(len(bit_sequence), length)
+        sample = []
+        for start in starts:
+            if isinstance(bit_sequence, PackedSequence):
+                sample.extend(bit_sequence.bit_range(start, start + block_length).tolist())
+            else:
+                sample.extend(bit_sequence[start:start + block_length])
+        return sample[:length]
+
+    def describe(self, sequence_length, length):
+        """Informations d'échantillonnage jointes au résultat provisoire d'un test"""
+        starts, _ = self.placement(sequence_length, length)
+        return {"sample_length": length, "blocks": len(starts), "seed": self.seed}
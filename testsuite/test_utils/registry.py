@@ -0,0 +1,220 @@
+import importlib
+import itertools
+import math
+
+
+class TestEntry:
+    """
+    Entrée du registre des tests : point d'entrée importé seulement au premier appel,
+    accompagné de métadonnées déclarées (longueur minimale, paramètres, classe de coût...).
+
+    Les métadonnées permettent de lister et de valider les tests sans importer leur code.
+    """
+
+    # Nombre maximum d'exécutions produites par le balayage d'un élément de 'test_list'
+    MAX_SWEEP_SIZE = 256
+
+    def __init__(self, entry_point, name, min_length=None, params=None, cost_class='linear',
+                 precomputations=(), block_decomposable=False, sweep=None, packed_input=False):
+        """
+        Args:
+            entry_point (str): Chemin 'module:Classe.méthode' de la fonction du test
+            name (str): Nom affiché du test (identique à celui de ses réponses)
+            min_length (int or callable, optional): Longueur minimale de la séquence,
+                ou fonction (params) -> longueur minimale
+            params (dict, optional): Schéma des paramètres acceptés
+                {nom: {'type': 'int' | 'float' | 'bits', 'default': ..., 'min': ..., 'max': ...}}
+            cost_class (str): Classe de complexité utilisée par le modèle de coût
+            precomputations (tuple): Calculs préalables nécessaires au test
+            block_decomposable (bool): Le test est une somme sur des blocs indépendants
+            sweep (str, optional): Chemin 'module:Classe.méthode' d'une fonction (bits, param_sets) -> résultats
+                qui exécute un balayage de paramètres en mutualisant les calculs communs
+            packed_input (bool): Le test accepte directement une PackedSequence (lue par morceaux)
+                au lieu d'une liste de bits
+        """
+        self.entry_point = entry_point
+        self.name = name
+        self.min_length = min_length
+        self.params = params or {}
+        self.cost_class = cost_class
+        self.precomputations = tuple(precomputations)
+        self.block_decomposable = block_decomposable
+        self.sweep = sweep
+        self.packed_input = packed_input
+        self._function = None
+        self._sweep_function = None
+
+    def load(self):
+        """Importe le module du test (une seule fois) et renvoie sa fonction"""
+        if self._function is None:
+            self._function = self._resolve(self.entry_point)
+        return self._function
+
+    def load_sweep(self):
+        """Renvoie la fonction de balayage du test (None si le test n'en déclare pas)"""
+        if self._sweep_function is None and self.sweep is not None:
+            self._sweep_function = self._resolve(self.sweep)
+        return self._sweep_function
+
+    @staticmethod
+    def _resolve(entry_point):
+        module_name, attribute = entry_point.split(':')
+        target = importlib.import_module(module_name)
+        for part in attribute.split('.'):
+            target = getattr(target, part)
+        return target
+
+    def __call__(self, bit_sequence, **kwargs):
+        return self.load()(bit_sequence, **kwargs)
+
+    def __getstate__(self):
+        # La fonction importée n'est jamais sérialisée vers les processus du pool
+        state = self.__dict__.copy()
+        state['_function'] = None
+        state['_sweep_function'] = None
+        return state
+
+    def defaults(self):
+        """Valeurs par défaut des paramètres déclarés"""
+        return {key: spec['default'] for key, spec in self.params.items() if 'default' in spec}
+
+    def required_length(self, params=None):
+        """Longueur minimale de la séquence pour ces paramètres (None si non déclarée)"""
+        if callable(self.min_length):
+            return self.min_length({**self.defaults(), **(params or {})})
+        return self.min_length
+
+    def expand(self, params):
+        """
+        Développe les balayages de paramètres en jeux de paramètres individuels
+
+        Un paramètre numérique peut valoir "a..b" ou "a..b:pas" (bornes incluses, pas de 1
+        par défaut pour les entiers) ou une liste de valeurs. Plusieurs balayages produisent
+        toutes les combinaisons.
+
+        Args:
+            params (dict): Paramètres fournis par le client
+
+        Returns:
+            list[dict]: Jeux de paramètres, non encore validés
+
+        Raises:
+            ValueError: Si un balayage est mal formé ou trop grand
+        """
+        axes = []
+        for key, value in params.items():
+            spec = self.params.get(key)
+            numeric = spec is not None and spec['type'] in ('int', 'float')
+            if numeric and isinstance(value, str) and '..' in value:
+                values = self._parse_range(key, value, spec['type'])
+            elif numeric and isinstance(value, list):
+                values = value
+            else:
+                values = [value]
+            if not values:
+                raise ValueError(f"Le balayage du paramètre '{key}' est vide")
+            axes.append([(key, v) for v in values])
+
+        size = math.prod(len(axis) for axis in axes)
+        if size > self.MAX_SWEEP_SIZE:
+            raise ValueError(f"Le balayage produit {size} exécutions (maximum {self.MAX_SWEEP_SIZE})")
+        return [dict(combination) for combination in itertools.product(*axes)]
+
+    @staticmethod
+    def _parse_range(key, value, value_type):
+        """Convertit "a..b" ou "a..b:pas" en liste de valeurs"""
+        bounds, _, step = value.partition(':')
+        start, _, stop = bounds.partition('..')
+        convert = int if value_type == 'int' else float
+        try:
+            start, stop = convert(start), convert(stop)
+            step = convert(step) if step else (1 if value_type == 'int' else None)
+        except ValueError:
+            raise ValueError(f"Balayage invalide pour le paramètre '{key}': {value!r}")
+
+        if step is None:
+            raise ValueError(f"Le balayage du paramètre '{key}' doit préciser un pas (\"a..b:pas\")")
+        if step <= 0 or stop < start:
+            raise ValueError(f"Balayage invalide pour le paramètre '{key}': {value!r}")
+
+        count = int((stop - start) / step + 1e-9) + 1
+        if count > TestEntry.MAX_SWEEP_SIZE:
+            raise ValueError(f"Le balayage du paramètre '{key}' produit trop de valeurs (maximum {TestEntry.MAX_SWEEP_SIZE})")
+        if value_type == 'int':
+            return list(range(start, stop + 1, step))
+        return [round(start + i * step, 12) for i in range(count)]
+
+    def normalize_params(self, params):
+        """
+        Vérifie les paramètres selon le schéma déclaré et les convertit dans le type attendu
+
+        Args:
+            params (dict): Paramètres fournis par le client
+
+        Returns:
+            dict: Paramètres convertis
+
+        Raises:
+            ValueError: Si un paramètre est inconnu ou invalide
+        """
+        normalized = {}
+        for key, value in (params or {}).items():
+            spec = self.params.get(key)
+            if spec is None:
+                accepted = ', '.join(self.params) or 'aucun'
+                raise ValueError(f"Paramètre '{key}' inconnu pour ce test (acceptés : {accepted})")
+
+            try:
+                if spec['type'] == 'int':
+                    if isinstance(value, bool) or float(value) != int(float(value)):
+                        raise ValueError
+                    value = int(float(value))
+                elif spec['type'] == 'float':
+                    value = float(value)
+                elif spec['type'] == 'bits':
+                    value = [int(b) for b in value] if isinstance(value, (str, list, tuple)) else None
+                    if not value or any(b not in (0, 1) for b in value):
+                        raise ValueError
+            except (TypeError, ValueError):
+                raise ValueError(f"Valeur invalide pour le paramètre '{key}': {value!r}")
+
+            if 'min' in spec and value < spec['min']:
+                raise ValueError(f"Le paramètre '{key}' doit être ≥ {spec['min']}")
+            if 'max' in spec and value > spec['max']:
+                raise ValueError(f"Le paramètre '{key}' doit être ≤ {spec['max']}")
+            normalized[key] = value
+
+        return normalized
+
+    def validate(self, n, params=None):
+        """
+        Valide une exécution avant tout calcul
+
+        Args:
+            n (int): Longueur de la séquence
+            params (dict, optional): Paramètres fournis par le client
+
+        Returns:
+            dict: Paramètres convertis
+
+        Raises:
+            ValueError: Si la séquence est trop courte ou les paramètres invalides
+        """
+        params = self.normalize_params(params)
+        required = self.required_length(params)
+        if required is not None and n < required:
+            raise ValueError(f"La séquence est trop courte (minimum {required} bits requis)")
+        return params
+
+    def describe(self):
+        """Métadonnées publiques de l'entrée"""
+        return {
+            "name": self.name,
+            "min_length": self.required_length(),
+            "params": self.params,
+            "cost_class": self.cost_class,
+            "precomputations": list(self.precomputations),
+            "block_decomposable": self.block_decomposable,
+            "sweep": self.sweep is not None,
+            "packed_input": self.packed_input,
+        }
@@ -8,7 +8,9 @@ class TestStatusDeterminer:
             "success": "La séquence est aléatoire pour ce test",
             "failed": "La séquence n'est pas aléatoire pour ce test",
             "warning": "La séquence présente des résultats ambigus (proche du seuil de décision)",
-            "attack_success": "Attaque réussie : relation linéaire détectée, la séquence peut être reproduite"
+            "attack_success": "Attaque réussie : relation linéaire détectée, la séquence peut être reproduite",
+            "skipped": "Test non exécuté : la batterie a été arrêtée après un échec décisif",
+            "deferred": "Test reporté à l'exécution complète : trop coûteux pour l'aperçu"
         }
 
     @staticmethod
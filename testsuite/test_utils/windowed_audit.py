@@ -0,0 +1,215 @@
+import math
+
+import numpy as np
+from scipy.special import erf, erfc
+
+from testsuite.nist.cumulative_sums_test import CumulativeSumsTest
+from testsuite.test_utils.nist_parameters import NistTestParameters
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+class WindowedAudit:
+    """
+    Audit localisé : p-values de quelques tests sur des fenêtres fixes ou glissantes.
+
+    Les tests retenus ne dépendent que de sommes préfixes de la séquence. Un seul tableau
+    de sommes cumulées des ±1 (et un tableau du nombre de transitions) est construit par
+    segment; chaque fenêtre s'en déduit en O(1) :
+      - fréquence monobit : S[fin] - S[début]
+      - runs : nombre de 1 déduit de la somme, runs = 1 + transitions dans la fenêtre
+      - somme cumulative : excursion maximale = extrema de S sur la fenêtre moins S[début]
+        (ou S[fin] pour le sens arrière), extrema glissants calculés en O(n) (van Herk / Gil-Werman)
+
+    La séquence est traitée par segments de fenêtres consécutives : une séquence compacte
+    (PackedSequence) n'est jamais décodée en entier.
+    """
+
+    WINDOWED_TESTS = ('frequency_monobit', 'runs', 'cusum')
+    # Longueur minimale d'une fenêtre (minimum des tests de fréquence et de runs)
+    MIN_WINDOW_SIZE = 100
+    # Nombre maximum de fenêtres d'une exécution
+    MAX_WINDOWS = 1_000_000
+    # Nombre de bits décodés à la fois (hors recouvrement de la dernière fenêtre)
+    SEGMENT_BITS = 1 << 24
+    # Chiffres significatifs conservés dans les tableaux de p-values
+    SIGNIFICANT_DIGITS = 6
+    # Coût estimé par bit et par test (secondes), pour le contrôle d'admission
+    COST_PER_BIT = 2.0e-8
+
+    def __init__(self, window_size, step=None, test_list=None):
+        """
+        Args:
+            window_size (int): Longueur des fenêtres
+            step (int, optional): Décalage entre deux fenêtres (défaut: window_size, fenêtres disjointes)
+            test_list (list, optional): Sous-ensemble de WINDOWED_TESTS (défaut: tous)
+
+        Raises:
+            ValueError: Si la fenêtre, le pas ou un test n'est pas accepté
+        """
+        test_list = list(test_list or self.WINDOWED_TESTS)
+        unknown = [name for name in test_list if name not in self.WINDOWED_TESTS]
+        if unknown:
+            raise ValueError(f"Tests non disponibles en mode fenêtré: {', '.join(map(str, unknown))} "
+                             f"(acceptés : {', '.join(self.WINDOWED_TESTS)})")
+
+        try:
+            window_size = int(window_size)
+            step = window_size if step in (None, "") else int(step)
+        except (TypeError, ValueError):
+            raise ValueError("Les champs 'window_size' et 'step' doivent être des entiers.")
+        if window_size < self.MIN_WINDOW_SIZE:
+            raise ValueError(f"La fenêtre doit contenir au moins {self.MIN_WINDOW_SIZE} bits.")
+        if step <= 0:
+            raise ValueError("Le pas entre deux fenêtres doit être positif.")
+
+        self.window_size = window_size
+        self.step = step
+        self.test_list = list(dict.fromkeys(test_list))
+
+    def window_count(self, sequence_length):
+        """
+        Nombre de fenêtres complètes dans une séquence
+
+        Raises:
+            ValueError: Si la séquence est plus courte qu'une fenêtre ou produit trop de fenêtres
+        """
+        if sequence_length < self.window_size:
+            raise ValueError(f"La séquence est plus courte que la fenêtre ({self.window_size} bits).")
+        count = (sequence_length - self.window_size) // self.step + 1
+        if count > self.MAX_WINDOWS:
+            raise ValueError(f"La découpe produit {count} fenêtres (maximum {self.MAX_WINDOWS}).")
+        return count
+
+    def estimate(self, sequence_length):
+        """Coût CPU estimé (secondes) : chaque bit couvert est lu une fois par segment"""
+        covered = min(sequence_length, self.window_count(sequence_length) * self.step + self.window_size)
+        return self.COST_PER_BIT * covered * len(self.test_list)
+
+    def run(self, bit_sequence):
+        """
+        Calcule les p-values de chaque fenêtre
+
+        Args:
+            bit_sequence (list[int] or PackedSequence): Séquence de bits
+
+        Returns:
+            dict: p-values par test (une valeur par fenêtre, None si le test n'est pas applicable),
+                fenêtres en échec par test et nombre de tests en échec par fenêtre (heatmap)
+        """
+        n = len(bit_sequence)
+        count = self.window_count(n)
+        p_values = {name: [] for name in self.test_list}
+
+        per_segment = max(1, self.SEGMENT_BITS // self.step)
+        for first in range(0, count, per_segment):
+            last = min(count, first + per_segment)
+            start = first * self.step
+            bits = self._slice(bit_sequence, start, (last - 1) * self.step + self.window_size)
+            for name, values in self._segment(bits, last - first).items():
+                p_values[name].append(values)
+
+        p_values = {name: np.concatenate(values) for name, values in p_values.items()}
+        failed = {name: self._failed(values) for name, values in p_values.items()}
+
+        heatmap = np.zeros(count, dtype=np.int64)
+        for mask in failed.values():
+            heatmap += mask
+
+        return {
+            "window_size": self.window_size,
+            "step": self.step,
+            "windows": count,
+            "sequence_length": n,
+            "tests": {
+                name: {
+                    "p_values": self._compact(values),
+                    "failed_windows": np.flatnonzero(failed[name]).tolist(),
+                }
+                for name, values in p_values.items()
+            },
+            "heatmap": heatmap.tolist(),
+        }
+
+    def _segment(self, bits, count):
+        """
+        p-values des `count` fenêtres d'un segment dont le premier bit est le début de la première fenêtre
+        """
+        w = self.window_size
+        starts = np.arange(count, dtype=np.int64) * self.step
+        ends = starts + w
+
+        # Marche aléatoire des ±1 : S[i] = somme des i premiers termes
+        walk = np.zeros(len(bits) + 1, dtype=np.int64)
+        np.cumsum(2 * bits.astype(np.int64) - 1, out=walk[1:])
+        sums = walk[ends] - walk[starts]
+
+        results = {}
+        if 'frequency_monobit' in self.test_list:
+            results['frequency_monobit'] = erfc(np.abs(sums) / math.sqrt(w) / math.sqrt(2))
+
+        if 'runs' in self.test_list:
+            # transitions[i] = nombre de changements de bit entre les positions 0..i
+            transitions = np.zeros(len(bits), dtype=np.int64)
+            np.cumsum(bits[1:] != bits[:-1], out=transitions[1:])
+            runs = 1 + transitions[ends - 1] - transitions[starts]
+            pi = (sums + w) / 2 / w
+            with np.errstate(divide='ignore', invalid='ignore'):
+                statistic = np.abs(runs - 2 * w * pi * (1 - pi)) / (2 * math.sqrt(2 * w) * pi * (1 - pi))
+                p = 1 - erf(statistic)
+            # Condition préalable du test de runs : proportion de 1 proche de 0.5
+            p[np.abs(pi - 0.5) >= 2 / math.sqrt(w)] = np.nan
+            results['runs'] = p
+
+        if 'cusum' in self.test_list:
+            highest, lowest = self._window_extrema(walk, w + 1, starts)
+            forward = np.maximum(highest - walk[starts], walk[starts] - lowest)
+            backward = np.maximum(walk[ends] - lowest, highest - walk[ends])
+            results['cusum'] = np.stack([self._cusum_p_values(forward), self._cusum_p_values(backward)], axis=1)
+
+        return results
+
+    def _cusum_p_values(self, excursions):
+        """p-values de la somme cumulative, calculées une seule fois par excursion distincte"""
+        distinct, inverse = np.unique(excursions, return_inverse=True)
+        p = np.array([CumulativeSumsTest.p_value_from_excursion(int(z), self.window_size) for z in distinct])
+        return p[inverse]
+
+    @staticmethod
+    def _window_extrema(values, length, starts):
+        """
+        Maximum et minimum de values[s:s + length] pour chaque début s (algorithme de van Herk / Gil-Werman)
+
+        Les valeurs sont découpées en blocs de `length` : toute fenêtre chevauche au plus deux blocs,
+        son extremum est celui du suffixe du premier bloc et du préfixe du second.
+        """
+        padding = -len(values) % length
+        blocks = np.concatenate([values, np.repeat(values[-1:], padding)]).reshape(-1, length)
+        extrema = []
+        for extremum in (np.maximum, np.minimum):
+            prefix = extremum.accumulate(blocks, axis=1).ravel()
+            suffix = extremum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+            extrema.append(extremum(suffix[starts], prefix[starts + length - 1]))
+        return extrema
+
+    @staticmethod
+    def _slice(bit_sequence, start, end):
+        """Bits [start, end) sous forme de tableau numpy, décodés depuis le fichier pour une PackedSequence"""
+        if isinstance(bit_sequence, PackedSequence):
+            return bit_sequence.bit_range(start, end)
+        return np.asarray(bit_sequence[start:end], dtype=np.int8)
+
+    @staticmethod
+    def _failed(p_values):
+        """Fenêtres en échec, avec le seuil de TestStatusDeterminer (une p-value en échec suffit)"""
+        threshold = NistTestParameters.DEFAULT_DECISION_RULE - NistTestParameters.DEFAULT_WARNING_THRESHOLD
+        failed = np.nan_to_num(p_values, nan=1.0) <= threshold
+        return failed.any(axis=1) if failed.ndim > 1 else failed
+
+    @classmethod
+    def _compact(cls, p_values):
+        """Arrondit les p-values à SIGNIFICANT_DIGITS chiffres significatifs (None si non applicable)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            exponent = np.floor(np.log10(np.where(p_values > 0, p_values, 1.0)))
+        scale = 10.0 ** (cls.SIGNIFICANT_DIGITS - 1 - exponent)
+        rounded = np.round(p_values * scale) / scale
+        return np.where(np.isnan(rounded), None, rounded).tolist()
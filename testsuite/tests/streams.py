@@ -0,0 +1,18 @@
+import numpy as np
+
+
+def random_bits(count, seed=0):
+    """Bits aléatoires reproductibles (PCG64 de numpy, qu'aucune attaque ne reconnaît)"""
+    return np.random.default_rng(seed).integers(0, 2, count).tolist()
+
+
+def words_to_bits(words, width, byteorder, offset=0, seed=0):
+    """
+    Sorties de `width` bits écrites dans l'ordre d'octets `byteorder` (bit de poids fort
+    de chaque octet en premier), précédées de `offset` bits aléatoires
+    """
+    bits = random_bits(offset, seed)
+    for word in words:
+        for byte in int(word).to_bytes(width // 8, byteorder):
+            bits.extend((byte >> shift) & 1 for shift in range(7, -1, -1))
+    return bits
@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from testsuite.attack.gf2_linear import Gf2LinearAttack
+from testsuite.tests.streams import random_bits, words_to_bits
+
+MASK32 = 0xFFFFFFFF
+
+
+def _xorshift32(x, count):
+    """xorshift32 de Marsaglia (13, 17, 5)"""
+    outputs = []
+    for _ in range(count):
+        x ^= (x << 13) & MASK32
+        x ^= x >> 17
+        x ^= (x << 5) & MASK32
+        outputs.append(x)
+    return outputs
+
+
+def _xorshift128(x, y, z, w, count):
+    """xorshift128 de Marsaglia"""
+    outputs = []
+    for _ in range(count):
+        t = x ^ ((x << 11) & MASK32)
+        x, y, z = y, z, w
+        w = w ^ (w >> 19) ^ t ^ (t >> 8)
+        outputs.append(w)
+    return outputs
+
+
+def _well512a(state, count):
+    """WELL512a, transcription de l'implémentation de référence (Panneton, L'Ecuyer, Matsumoto)"""
+    state, index = list(state), 0
+    outputs = []
+    for _ in range(count):
+        a, c = state[index], state[(index + 13) & 15]
+        b = (a ^ c ^ (a << 16) ^ (c << 15)) & MASK32
+        c = state[(index + 9) & 15]
+        c ^= c >> 11
+        a = state[index] = b ^ c
+        d = a ^ ((a << 5) & 0xDA442D24)
+        index = (index + 15) & 15
+        a = state[index]
+        state[index] = (a ^ b ^ d ^ (a << 2) ^ (b << 18) ^ (c << 28)) & MASK32
+        outputs.append(state[index])
+    return outputs
+
+
+class Gf2LinearAttackTest(TestCase):
+
+    WORDS = 200
+
+    def _assert_recovered(self, outputs, offset, byteorder, name):
+        words, following = outputs[:self.WORDS], outputs[self.WORDS:]
+        result = Gf2LinearAttack.run_test(words_to_bits(words, 32, byteorder, offset, seed=offset))
+        info = result["additional_info"]
+        self.assertEqual(result["test_status"], 'attack_success')
+        self.assertEqual(info["Générateur"], name)
+        self.assertEqual(info["Décalage (bits)"], offset)
+        self.assertEqual(info["Ordre des octets"], byteorder)
+        self.assertEqual(info["Proportion de sorties prédites"], 1.0)
+        self.assertEqual(info["Sorties suivantes prédites"], [f"{word:08x}" for word in following])
+
+    def test_xorshift32_is_recovered_at_every_alignment(self):
+        outputs = _xorshift32(2463534242, self.WORDS + Gf2LinearAttack.PREDICTED_OUTPUTS)
+        for offset in range(32):
+            for byteorder in ('big', 'little'):
+                with self.subTest(offset=offset, byteorder=byteorder):
+                    self._assert_recovered(outputs, offset, byteorder, 'xorshift32')
+
+    def test_xorshift128_is_recovered(self):
+        outputs = _xorshift128(123456789, 362436069, 521288629, 88675123,
+                               self.WORDS + Gf2LinearAttack.PREDICTED_OUTPUTS)
+        for offset, byteorder in ((0, 'big'), (11, 'little'), (31, 'big')):
+            with self.subTest(offset=offset, byteorder=byteorder):
+                self._assert_recovered(outputs, offset, byteorder, 'xorshift128')
+
+    def test_well512a_is_recovered(self):
+        seed = [(0x9E3779B9 * (i + 1)) & MASK32 for i in range(16)]
+        outputs = _well512a(seed, self.WORDS + Gf2LinearAttack.PREDICTED_OUTPUTS)
+        for offset, byteorder in ((0, 'little'), (19, 'big'), (31, 'little')):
+            with self.subTest(offset=offset, byteorder=byteorder):
+                self._assert_recovered(outputs, offset, byteorder, 'WELL512a')
+
+    def test_random_data_is_not_recognized(self):
+        result = Gf2LinearAttack.run_test(random_bits(32 * self.WORDS, seed=1))
+        self.assertFalse(result["error"])
+        self.assertEqual(result["test_status"], 'success')
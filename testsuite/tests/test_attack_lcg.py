@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from testsuite.attack.lcg import LcgAttack
+from testsuite.tests.streams import random_bits, words_to_bits
+
+
+def _lcg(state, multiplier, increment, modulus, shift, output_bits, count):
+    """Sorties (bits shift .. shift + output_bits de l'état) d'un LCG"""
+    outputs = []
+    for _ in range(count):
+        state = (multiplier * state + increment) % modulus
+        outputs.append((state >> shift) & ((1 << output_bits) - 1))
+    return outputs
+
+
+def _ansi_c(seed, count):
+    """LCG de module 2^31 (constantes de l'exemple de rand() de la norme C), sorties complètes"""
+    return _lcg(seed, 1103515245, 12345, 1 << 31, 0, 31, count)
+
+
+def _java_random(seed, count):
+    """nextInt() de java.util.Random (graine brouillée comme le fait le constructeur)"""
+    return _lcg((seed ^ 0x5DEECE66D) & ((1 << 48) - 1), 0x5DEECE66D, 0xB, 1 << 48, 16, 32, count)
+
+
+def _msvc_rand(seed, count):
+    """rand() de MSVC (srand(seed)), 15 bits par sortie"""
+    return _lcg(seed, 214013, 2531011, 1 << 32, 16, 15, count)
+
+
+def _mmix(seed, count):
+    """LCG 64 bits de Knuth (MMIX), sorties complètes"""
+    return _lcg(seed, 6364136223846793005, 1442695040888963407, 1 << 64, 0, 64, count)
+
+
+class LcgAttackTest(TestCase):
+
+    WORDS = 64
+
+    def _assert_recovered(self, generator, width, offset, byteorder, name):
+        outputs = generator(self.WORDS + LcgAttack.PREDICTED_OUTPUTS)
+        words, following = outputs[:self.WORDS], outputs[self.WORDS:]
+        result = LcgAttack.run_test(words_to_bits(words, width, byteorder, offset, seed=offset))
+        info = result["additional_info"]
+        self.assertEqual(result["test_status"], 'attack_success')
+        self.assertEqual(info["Générateur"], name)
+        self.assertEqual(info["Décalage (bits)"], offset)
+        self.assertEqual(info["Ordre des octets"], byteorder)
+        self.assertEqual(info["Proportion de sorties prédites"], 1.0)
+        self.assertEqual([int(output, 16) for output in info["Sorties suivantes prédites"]], following)
+        return info
+
+    def test_modulus_2_31_lcg_is_recovered_at_every_alignment(self):
+        for offset in range(32):
+            for byteorder in ('big', 'little'):
+                with self.subTest(offset=offset, byteorder=byteorder):
+                    info = self._assert_recovered(lambda count: _ansi_c(42, count), 32, offset, byteorder, "LCG")
+                    self.assertEqual((info["Module"], info["Multiplicateur"], info["Incrément"]),
+                                     (1 << 31, 1103515245, 12345))
+
+    def test_java_random_is_recovered(self):
+        for offset, byteorder in ((0, 'big'), (13, 'little'), (31, 'big')):
+            with self.subTest(offset=offset, byteorder=byteorder):
+                self._assert_recovered(lambda count: _java_random(123456789, count), 32, offset, byteorder,
+                                       "java.util.Random")
+
+    def test_msvc_rand_is_recovered(self):
+        for offset, byteorder in ((0, 'little'), (7, 'big'), (15, 'little')):
+            with self.subTest(offset=offset, byteorder=byteorder):
+                self._assert_recovered(lambda count: _msvc_rand(1, count), 16, offset, byteorder, "rand() (MSVC)")
+
+    def test_64_bit_lcg_is_recovered(self):
+        for offset, byteorder in ((0, 'big'), (21, 'little'), (63, 'big')):
+            with self.subTest(offset=offset, byteorder=byteorder):
+                info = self._assert_recovered(lambda count: _mmix(2024, count), 64, offset, byteorder, "LCG")
+                self.assertEqual((info["Module"], info["Multiplicateur"]), (1 << 64, 6364136223846793005))
+
+    def test_random_data_is_not_recognized(self):
+        result = LcgAttack.run_test(random_bits(32 * 4 * self.WORDS, seed=1))
+        self.assertFalse(result["error"])
+        self.assertEqual(result["test_status"], 'success')
@@ -0,0 +1,62 @@
+import random
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+
+from testsuite.attack.mersenne_twister import MersenneTwisterAttack
+from testsuite.tests.streams import random_bits, words_to_bits
+from testsuite.test_utils.packed_sequence import PackedSequence
+
+
+def _python_random(seed, count):
+    """Sorties de 32 bits du module random de CPython (MT19937)"""
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(count)]
+
+
+class MersenneTwisterAttackTest(TestCase):
+
+    WORDS = MersenneTwisterAttack.N + MersenneTwisterAttack.VERIFY_WORDS + 40
+
+    def test_untemper_inverts_temper(self):
+        words = _python_random(1, 1000)
+        tempered = [MersenneTwisterAttack.temper(word) for word in words]
+        self.assertEqual(MersenneTwisterAttack.untemper(tempered).tolist(), words)
+
+    def test_python_random_is_recovered_at_every_alignment(self):
+        outputs = _python_random(2024, self.WORDS + MersenneTwisterAttack.PREDICTED_OUTPUTS)
+        words, following = outputs[:self.WORDS], outputs[self.WORDS:]
+        for offset in range(32):
+            for byteorder in ('big', 'little'):
+                with self.subTest(offset=offset, byteorder=byteorder):
+                    result = MersenneTwisterAttack.run_test(words_to_bits(words, 32, byteorder, offset, seed=offset))
+                    info = result["additional_info"]
+                    self.assertEqual(result["test_status"], 'attack_success')
+                    self.assertEqual(info["Décalage (bits)"], offset)
+                    self.assertEqual(info["Ordre des octets"], byteorder)
+                    self.assertEqual(info["Proportion de sorties prédites"], 1.0)
+                    self.assertEqual(info["Sorties suivantes prédites"], [f"{word:08x}" for word in following])
+
+    def test_packed_sequence_is_recovered(self):
+        outputs = _python_random(7, self.WORDS + MersenneTwisterAttack.PREDICTED_OUTPUTS)
+        bits = words_to_bits(outputs[:self.WORDS], 32, 'big', 5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "mt19937.bin"
+            path.write_bytes(np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes())
+            result = MersenneTwisterAttack.run_test(PackedSequence(path, len(bits)))
+
+        self.assertEqual(result["test_status"], 'attack_success')
+        self.assertEqual(result["additional_info"]["Décalage (bits)"], 5)
+        self.assertEqual(result["additional_info"]["Sorties suivantes prédites"],
+                         [f"{word:08x}" for word in outputs[self.WORDS:]])
+
+    def test_random_data_is_not_recognized(self):
+        result = MersenneTwisterAttack.run_test(random_bits(32 * self.WORDS, seed=1))
+        self.assertFalse(result["error"])
+        self.assertEqual(result["test_status"], 'success')
+
+    def test_short_sequence_is_an_error(self):
+        result = MersenneTwisterAttack.run_test(random_bits(32 * MersenneTwisterAttack.N))
+        self.assertTrue(result["error"])
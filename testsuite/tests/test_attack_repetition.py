@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from testsuite.attack.repetition import RepetitionAttack
+from testsuite.tests.streams import random_bits
+
+
+class RepetitionAttackTest(TestCase):
+
+    def test_period_is_found_after_every_prefix_length(self):
+        # Période non multiple de 8 : les copies successives ne sont pas alignées sur les octets
+        block = random_bits(3001, seed=1)
+        for prefix in range(32):
+            with self.subTest(prefix=prefix):
+                bits = random_bits(prefix, seed=100 + prefix) + block * 8
+                result = RepetitionAttack.run_test(bits)
+                info = result["additional_info"]
+                self.assertEqual(result["test_status"], 'attack_success')
+                self.assertEqual(info["Période (bits)"], 3001)
+                # Les derniers bits du préfixe peuvent coïncider par hasard avec la fin du bloc
+                self.assertLessEqual(info["Début de la partie périodique (bits)"], prefix)
+                self.assertEqual(info["Répétitions"], [])
+
+    def test_short_period_is_reduced_to_the_smallest(self):
+        result = RepetitionAttack.run_test(random_bits(100, seed=2) * 400)
+        self.assertEqual(result["additional_info"]["Période (bits)"], 100)
+        self.assertEqual(result["additional_info"]["Début de la partie périodique (bits)"], 0)
+
+    def test_duplicated_block_is_found_at_every_offset(self):
+        block = random_bits(5000, seed=3)
+        for shift in range(32):
+            with self.subTest(shift=shift):
+                source, copy = 4000 + shift, 30000 + 3 * shift
+                bits = random_bits(50000, seed=200 + shift)
+                bits[source:source + len(block)] = block
+                bits[copy:copy + len(block)] = block
+                result = RepetitionAttack.run_test(bits)
+                info = result["additional_info"]
+                self.assertEqual(result["test_status"], 'attack_success')
+                self.assertNotIn("Période (bits)", info)
+                repeat = info["Répétitions"][0]
+                self.assertEqual(repeat["distance"], copy - source)
+                self.assertLessEqual(repeat["position"], source)
+                self.assertGreaterEqual(repeat["position"] + repeat["longueur (bits)"], source + len(block))
+
+    def test_block_shorter_than_min_repeat_is_ignored(self):
+        bits = random_bits(50000, seed=4)
+        bits[30000:30500] = bits[1000:1500]
+        self.assertEqual(RepetitionAttack.run_test(bits, min_repeat=1024)["test_status"], 'success')
+        self.assertEqual(RepetitionAttack.run_test(bits, min_repeat=256)["test_status"], 'attack_success')
+
+    def test_random_data_is_not_recognized(self):
+        result = RepetitionAttack.run_test(random_bits(200000, seed=5))
+        self.assertFalse(result["error"])
+        self.assertEqual(result["test_status"], 'success')
+        self.assertEqual(result["additional_info"]["Répétitions"], [])
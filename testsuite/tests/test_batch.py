@@ -0,0 +1,56 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, mock
+
+import numpy as np
+
+from testsuite.config import TEST_FUNCTIONS, run_tests_batch, _pool_context
+
+
+def _packed(bits):
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes(), len(bits)
+
+
+class BatchTest(TestCase):
+
+    def test_pooled_chunks_return_every_sequence(self):
+        # Marche alternée : le test des excursions (variante) s'applique et renvoie 18 p-values
+        sequences = [_packed([0, 1] * 500000), _packed([1, 0] * 500000)]
+        with ProcessPoolExecutor(max_workers=1, mp_context=_pool_context()) as executor:
+            blocks = run_tests_batch(['random_excursion_variant', 'frequency_monobit'], sequences,
+                                     max_workers=1, executor=executor)
+
+        self.assertEqual(len(blocks), 2)
+        for block in blocks:
+            self.assertNotIn("error", block)
+            self.assertFalse(block["results"][0]["error"])
+            self.assertEqual(len(block["results"][0]["p_value"]), 18)
+
+    def test_failing_test_gives_an_error_result_and_keeps_the_others(self):
+        failing = copy.copy(TEST_FUNCTIONS['runs'])
+        failing._function = mock.Mock(side_effect=RuntimeError("échec simulé"))
+        sequences = [_packed(np.random.default_rng(seed).integers(0, 2, 20000)) for seed in range(3)]
+
+        with mock.patch.dict(TEST_FUNCTIONS, {'runs': failing}):
+            blocks = run_tests_batch(['runs', 'frequency_monobit'], sequences)
+
+        self.assertEqual(len(blocks), 3)
+        for block in blocks:
+            self.assertNotIn("error", block)
+            runs, monobit = block["results"]
+            self.assertTrue(runs["error"])
+            self.assertIn("échec simulé", runs["error_message"])
+            self.assertFalse(monobit["error"])
+            self.assertIsNotNone(monobit["p_value"])
+
+    def test_unpicklable_result_becomes_an_error_result(self):
+        unpicklable = copy.copy(TEST_FUNCTIONS['runs'])
+        unpicklable._function = mock.Mock(return_value={"error": False, "test_status": "success",
+                                                        "p_value": 0.5, "additional_info": {"f": lambda: None}})
+
+        with mock.patch.dict(TEST_FUNCTIONS, {'runs': unpicklable}):
+            blocks = run_tests_batch(['runs', 'frequency_monobit'], [_packed([0, 1] * 10000)])
+
+        runs, monobit = blocks[0]["results"]
+        self.assertTrue(runs["error"])
+        self.assertFalse(monobit["error"])
@@ -0,0 +1,34 @@
+import asyncio
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from testsuite.config import TEST_FUNCTIONS, run_task, run_tests_async, _pool_context
+
+
+class PoolResultsTest(TestCase):
+    """
+    Les résultats des tests sont renvoyés par les processus du pool : ils doivent tous être sérialisables
+    """
+
+    def test_every_registered_test_result_is_picklable(self):
+        rng = random.Random(0)
+        for test_name, entry in TEST_FUNCTIONS.items():
+            length = max(entry.required_length() or 0, 1000)
+            bit_sequence = [rng.getrandbits(1) for _ in range(length)]
+            with self.subTest(test=test_name):
+                result = run_task(test_name, bit_sequence, {})
+                self.assertEqual(pickle.loads(pickle.dumps(result))["test_status"], result["test_status"])
+
+    def test_run_tests_async_returns_results_from_the_pool(self):
+        # Marche alternée : assez de cycles pour que le test des excursions (variante) s'applique
+        bit_sequence = [0, 1] * 500000
+        with ProcessPoolExecutor(max_workers=1, mp_context=_pool_context()) as executor:
+            execution = asyncio.run(run_tests_async(['random_excursion_variant', 'frequency_monobit'],
+                                                    bit_sequence, executor))
+
+        self.assertEqual(execution["count"], 2)
+        for result in execution["results"]:
+            self.assertFalse(result["error"], result.get("message"))
+        self.assertEqual(len(execution["results"][0]["p_value"]), 18)